@@ -45,6 +45,9 @@ class QueryRequest(BaseModel):
     top_k: int = Field(5, description="검색할 부품 수", ge=1, le=20)
     category: Optional[str] = Field(None, description="특정 카테고리로 제한")
     include_context: bool = Field(False, description="검색된 원본 데이터 포함 여부")
+    filters: Optional[Dict[str, Any]] = Field(
+        None, description='메타데이터 조건 (예: {"memory_gb": {"$gte": 12}})'
+    )
 
 
 class SpecsRequest(BaseModel):
@@ -129,6 +132,13 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료 시 Gemini 비동기 클라이언트 연결 정리"""
+    if pipeline is not None:
+        await pipeline.aclose()
+
+
 # API 엔드포인트
 @app.get("/")
 async def root():
@@ -169,11 +179,12 @@ async def query_components(request: QueryRequest) -> Dict[str, Any]:
 
     try:
         logger.info(f"쿼리 요청: '{request.query}'")
-        result = pipeline.query(
+        result = await pipeline.aquery(
             user_query=request.query,
             top_k=request.top_k,
             category=request.category,
             include_context=request.include_context,
+            filters=request.filters,
         )
         return result
     except Exception as e:
@@ -200,7 +211,7 @@ async def query_by_specifications(request: SpecsRequest) -> Dict[str, Any]:
         }
 
         logger.info(f"사양 기반 쿼리: {requirements}")
-        result = pipeline.query_by_specs(
+        result = await pipeline.aquery_by_specs(
             requirements=requirements,
             top_k=request.top_k,
         )
@@ -222,7 +233,7 @@ async def compare_components(request: CompareRequest) -> Dict[str, Any]:
 
     try:
         logger.info(f"부품 비교: {len(request.component_ids)}개")
-        result = pipeline.compare_components(component_ids=request.component_ids)
+        result = await pipeline.acompare_components(component_ids=request.component_ids)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
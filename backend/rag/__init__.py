@@ -5,6 +5,7 @@ PC 부품 추천을 위한 RAG 시스템 구현
 """
 
 from .embedder import GeminiEmbedder
+from .embedders import Embedder, HashingEmbedder, SentenceTransformerEmbedder, create_embedder
 from .vector_store import PCComponentVectorStore
 from .retriever import PCComponentRetriever
 from .generator import PCRecommendationGenerator
@@ -12,6 +13,10 @@ from .pipeline import RAGPipeline
 
 __all__ = [
     "GeminiEmbedder",
+    "Embedder",
+    "HashingEmbedder",
+    "SentenceTransformerEmbedder",
+    "create_embedder",
     "PCComponentVectorStore",
     "PCComponentRetriever",
     "PCRecommendationGenerator",
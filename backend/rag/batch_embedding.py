@@ -0,0 +1,446 @@
+"""
+오프라인 배치 작업 임베딩
+
+전체 색인을 재구축할 때 동기 embed_content 호출을 수천 번 반복하는 대신,
+문서 텍스트를 JSONL 작업 파일로 쓰고 제공자의 배치 작업으로 제출한 뒤
+완료될 때까지 상태만 확인하다가 결과 벡터를 컬렉션에 적재한다.
+
+작업 디렉토리에 manifest.json을 남기므로 완료를 기다리는 중에 프로세스가 종료되어도
+같은 디렉토리로 다시 실행하면 새로 제출하지 않고 기존 작업을 이어서 기다린다.
+
+- GeminiBatchJobClient: Gemini Batch API (파일 입력 임베딩 작업)
+- LocalBatchJobClient: 같은 작업 수명 주기를 흉내 내는 로컬 대역 (테스트/오프라인용)
+"""
+import json
+import shutil
+import threading
+import time
+import uuid
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+
+import numpy as np
+from google.genai import types
+from loguru import logger
+
+from .config import (
+    BATCH_JOB_DIRECTORY,
+    BATCH_JOB_POLL_SECONDS,
+    BATCH_JOB_TIMEOUT_SECONDS,
+    EMBEDDING_MODEL,
+)
+from .embedders import Embedder
+from .gemini_client import GeminiClientPool
+from .vector_store import PCComponentVectorStore, document_id
+
+JOB_SUCCEEDED = "JOB_STATE_SUCCEEDED"
+# 더 기다려도 결과가 나오지 않는 상태
+JOB_FAILED_STATES = {
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+class BatchJobClient(Protocol):
+    """배치 작업 제출/상태 확인/결과 다운로드 인터페이스"""
+
+    backend: str
+
+    def submit(self, requests_path: Path, display_name: str) -> str: ...
+
+    def state(self, job_name: str) -> str: ...
+
+    def download(self, job_name: str, output_path: Path) -> None: ...
+
+
+class GeminiBatchJobClient:
+    """Gemini Batch API로 임베딩 작업 실행 (요청 파일 업로드 -> 작업 생성 -> 결과 파일 다운로드)"""
+
+    backend = "gemini"
+
+    def __init__(
+        self,
+        model: str = EMBEDDING_MODEL,
+        client_pool: Optional[GeminiClientPool] = None,
+    ):
+        """
+        Args:
+            model: 임베딩 모델 이름 (색인에 쓰는 GeminiEmbedder와 같아야 함)
+            client_pool: 공유 클라이언트 풀 (None이면 생성)
+        """
+        self.model = model
+        self.client_pool = client_pool or GeminiClientPool()
+
+    def submit(self, requests_path: Path, display_name: str) -> str:
+        client = self.client_pool.client
+        uploaded = client.files.upload(
+            file=str(requests_path),
+            config=types.UploadFileConfig(display_name=display_name, mime_type="jsonl"),
+        )
+        job = client.batches.create_embeddings(
+            model=self.model,
+            src=types.EmbeddingsBatchJobSource(file_name=uploaded.name),
+            config=types.CreateEmbeddingsBatchJobConfig(display_name=display_name),
+        )
+        return job.name
+
+    def state(self, job_name: str) -> str:
+        job = self.client_pool.client.batches.get(name=job_name)
+        if job.error is not None:
+            logger.warning(f"배치 작업 오류: {job.error}")
+        return getattr(job.state, "name", str(job.state))
+
+    def download(self, job_name: str, output_path: Path) -> None:
+        client = self.client_pool.client
+        job = client.batches.get(name=job_name)
+        if job.dest is None or not job.dest.file_name:
+            raise RuntimeError(f"배치 작업 결과 파일이 없습니다: {job_name}")
+        # 결과 파일이 크므로 메모리에 올리지 않고 바로 파일로 받음
+        client.files.download(file=job.dest.file_name, destination=str(output_path))
+
+
+class LocalBatchJobClient:
+    """
+    배치 작업 수명 주기를 흉내 내는 로컬 대역
+
+    제출하면 백그라운드 스레드가 요청 파일을 읽어 주어진 임베딩 생성기로 계산하고,
+    Gemini 결과 파일과 같은 형식으로 결과를 쓴다. 상태는 PENDING -> RUNNING ->
+    SUCCEEDED/FAILED 순으로 바뀐다. 작업 상태는 프로세스 메모리에만 있으므로
+    중단 후 이어서 기다리기는 지원하지 않는다.
+    """
+
+    backend = "local"
+
+    def __init__(self, embedder: Embedder, batch_size: int = 256, start_delay: float = 0.0):
+        """
+        Args:
+            embedder: 결과 벡터를 계산할 임베딩 생성기
+            batch_size: 한 번에 임베딩할 요청 수
+            start_delay: 제출 후 실행을 시작하기까지 대기 시간 (초, 대기열 흉내)
+        """
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self.start_delay = start_delay
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, requests_path: Path, display_name: str) -> str:
+        job_name = f"local-batches/{uuid.uuid4().hex[:12]}"
+        output_path = requests_path.with_name(f"{display_name}.local-output.jsonl")
+        with self._lock:
+            self._jobs[job_name] = {"state": "JOB_STATE_PENDING", "output": output_path}
+        threading.Thread(
+            target=self._run,
+            args=(job_name, requests_path, output_path),
+            name="local-batch-job",
+            daemon=True,
+        ).start()
+        return job_name
+
+    def _set_state(self, job_name: str, state: str) -> None:
+        with self._lock:
+            self._jobs[job_name]["state"] = state
+
+    def _run(self, job_name: str, requests_path: Path, output_path: Path) -> None:
+        time.sleep(self.start_delay)
+        self._set_state(job_name, "JOB_STATE_RUNNING")
+        try:
+            with open(requests_path, encoding="utf-8") as src, open(
+                output_path, "w", encoding="utf-8"
+            ) as dst:
+                while True:
+                    lines = list(islice(src, self.batch_size))
+                    if not lines:
+                        break
+                    requests = [json.loads(line) for line in lines]
+                    texts = [r["request"]["content"]["parts"][0]["text"] for r in requests]
+                    task_type = requests[0]["request"].get("task_type")
+                    embeddings, failures = self.embedder.embed_batch_with_failures(texts, task_type)
+                    errors = {failure["index"]: failure["error"] for failure in failures}
+                    for j, request in enumerate(requests):
+                        if j in errors:
+                            result = {"key": request["key"], "error": {"message": errors[j]}}
+                        else:
+                            result = {
+                                "key": request["key"],
+                                "response": {"embedding": {"values": embeddings[j].tolist()}},
+                            }
+                        dst.write(json.dumps(result) + "\n")
+        except Exception as e:
+            logger.error(f"로컬 배치 작업 실패: {str(e)}")
+            self._set_state(job_name, "JOB_STATE_FAILED")
+            return
+        self._set_state(job_name, JOB_SUCCEEDED)
+
+    def state(self, job_name: str) -> str:
+        with self._lock:
+            job = self._jobs.get(job_name)
+        if job is None:
+            raise KeyError(f"알 수 없는 로컬 배치 작업입니다: {job_name}")
+        return job["state"]
+
+    def download(self, job_name: str, output_path: Path) -> None:
+        with self._lock:
+            source = self._jobs[job_name]["output"]
+        shutil.move(str(source), str(output_path))
+
+
+class BatchEmbeddingJob:
+    """작업 파일 작성 -> 배치 작업 제출 -> 완료 대기 -> 결과 벡터를 컬렉션에 적재"""
+
+    def __init__(
+        self,
+        client: BatchJobClient,
+        job_dir: Path = BATCH_JOB_DIRECTORY,
+        poll_interval: float = BATCH_JOB_POLL_SECONDS,
+        timeout: float = BATCH_JOB_TIMEOUT_SECONDS,
+        task_type: str = "RETRIEVAL_DOCUMENT",
+        output_dimensionality: Optional[int] = None,
+    ):
+        """
+        Args:
+            client: 배치 작업 클라이언트 (GeminiBatchJobClient 또는 LocalBatchJobClient)
+            job_dir: 작업 파일/manifest 디렉토리
+            poll_interval: 작업 상태 확인 간격 (초)
+            timeout: 작업 완료 최대 대기 시간 (초)
+            task_type: 임베딩 작업 유형
+            output_dimensionality: 출력 차원 (색인 임베딩 생성기와 같아야 함)
+        """
+        self.client = client
+        self.job_dir = Path(job_dir)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.task_type = task_type
+        self.output_dimensionality = output_dimensionality
+
+        self.documents_path = self.job_dir / "documents.jsonl"
+        self.requests_path = self.job_dir / "requests.jsonl"
+        self.results_path = self.job_dir / "results.jsonl"
+        self.manifest_path = self.job_dir / "manifest.json"
+
+    def run(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        vector_store: PCComponentVectorStore,
+        batch_size: int = 500,
+        seen_ids: Optional[set] = None,
+    ) -> int:
+        """
+        문서 스트림을 배치 작업으로 임베딩해 컬렉션에 적재
+
+        작업 디렉토리에 진행 중인 작업(manifest)이 있으면 documents는 읽지 않고
+        그 작업을 이어서 기다린다. 결과는 업서트로 적재하므로 일부만 적재된 뒤
+        중단되었어도 다시 실행하면 같은 결과로 덮어쓴다.
+
+        Args:
+            documents: 문서 이터러블 (각 문서는 'text'와 'metadata' 키 포함)
+            vector_store: 결과를 적재할 벡터 데이터베이스
+            batch_size: 컬렉션 적재 배치 크기
+            seen_ids: 지정하면 작업의 모든 문서 ID를 추가 (실패한 문서 포함)
+
+        Returns:
+            적재한 문서 수 (임베딩에 실패한 문서 제외)
+        """
+        manifest = self._load_manifest()
+        if manifest is None:
+            manifest = self._submit(documents)
+        else:
+            logger.info(f"진행 중인 배치 작업을 이어서 기다립니다: {manifest['job_name']}")
+
+        self.wait(manifest["job_name"])
+        self.client.download(manifest["job_name"], self.results_path)
+        added = self.load(vector_store, batch_size, seen_ids=seen_ids)
+
+        # 적재가 끝난 작업 파일은 정리 (다음 실행은 새 작업 제출)
+        self._remove_job_files()
+        return added
+
+    def _remove_job_files(self) -> None:
+        for path in (self.manifest_path, self.documents_path, self.requests_path, self.results_path):
+            path.unlink(missing_ok=True)
+
+    def _submit(self, documents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """작업 파일 작성 후 제출하고 manifest 저장"""
+        self.job_dir.mkdir(parents=True, exist_ok=True)
+        self._remove_job_files()
+        count = self.write_job_files(documents)
+        if not count:
+            raise ValueError("생성된 문서가 없습니다.")
+
+        display_name = f"pc-components-{time.strftime('%Y%m%d-%H%M%S')}"
+        job_name = self.client.submit(self.requests_path, display_name)
+        manifest = {
+            "job_name": job_name,
+            "backend": self.client.backend,
+            "documents": count,
+            "task_type": self.task_type,
+            "output_dimensionality": self.output_dimensionality,
+            "submitted_at": time.time(),
+        }
+        self.manifest_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        logger.info(f"배치 작업 제출: {job_name} ({count:,}개 문서)")
+        return manifest
+
+    def pending(self) -> bool:
+        """이어서 기다리거나 적재할 작업(manifest)이 작업 디렉토리에 있는지 확인"""
+        return self._load_manifest() is not None
+
+    def _load_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("backend") != self.client.backend:
+            logger.warning(
+                f"다른 백엔드({manifest.get('backend')})로 제출된 작업이 있어 새로 제출합니다."
+            )
+            return None
+        return manifest
+
+    def write_job_files(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        문서 파일(ID/텍스트/메타데이터)과 배치 요청 파일을 한 줄씩 작성
+
+        Returns:
+            작성한 문서 수
+        """
+        count = 0
+        with open(self.documents_path, "w", encoding="utf-8") as docs_file, open(
+            self.requests_path, "w", encoding="utf-8"
+        ) as requests_file:
+            for index, doc in enumerate(documents):
+                doc_id = document_id(doc, index)
+                docs_file.write(
+                    json.dumps(
+                        {"id": doc_id, "text": doc["text"], "metadata": doc["metadata"]},
+                        ensure_ascii=False,
+                        default=str,
+                    )
+                    + "\n"
+                )
+                request: Dict[str, Any] = {
+                    "content": {"parts": [{"text": doc["text"]}]},
+                    "task_type": self.task_type,
+                }
+                if self.output_dimensionality:
+                    request["output_dimensionality"] = self.output_dimensionality
+                requests_file.write(
+                    json.dumps({"key": doc_id, "request": request}, ensure_ascii=False) + "\n"
+                )
+                count += 1
+        logger.info(f"배치 작업 파일 작성 완료: {count:,}개 문서 ({self.requests_path})")
+        return count
+
+    def wait(self, job_name: str) -> str:
+        """
+        작업이 끝날 때까지 poll_interval 간격으로 상태 확인
+
+        Returns:
+            최종 상태 (성공이 아니면 예외 발생)
+        """
+        deadline = time.monotonic() + self.timeout
+        last_state = None
+        while True:
+            state = self.client.state(job_name)
+            if state != last_state:
+                logger.info(f"배치 작업 상태: {state}")
+                last_state = state
+            if state == JOB_SUCCEEDED:
+                return state
+            if state in JOB_FAILED_STATES:
+                # 실패한 작업은 이어서 기다릴 수 없으므로 manifest 제거
+                self.manifest_path.unlink(missing_ok=True)
+                raise RuntimeError(f"배치 작업이 실패했습니다: {job_name} ({state})")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"배치 작업이 {self.timeout:.0f}초 안에 끝나지 않았습니다: {job_name} "
+                    f"(다시 실행하면 이어서 기다림)"
+                )
+            time.sleep(self.poll_interval)
+
+    def _index_results(self) -> Dict[str, int]:
+        """결과 파일의 키 -> 줄 시작 바이트 위치 (결과 순서는 요청 순서와 다를 수 있음)"""
+        offsets: Dict[str, int] = {}
+        with open(self.results_path, "rb") as f:
+            offset = f.tell()
+            for line in iter(f.readline, b""):
+                if line.strip():
+                    offsets[json.loads(line)["key"]] = offset
+                offset = f.tell()
+        return offsets
+
+    def load(
+        self,
+        vector_store: PCComponentVectorStore,
+        batch_size: int = 500,
+        upsert: bool = True,
+        seen_ids: Optional[set] = None,
+    ) -> int:
+        """
+        결과 파일의 벡터를 문서 순서대로 읽어 컬렉션에 적재
+
+        벡터 전체를 메모리에 올리지 않도록 결과 파일은 키별 위치만 색인하고,
+        문서 batch_size개씩 해당 줄만 읽어 float32 배열로 만든다.
+
+        Args:
+            vector_store: 결과를 적재할 벡터 데이터베이스
+            batch_size: 컬렉션 적재 배치 크기
+            upsert: True면 같은 ID의 기존 문서를 덮어씀 (중단 후 다시 적재해도 안전)
+            seen_ids: 지정하면 작업의 모든 문서 ID를 추가 (실패한 문서 포함)
+
+        Returns:
+            적재한 문서 수 (결과가 없거나 오류인 문서 제외, vector_store.failed_documents에 기록)
+        """
+        offsets = self._index_results()
+        vector_store.failed_documents = []
+        added = 0
+        with open(self.documents_path, encoding="utf-8") as docs_file, open(
+            self.results_path, "rb"
+        ) as results_file:
+            while True:
+                lines = list(islice(docs_file, batch_size))
+                if not lines:
+                    break
+                batch: List[Dict[str, Any]] = []
+                vectors: List[List[float]] = []
+                for line in lines:
+                    doc = json.loads(line)
+                    if seen_ids is not None:
+                        seen_ids.add(doc["id"])
+                    values, error = self._read_result(results_file, offsets.get(doc["id"]))
+                    if values is None:
+                        vector_store.failed_documents.append({
+                            "id": doc["id"],
+                            "category": doc["metadata"].get("category"),
+                            "error": error,
+                            "text": doc["text"][:100],
+                        })
+                        continue
+                    batch.append(doc)
+                    vectors.append(values)
+                if batch:
+                    added += vector_store.add_embedded_documents(
+                        batch, np.asarray(vectors, dtype=np.float32), upsert=upsert
+                    )
+                logger.info(f"배치 작업 결과 적재: {added:,}개")
+
+        if vector_store.failed_documents:
+            logger.warning(f"임베딩 실패로 건너뛴 문서: {len(vector_store.failed_documents)}개")
+        return added
+
+    @staticmethod
+    def _read_result(results_file: Any, offset: Optional[int]) -> Tuple[Optional[List[float]], str]:
+        """결과 한 줄에서 (벡터, 오류 메시지) 추출"""
+        if offset is None:
+            return None, "배치 작업 결과 없음"
+        results_file.seek(offset)
+        result = json.loads(results_file.readline())
+        response = result.get("response") or {}
+        embedding = response.get("embedding") or (response.get("embeddings") or [None])[0]
+        error = result.get("error")
+        if error:
+            return None, error.get("message", str(error)) if isinstance(error, dict) else str(error)
+        if not embedding or not embedding.get("values"):
+            return None, "빈 임베딩 결과"
+        return embedding["values"], ""
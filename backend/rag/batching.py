@@ -0,0 +1,77 @@
+"""
+임베딩 요청 배치 구성
+
+텍스트 개수가 아니라 추정 토큰 수 기준으로 배치를 채운다.
+짧은 문서는 한 요청에 최대 항목 수까지 모으고, 긴 문서는 요청당 토큰 상한을
+넘지 않도록 나눠 요청 수를 줄이면서 크기 초과 오류를 피한다.
+"""
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+from .config import EMBEDDING_BATCH_MAX_TOKENS
+
+
+def pack_batches(
+    token_counts: Sequence[int], max_tokens: int, max_items: int
+) -> List[Tuple[int, int]]:
+    """
+    입력 순서를 유지하며 토큰 예산과 항목 수 상한 안에서 연속 구간으로 배치 분할
+
+    한 텍스트가 혼자서 max_tokens를 넘으면 그 텍스트만으로 배치를 만든다.
+
+    Args:
+        token_counts: 텍스트별 추정 토큰 수
+        max_tokens: 요청 하나의 최대 추정 토큰 수 (0이면 제한 없음)
+        max_items: 요청 하나의 최대 텍스트 수
+
+    Returns:
+        (시작 위치, 끝 위치) 구간 리스트
+    """
+    max_items = max(1, max_items)
+    batches: List[Tuple[int, int]] = []
+    start = 0
+    tokens = 0
+    for index, count in enumerate(token_counts):
+        items = index - start
+        if items and (items >= max_items or (max_tokens and tokens + count > max_tokens)):
+            batches.append((start, index))
+            start = index
+            tokens = 0
+        tokens += count
+    if start < len(token_counts):
+        batches.append((start, len(token_counts)))
+    return batches
+
+
+class BatchStats:
+    """임베딩 요청별 항목 수 / 토큰 수 집계 (스레드 안전)"""
+
+    def __init__(self, max_tokens: int = EMBEDDING_BATCH_MAX_TOKENS):
+        """
+        Args:
+            max_tokens: 요청 하나의 토큰 예산 (채움 비율 계산 기준)
+        """
+        self.max_tokens = max_tokens
+        self.requests = 0
+        self.items = 0
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def record(self, items: int, tokens: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.items += items
+            self.tokens += tokens
+
+    def stats(self) -> Dict[str, float]:
+        """요청 수, 요청당 평균 항목/토큰 수, 토큰 예산 대비 평균 채움 비율"""
+        requests = self.requests
+        return {
+            "requests": requests,
+            "avg_items": round(self.items / requests, 2) if requests else 0.0,
+            "avg_tokens": round(self.tokens / requests, 1) if requests else 0.0,
+            "fill_ratio": (
+                round(self.tokens / (requests * self.max_tokens), 4)
+                if requests and self.max_tokens else 0.0
+            ),
+        }
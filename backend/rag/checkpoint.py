@@ -0,0 +1,184 @@
+"""
+색인 구축 체크포인트
+
+전체 재구축 중 배치 하나가 컬렉션에 저장될 때마다 그 배치의 문서 ID와
+원본 내용 해시를 JSONL 파일에 한 줄씩 덧붙이고 디스크에 동기화한다.
+구축이 중간에 실패하면 다음 실행은 컬렉션을 지우지 않고 이어서 진행하며,
+이미 같은 해시로 저장된 문서는 다시 임베딩하지 않는다.
+헤더에는 입력 소스/테이블과 함께 입력 지문(덤프 파일 크기/수정 시각)과 임베딩 설정을
+기록하여, 다시 만든 덤프나 바뀐 임베딩 설정으로는 이어서 구축하지 않는다.
+
+구축이 끝나면 체크포인트 파일을 삭제한다. 파일이 남아 있으면 중단된 구축이 있다는 뜻이다.
+"""
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .config import BUILD_CHECKPOINT_DIRECTORY
+
+# 문서 메타데이터에 기록하는 원본 내용 해시 키
+CONTENT_HASH_KEY = "content_hash"
+
+
+def content_hash(text: str, metadata: Dict[str, Any]) -> str:
+    """
+    문서 원본 내용 해시 (임베딩 텍스트 + 메타데이터, content_hash 키 제외)
+
+    Args:
+        text: 임베딩 텍스트
+        metadata: 정제된 메타데이터
+
+    Returns:
+        16진수 SHA-256 앞 32자
+    """
+    digest = hashlib.sha256()
+    digest.update(text.encode("utf-8"))
+    digest.update(b"\0")
+    fields = {k: v for k, v in metadata.items() if k != CONTENT_HASH_KEY}
+    digest.update(json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class BuildCheckpoint:
+    """컬렉션별 구축 진행 기록 (헤더 한 줄 + 저장한 배치마다 한 줄)"""
+
+    def __init__(self, collection_name: str, directory: Path = BUILD_CHECKPOINT_DIRECTORY):
+        """
+        Args:
+            collection_name: 구축 중인 컬렉션 이름 (체크포인트 파일명)
+            directory: 체크포인트 파일 디렉토리
+        """
+        self.path = Path(directory) / f"{collection_name}.jsonl"
+        # 이어서 구축할 때 이전 실행에서 저장한 문서 ID -> 내용 해시
+        self.committed: Dict[str, str] = {}
+        self.resumed = False
+
+    @staticmethod
+    def _header(
+        source_key: str,
+        tables: Optional[List[str]],
+        fingerprint: Optional[str] = None,
+        embedder: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "source": source_key,
+            "tables": sorted(tables) if tables else None,
+            "fingerprint": fingerprint,
+            "embedder": embedder,
+        }
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """체크포인트 파일 읽기 (없거나 헤더가 손상되었으면 None)"""
+        if not self.path.exists():
+            return None
+        committed: Dict[str, str] = {}
+        line = ""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                for line in f:
+                    try:
+                        committed.update(json.loads(line)["ids"])
+                    except (ValueError, KeyError):
+                        # 기록 도중 중단된 마지막 줄은 무시 (해당 배치는 다시 저장)
+                        logger.warning("체크포인트의 손상된 줄을 건너뜁니다.")
+        except (OSError, ValueError) as e:
+            logger.warning(f"구축 체크포인트를 읽지 못했습니다: {str(e)}")
+            return None
+        header["committed"] = committed
+        # 줄바꿈 없이 끝난 마지막 줄 (이어서 기록하기 전에 줄을 끝내야 함)
+        header["partial_tail"] = bool(line) and not line.endswith("\n")
+        return header
+
+    def pending(
+        self,
+        source_key: str,
+        tables: Optional[List[str]] = None,
+        fingerprint: Optional[str] = None,
+        embedder: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        같은 입력/임베딩 설정으로 중단된 구축이 있는지 확인하고, 있으면 저장 기록을 불러옴
+
+        Args:
+            source_key: 입력 소스 식별자
+            tables: 재구축 대상 테이블 (None이면 전체)
+            fingerprint: 입력 내용 지문 (덤프 파일 크기/수정 시각, 없으면 None)
+            embedder: 임베딩 백엔드/모델/차원 (embedder_signature)
+
+        Returns:
+            이어서 구축할 수 있으면 True
+        """
+        state = self._read()
+        if state is None:
+            return False
+        expected = self._header(source_key, tables, fingerprint, embedder)
+        if {k: state.get(k) for k in expected} != expected:
+            logger.warning(
+                f"다른 입력 또는 임베딩 설정으로 중단된 구축 체크포인트가 있어 무시합니다: "
+                f"source={state.get('source')}, tables={state.get('tables')}, "
+                f"fingerprint={state.get('fingerprint')}, embedder={state.get('embedder')}"
+            )
+            return False
+        if state["partial_tail"]:
+            # 중단된 줄 뒤에 바로 덧붙이면 다음 배치 기록까지 손상되므로 줄을 끝냄
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n")
+        self.committed = state["committed"]
+        self.resumed = True
+        logger.info(
+            f"중단된 구축을 이어서 진행합니다: 시작 {state.get('started_at')}, "
+            f"저장된 문서 {len(self.committed):,}개"
+        )
+        return True
+
+    def start(
+        self,
+        source_key: str,
+        tables: Optional[List[str]] = None,
+        fingerprint: Optional[str] = None,
+        embedder: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """새 구축 시작 (기존 체크포인트는 덮어씀)"""
+        self.committed = {}
+        self.resumed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            **self._header(source_key, tables, fingerprint, embedder),
+            "started_at": datetime.now().isoformat(),
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(header, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def is_committed(self, doc_id: str, doc_hash: str) -> bool:
+        """이전 실행에서 같은 내용 해시로 저장한 문서인지 확인"""
+        return self.committed.get(doc_id) == doc_hash
+
+    def commit(self, hashes: Dict[str, str]) -> None:
+        """
+        컬렉션에 저장한 배치 기록 (디스크 동기화 후 반환)
+
+        Args:
+            hashes: 문서 ID -> 내용 해시
+        """
+        if not hashes:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"ids": hashes}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def clear(self) -> None:
+        """구축 완료 후 체크포인트 삭제"""
+        self.committed = {}
+        self.resumed = False
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
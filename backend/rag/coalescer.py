@@ -0,0 +1,135 @@
+"""
+검색 쿼리 임베딩 마이크로 배칭
+
+동시에 들어오는 쿼리 임베딩 요청을 짧은 시간 창(window_ms) 동안 모으거나
+max_batch개가 모이면 한 번의 배치 호출로 보내고, 각 호출자에게 자기 벡터를 돌려준다.
+요청이 몰릴 때 API 호출 수와 초당 할당량 사용을 크게 줄인다.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .config import QUERY_COALESCE_MAX_BATCH, QUERY_COALESCE_WINDOW_MS
+
+
+class EmbeddingCoalescer:
+    """쿼리 임베딩 요청을 모아 배치로 보내는 수집기 (스레드/asyncio 공용)"""
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[Optional[np.ndarray]]],
+        window_ms: float = QUERY_COALESCE_WINDOW_MS,
+        max_batch: int = QUERY_COALESCE_MAX_BATCH,
+        max_workers: int = 4,
+    ):
+        """
+        Args:
+            embed_batch: 텍스트 리스트를 받아 같은 순서의 임베딩 리스트를 반환하는 함수
+                (실패한 텍스트 위치는 None)
+            window_ms: 첫 요청 이후 추가 요청을 기다리는 시간 (밀리초)
+            max_batch: 한 번에 보낼 최대 텍스트 수 (모이면 창이 끝나기 전에 바로 전송)
+            max_workers: 동시에 진행할 수 있는 배치 호출 수
+        """
+        self.embed_batch = embed_batch
+        self.window = window_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self.requests = 0
+        self.batches = 0
+
+        self._pending: List[Tuple[str, Future]] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="coalescer")
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, text: str) -> Future:
+        """
+        임베딩 요청 등록
+
+        Args:
+            text: 임베딩할 쿼리
+
+        Returns:
+            임베딩 벡터가 채워질 Future (asyncio에서는 asyncio.wrap_future로 대기)
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("EmbeddingCoalescer가 이미 종료되었습니다.")
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-coalescer", daemon=True
+                )
+                self._worker.start()
+            self._pending.append((text, future))
+            self.requests += 1
+            self._condition.notify()
+        return future
+
+    def _run(self) -> None:
+        """요청을 창 단위로 모아 배치 호출을 스레드 풀에 넘기는 루프"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed and not self._pending:
+                    return
+
+                # 첫 요청 이후 창이 끝나거나 max_batch개가 모일 때까지 대기
+                deadline = time.monotonic() + self.window
+                while len(self._pending) < self.max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                self.batches += 1
+
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[str, Future]]) -> None:
+        """배치 하나를 임베딩하고 각 요청의 Future에 결과 전달"""
+        # 같은 쿼리가 여러 번 들어오면 한 번만 임베딩
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            embeddings = self.embed_batch(texts)
+            if len(embeddings) != len(texts):
+                raise ValueError(
+                    f"임베딩 수가 요청 수와 다릅니다: {len(embeddings)} != {len(texts)}"
+                )
+        except Exception as e:
+            logger.error(f"쿼리 배치 임베딩 실패 ({len(texts)}개): {str(e)}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        for text, future in batch:
+            embedding = by_text[text]
+            if embedding is None:
+                future.set_exception(RuntimeError(f"쿼리 임베딩 실패: {text[:50]}"))
+            else:
+                future.set_result(embedding)
+
+    def close(self) -> None:
+        """남은 요청을 모두 보낸 뒤 종료"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+        self._executor.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, float]:
+        """요청 수 대비 실제 배치 호출 수"""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+        }
@@ -0,0 +1,142 @@
+"""
+컬럼형 레코드 테이블
+
+행마다 컬럼명을 반복하는 딕셔너리 대신, 테이블 하나가 컬럼 목록을 공유하고
+컬럼별 값 리스트를 보관한다. 행 딕셔너리는 읽을 때만 잠깐 만들어진다.
+리스트처럼 len(), 인덱싱, 순회가 가능하므로 기존 List[Dict] 자리에 그대로 쓸 수 있다.
+"""
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class _Missing:
+    """키가 없는 칸 (None 값과 구분)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class ColumnarTable(Sequence):
+    """컬럼 목록을 공유하는 컬럼형 레코드 테이블"""
+
+    def __init__(
+        self,
+        name: str,
+        columns: Optional[List[str]] = None,
+        data: Optional[List[List[Any]]] = None,
+        layouts: Optional[List[Tuple[int, ...]]] = None,
+        layout_ids: Optional[Iterable[int]] = None,
+    ):
+        """
+        Args:
+            name: 테이블명
+            columns: 컬럼명 리스트
+            data: 컬럼별 값 리스트 (columns와 같은 순서, 없는 칸은 MISSING)
+            layouts: 행별 키 순서 목록 (컬럼 인덱스 튜플)
+            layout_ids: 행별 layouts 인덱스
+        """
+        self.name = name
+        self.columns: List[str] = list(columns or [])
+        self._column_index = {column: i for i, column in enumerate(self.columns)}
+        self.data: List[List[Any]] = data if data is not None else [[] for _ in self.columns]
+        self.layouts: List[Tuple[int, ...]] = list(layouts or [])
+        self._layout_index = {layout: i for i, layout in enumerate(self.layouts)}
+        # 레코드 키 튜플 -> (레이아웃 번호, 레이아웃) 조회 캐시
+        self._key_layouts: Dict[Tuple[str, ...], Tuple[int, Tuple[int, ...]]] = {}
+        self.layout_ids = array("I", layout_ids or [])
+
+    def __len__(self) -> int:
+        return len(self.layout_ids)
+
+    def _row(self, row: int) -> Dict[str, Any]:
+        columns = self.columns
+        data = self.data
+        return {columns[ci]: data[ci][row] for ci in self.layouts[self.layout_ids[row]]}
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._row(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(len(self)):
+            yield self._row(row)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ColumnarTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable({self.name!r}, rows={len(self)}, columns={len(self.columns)})"
+
+    def _add_column(self, column: str) -> int:
+        ci = len(self.columns)
+        self.columns.append(column)
+        self._column_index[column] = ci
+        self.data.append([MISSING] * len(self))
+        return ci
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """레코드 딕셔너리 한 행 추가 (키 순서 유지)"""
+        keys = tuple(record)
+        cached = self._key_layouts.get(keys)
+        if cached is None:
+            column_index = self._column_index
+            layout = tuple(
+                column_index[key] if key in column_index else self._add_column(key)
+                for key in keys
+            )
+            layout_id = self._layout_index.get(layout)
+            if layout_id is None:
+                layout_id = len(self.layouts)
+                self.layouts.append(layout)
+                self._layout_index[layout] = layout_id
+            cached = self._key_layouts[keys] = (layout_id, layout)
+        layout_id, layout = cached
+
+        data = self.data
+        if len(layout) == len(data):
+            for ci, value in zip(layout, record.values()):
+                data[ci].append(value)
+        else:
+            present = dict(zip(layout, record.values()))
+            for ci, column_values in enumerate(data):
+                column_values.append(present.get(ci, MISSING))
+        self.layout_ids.append(layout_id)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """여러 행 추가 (다른 ColumnarTable이면 컬럼 단위로 병합)"""
+        if isinstance(records, ColumnarTable) and records.columns == self.columns:
+            remap = []
+            for layout in records.layouts:
+                layout_id = self._layout_index.get(layout)
+                if layout_id is None:
+                    layout_id = len(self.layouts)
+                    self.layouts.append(layout)
+                    self._layout_index[layout] = layout_id
+                remap.append(layout_id)
+            for column_values, other_values in zip(self.data, records.data):
+                column_values.extend(other_values)
+            self.layout_ids.extend(remap[layout_id] for layout_id in records.layout_ids)
+            return
+        for record in records:
+            self.append(record)
+
+    def column(self, name: str) -> List[Any]:
+        """컬럼 값 리스트 (없는 칸은 MISSING)"""
+        return self.data[self._column_index[name]]
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """행 딕셔너리를 batch_size개씩 만들어 반환"""
+        for start in range(0, len(self), batch_size):
+            yield self[start:start + batch_size]
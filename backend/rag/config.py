@@ -9,10 +9,8 @@ from dotenv import load_dotenv
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
-# Gemini API 설정
+# Gemini API 설정 (Gemini 임베딩/생성 모델을 만들 때 확인)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
-    raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
 
 # ChromaDB 설정
 CHROMA_PERSIST_DIRECTORY = os.getenv(
@@ -22,23 +20,134 @@ CHROMA_PERSIST_DIRECTORY = os.getenv(
 CHROMA_COLLECTION_NAME = os.getenv("CHROMA_COLLECTION_NAME", "pc_components")
 
 # 임베딩 모델 설정
+# 백엔드: gemini (Gemini API), local (sentence-transformers 로컬 모델), hashing (결정적 해싱, 테스트용)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "gemini").lower()
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "models/text-embedding-004")
 EMBEDDING_DIMENSION = int(os.getenv("EMBEDDING_DIMENSION", "768"))
+LOCAL_EMBEDDING_MODEL = os.getenv(
+    "LOCAL_EMBEDDING_MODEL", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+)
+LOCAL_EMBEDDING_DEVICE = os.getenv("LOCAL_EMBEDDING_DEVICE", "cpu")
+# 로컬 모델 출력 차원 축소 (앞쪽 차원만 남기고 재정규화, 0이면 모델 기본 차원)
+LOCAL_EMBEDDING_DIMENSION = int(os.getenv("LOCAL_EMBEDDING_DIMENSION", "0"))
+
+# 임베딩 영구 캐시 (모델/작업 유형/차원/텍스트 해시 기준, SQLite)
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_PATH = Path(os.getenv(
+    "EMBEDDING_CACHE_PATH",
+    str(PROJECT_ROOT / "backend" / "cache" / "embeddings.sqlite3")
+))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "500000"))
+
+# 검색 쿼리 임베딩 메모리 캐시 (LRU 항목 수 상한 / TTL 초)
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "2048"))
+QUERY_CACHE_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "3600"))
+
+# 동시 쿼리 임베딩 마이크로 배칭 (수집 창 밀리초 / 최대 배치 크기)
+QUERY_COALESCE_ENABLED = os.getenv("QUERY_COALESCE_ENABLED", "false").lower() == "true"
+QUERY_COALESCE_WINDOW_MS = float(os.getenv("QUERY_COALESCE_WINDOW_MS", "3"))
+QUERY_COALESCE_MAX_BATCH = int(os.getenv("QUERY_COALESCE_MAX_BATCH", "64"))
+
+# 임베딩 API 동시 요청 수 및 모델 할당량 (분당 요청 수 / 분당 토큰 수, 0이면 제한 없음)
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4"))
+EMBEDDING_RPM = int(os.getenv("EMBEDDING_RPM", "1500"))
+EMBEDDING_TPM = int(os.getenv("EMBEDDING_TPM", "1000000"))
+
+# 임베딩 요청 하나의 추정 토큰 예산 / 최대 텍스트 수 (배치는 두 상한 중 먼저 닿는 쪽에서 나눔)
+EMBEDDING_BATCH_MAX_TOKENS = int(os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "20000"))
+EMBEDDING_BATCH_MAX_ITEMS = int(os.getenv("EMBEDDING_BATCH_MAX_ITEMS", "100"))
+
+# 검색 쿼리 임베딩 전용 할당량 몫 / 동시 요청 수 (대량 색인 중에도 쿼리가 뒤에 밀리지 않도록 분리)
+EMBEDDING_QUERY_QUOTA_SHARE = float(os.getenv("EMBEDDING_QUERY_QUOTA_SHARE", "0.1"))
+EMBEDDING_QUERY_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_QUERY_MAX_CONCURRENCY", "4"))
+
+# 요청별 제한 시간 (초)
+EMBEDDING_TIMEOUT_SECONDS = float(os.getenv("EMBEDDING_TIMEOUT_SECONDS", "60"))
+EMBEDDING_QUERY_TIMEOUT_SECONDS = float(os.getenv("EMBEDDING_QUERY_TIMEOUT_SECONDS", "10"))
+
+# Gemini API HTTP 연결 풀 (임베딩/생성 모델이 공유, keep-alive로 TLS 핸드셰이크 재사용)
+GEMINI_HTTP_MAX_CONNECTIONS = int(os.getenv("GEMINI_HTTP_MAX_CONNECTIONS", "20"))
+GEMINI_HTTP_KEEPALIVE_SECONDS = float(os.getenv("GEMINI_HTTP_KEEPALIVE_SECONDS", "120"))
 
 # 생성 모델 설정
 # 기본값: gemini-2.5-pro (2025년 11월 최신 - 코딩/추론/복잡한 작업에 최적)
 # 환경변수로 변경 가능 (.env 파일에서 GENERATION_MODEL 설정)
 # 사용 가능한 모델: gemini-3-pro, gemini-2.5-pro, gemini-2.5-flash, gemini-2.5-flash-lite
 GENERATION_MODEL = os.getenv("GENERATION_MODEL", "gemini-2.5-pro")
+# 생성 모델 분당 요청 수 (0이면 제한 없음) / 동시 요청 수 / 요청별 제한 시간 (초)
+GENERATION_RPM = int(os.getenv("GENERATION_RPM", "150"))
+GENERATION_MAX_CONCURRENCY = int(os.getenv("GENERATION_MAX_CONCURRENCY", "4"))
+GENERATION_TIMEOUT_SECONDS = float(os.getenv("GENERATION_TIMEOUT_SECONDS", "120"))
 
 # RAG 설정
 TOP_K_RESULTS = int(os.getenv("TOP_K_RESULTS", "5"))
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "500"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
 
+# 적재 단계(문서 준비 / 임베딩 / ChromaDB 저장) 사이 큐에 쌓을 수 있는 최대 배치 수
+INGEST_QUEUE_DEPTH = int(os.getenv("INGEST_QUEUE_DEPTH", "2"))
+
+# 부품 문서 임베딩 텍스트 예산 (추정 토큰 수 / 값 하나의 최대 문자 수)
+DOC_MAX_TOKENS = int(os.getenv("DOC_MAX_TOKENS", "128"))
+DOC_VALUE_MAX_CHARS = int(os.getenv("DOC_VALUE_MAX_CHARS", "120"))
+
+# 임베딩 전 유사 중복 제품 병합 (정규화 제품명 + 스펙 MinHash 유사도)
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+DEDUP_THRESHOLD = float(os.getenv("DEDUP_THRESHOLD", "0.9"))
+DEDUP_NUM_PERM = int(os.getenv("DEDUP_NUM_PERM", "64"))
+# 동시에 열어 두는 정규화 제품명 버킷 수 (넘치면 오래된 버킷부터 대표 문서를 내보냄)
+DEDUP_MAX_OPEN_NAMES = int(os.getenv("DEDUP_MAX_OPEN_NAMES", "10000"))
+
 # 데이터베이스 경로
 SQL_DUMP_PATH = PROJECT_ROOT / "backend" / "data" / "pc_data_dump.sql"
 
+# SQL 덤프 파싱 프로세스 수 (1이면 순차 파싱)
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "1"))
+
+# SQL 덤프 파싱 결과 캐시 (덤프 내용 해시 기준)
+PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true"
+PARSE_CACHE_DIRECTORY = Path(os.getenv(
+    "PARSE_CACHE_DIRECTORY",
+    str(PROJECT_ROOT / "backend" / "cache" / "parsed_dump")
+))
+
+# SQL 덤프 테이블별 바이트 오프셋 인덱스 (선택 테이블 재구축용)
+DUMP_INDEX_DIRECTORY = Path(os.getenv(
+    "DUMP_INDEX_DIRECTORY",
+    str(PROJECT_ROOT / "backend" / "cache" / "dump_index")
+))
+
+# updated_at 기반 증분 동기화 상태 (소스별 테이블 하이 워터 마크)
+SYNC_STATE_PATH = Path(os.getenv(
+    "SYNC_STATE_PATH",
+    str(PROJECT_ROOT / "backend" / "cache" / "sync_state.json")
+))
+
+# 색인 구축 체크포인트 (저장한 배치의 문서 ID/내용 해시, 중단된 전체 재구축을 이어서 진행)
+BUILD_CHECKPOINT_DIRECTORY = Path(os.getenv(
+    "BUILD_CHECKPOINT_DIRECTORY",
+    str(PROJECT_ROOT / "backend" / "cache" / "build_checkpoints")
+))
+
+# 오프라인 배치 작업 임베딩 (작업 파일 디렉토리 / 상태 확인 간격 초 / 최대 대기 초)
+BATCH_JOB_DIRECTORY = Path(os.getenv(
+    "BATCH_JOB_DIRECTORY",
+    str(PROJECT_ROOT / "backend" / "cache" / "batch_jobs")
+))
+BATCH_JOB_POLL_SECONDS = float(os.getenv("BATCH_JOB_POLL_SECONDS", "30"))
+BATCH_JOB_TIMEOUT_SECONDS = float(os.getenv("BATCH_JOB_TIMEOUT_SECONDS", "86400"))
+
+# 직접 적재용 MySQL 접속 정보 (SQL 덤프 대신 DB에서 바로 읽을 때 사용)
+MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
+MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
+MYSQL_USER = os.getenv("MYSQL_USER", "root")
+MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
+MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "pc_compatibility_db")
+
+# 서버 측 커서 fetchmany 한 번에 받을 행 수
+DB_FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "1000"))
+
 # 로깅 설정
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -2,78 +2,277 @@
 SQL 데이터 파싱 및 처리 모듈
 """
 import re
-import sqlparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from loguru import logger
 
-from .config import SQL_DUMP_PATH
+from .columnar import ColumnarTable
+from .config import SQL_DUMP_PATH, PARSE_WORKERS
+from .doc_templates import TextTokenStats, estimate_tokens, render_document_text
+from .dump_index import DumpIndex
+from .parse_cache import ParsedDumpCache
+from .sql_stream import DEFAULT_CHUNK_SIZE, iter_sql_statements
+from .sql_schema import TableSchema, convert_value, parse_create_table
+from .sql_tokenizer import iter_value_tuples, parse_insert_header
+
+# 파싱 결과 형태가 바뀌면 올려서 기존 파싱 캐시를 무효화
+PARSER_VERSION = "2"
+
+# 병렬 파싱 시 작업 하나에 묶어 보낼 SQL 문 크기 (프로세스 간 전송 오버헤드 완화)
+PARSE_TASK_BYTES = 4 << 20
+
+
+def _parse_statement_batch(
+    parser: "PCDataParser", statements: List[str]
+) -> List[Tuple[Optional[str], List[Dict[str, Any]]]]:
+    """워커 프로세스에서 INSERT 문 묶음을 파싱 (pickle 가능한 모듈 레벨 함수)"""
+    return [parser._parse_insert_statement(statement) for statement in statements]
 
 
 class PCDataParser:
     """SQL 덤프 파일에서 PC 부품 정보를 추출하는 클래스"""
 
-    def __init__(self, sql_file_path: Path = SQL_DUMP_PATH):
+    def __init__(
+        self,
+        sql_file_path: Path = SQL_DUMP_PATH,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        workers: int = PARSE_WORKERS,
+        cache: Optional[ParsedDumpCache] = None,
+        tables: Optional[Iterable[str]] = None,
+    ):
         """
         Args:
             sql_file_path: SQL 덤프 파일 경로
+            chunk_size: 스트리밍 파싱 시 한 번에 읽을 바이트 수
+            workers: INSERT 문 파싱에 사용할 프로세스 수 (1이면 현재 프로세스에서 순차 파싱)
+            cache: 파싱 결과 캐시 (None이면 항상 덤프를 파싱)
+            tables: 파싱할 테이블명 (None이면 전체). 지정하면 덤프 인덱스로
+                해당 테이블의 바이트 범위만 읽는다.
         """
-        self.sql_file_path = sql_file_path
-        logger.info(f"PCDataParser 초기화: {sql_file_path}")
-
-    def parse_sql_dump(self) -> Dict[str, List[Dict[str, Any]]]:
+        self.sql_file_path = Path(sql_file_path)
+        self.chunk_size = chunk_size
+        self.workers = max(1, workers)
+        self.cache = cache
+        self.tables = list(tables) if tables else None
+        # CREATE TABLE 문에서 읽은 테이블별 스키마 (파싱 중 채워짐)
+        self.schemas: Dict[str, TableSchema] = {}
+        # 문서 텍스트 추정 토큰 수 (전체 필드 나열 방식 대비 템플릿 적용 결과)
+        self.token_stats = TextTokenStats()
+        logger.info(f"PCDataParser 초기화: {sql_file_path} (workers={self.workers})")
+
+    def parse_sql_dump(self) -> Dict[str, ColumnarTable]:
         """
         SQL 덤프 파일을 파싱하여 부품 정보 추출
 
+        레코드는 테이블별 컬럼형 구조로 보관되므로 행마다 딕셔너리를 유지하지 않는다.
+        결과는 리스트처럼 len(), 인덱싱, 순회(행 딕셔너리 반환)가 가능하다.
+
         Returns:
-            테이블별 부품 정보 딕셔너리
+            테이블별 부품 정보 딕셔너리 (테이블명 -> ColumnarTable)
         """
-        logger.info(f"SQL 파일 파싱 시작: {self.sql_file_path}")
+        tables_data: Dict[str, ColumnarTable] = {}
+        key = self._cached_key()
+        if key:
+            # 캐시 파트를 행 딕셔너리로 풀지 않고 그대로 병합
+            tables_data = self.cache.load_tables(key, tables=self.tables)
+        else:
+            for table_name, record in self.iter_records():
+                if table_name not in tables_data:
+                    tables_data[table_name] = ColumnarTable(table_name)
+                tables_data[table_name].append(record)
+
+        logger.info(f"파싱 완료: {len(tables_data)}개 테이블, 총 {sum(len(v) for v in tables_data.values())}개 레코드")
+        return tables_data
+
+    def iter_statements(self) -> Iterator[str]:
+        """
+        SQL 덤프 파일을 청크 단위로 읽으며 SQL 문을 하나씩 반환
+
+        Returns:
+            SQL 문 이터레이터
+        """
+        if not self.sql_file_path.exists():
+            raise FileNotFoundError(f"SQL 파일을 찾을 수 없습니다: {self.sql_file_path}")
+
+        if self.tables:
+            index = DumpIndex.load_or_build(self.sql_file_path)
+            logger.info(
+                f"선택 테이블 {self.tables}: {index.table_bytes(self.tables) / 1024 / 1024:.2f} MB / "
+                f"{index.table_bytes() / 1024 / 1024:.2f} MB 읽기"
+            )
+            return index.iter_statements(self.tables, chunk_size=self.chunk_size)
+
+        return iter_sql_statements(self.sql_file_path, chunk_size=self.chunk_size)
+
+    def iter_records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        SQL 덤프 파일을 스트리밍 파싱하여 레코드를 하나씩 반환
+
+        파일 전체를 메모리에 올리지 않으므로 덤프 크기와 무관하게
+        메모리 사용량이 문장 하나 크기 수준으로 유지된다.
+        캐시가 설정되어 있으면 같은 내용의 덤프는 캐시에서 읽고,
+        처음 파싱하는 덤프는 파싱하면서 캐시에 기록한다.
+
+        Returns:
+            (테이블명, 레코드) 이터레이터
+        """
+        if self.cache is None:
+            yield from self._parse_records()
+            return
+
+        key = self._cached_key()
+        if key:
+            yield from self.cache.iter_records(key, tables=self.tables)
+            return
+        key = self.cache.key_for(self.sql_file_path)
+
+        if self.tables:
+            # 일부 테이블만 파싱한 결과는 전체 덤프 캐시로 저장하지 않음
+            yield from self._parse_records()
+            return
+
+        writer = self.cache.writer(key)
+        try:
+            for table_name, record in self._parse_records():
+                writer.add(table_name, record)
+                yield table_name, record
+        except BaseException:
+            # 중간에 중단된 파싱 결과는 캐시에 남기지 않음
+            writer.abort()
+            raise
 
+        try:
+            writer.commit(self.schemas)
+        except OSError as e:
+            writer.abort()
+            logger.warning(f"파싱 캐시 저장 실패: {str(e)}")
+
+    def _cached_key(self) -> Optional[str]:
+        """
+        캐시에 파싱 결과가 있으면 스키마를 불러오고 캐시 키 반환
+
+        Returns:
+            캐시 키 (캐시가 없거나 아직 저장되지 않았으면 None)
+        """
+        if self.cache is None:
+            return None
         if not self.sql_file_path.exists():
             raise FileNotFoundError(f"SQL 파일을 찾을 수 없습니다: {self.sql_file_path}")
 
-        with open(self.sql_file_path, "r", encoding="utf-8", errors="ignore") as f:
-            sql_content = f.read()
+        key = self.cache.key_for(self.sql_file_path)
+        if not self.cache.has(key):
+            return None
+        logger.info(f"파싱 캐시 사용: {key}")
+        self.schemas.update(self.cache.load_schemas(key))
+        return key
 
-        # MySQL 특수 주석 제거
-        sql_content = re.sub(r'/\*!.*?\*/', '', sql_content, flags=re.DOTALL)
-        
-        # LOCK TABLES, UNLOCK TABLES 제거
-        sql_content = re.sub(r'LOCK TABLES.*?;', '', sql_content, flags=re.IGNORECASE)
-        sql_content = re.sub(r'UNLOCK TABLES;', '', sql_content, flags=re.IGNORECASE)
+    def _parse_records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """SQL 덤프를 실제로 파싱하여 (테이블명, 레코드)를 하나씩 반환"""
+        logger.info(f"SQL 파일 파싱 시작: {self.sql_file_path}")
 
-        # SQL 문 파싱
-        statements = sqlparse.split(sql_content)
-        tables_data = {}
-        
+        statements = self.iter_statements()
         insert_count = 0
         failed_count = 0
 
-        for i, statement in enumerate(statements):
-            if not statement.strip():
-                continue
+        for i, head, table_name, records in self._iter_parsed_inserts(statements):
+            insert_count += 1
+            if table_name and records:
+                logger.debug(f"테이블 '{table_name}': {len(records)}개 레코드 파싱 성공")
+                for record in records:
+                    yield table_name, record
+            elif table_name:
+                failed_count += 1
+                logger.debug(f"테이블 '{table_name}': 레코드 파싱 실패 (statement {i})")
+            else:
+                failed_count += 1
+                logger.debug(f"INSERT 문 파싱 실패 (statement {i}): {head}...")
+
+        logger.info(f"INSERT 문 발견: {insert_count}개, 성공: {insert_count - failed_count}개, 실패: {failed_count}개")
+
+    def _iter_parsed_inserts(
+        self, statements: Iterable[str]
+    ) -> Iterator[Tuple[int, str, Optional[str], List[Dict[str, Any]]]]:
+        """
+        INSERT 문만 골라 파싱 (workers > 1이면 프로세스 풀 사용)
 
-            # INSERT 문 파싱
-            statement_upper = statement.strip().upper()
-            if statement_upper.startswith("INSERT INTO") or "INSERT INTO" in statement_upper[:100]:
-                insert_count += 1
+        병렬 모드에서도 결과는 문장 순서대로 반환되므로 순차 파싱과 출력이 동일하다.
+        동시에 처리 중인 작업 수를 workers * 2로 제한해 메모리 사용량을 유지한다.
+
+        Args:
+            statements: SQL 문 이터러블
+
+        Returns:
+            (문장 번호, 문장 앞부분, 테이블명, 레코드 리스트) 이터레이터
+        """
+        inserts = self._iter_insert_statements(statements)
+
+        if self.workers <= 1:
+            for i, statement in inserts:
                 table_name, records = self._parse_insert_statement(statement)
-                if table_name and records:
-                    if table_name not in tables_data:
-                        tables_data[table_name] = []
-                    tables_data[table_name].extend(records)
-                    logger.debug(f"테이블 '{table_name}': {len(records)}개 레코드 파싱 성공")
-                elif table_name:
-                    failed_count += 1
-                    logger.debug(f"테이블 '{table_name}': 레코드 파싱 실패 (statement {i})")
-                else:
-                    failed_count += 1
-                    logger.debug(f"INSERT 문 파싱 실패 (statement {i}): {statement[:200]}...")
+                yield i, statement[:200], table_name, records
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for batch in self._batch_statements(inserts):
+                future = executor.submit(
+                    _parse_statement_batch, self, [statement for _, statement in batch]
+                )
+                # 부모 프로세스에는 로그용 정보만 유지
+                pending.append(([(i, statement[:200]) for i, statement in batch], future))
+
+                if len(pending) >= self.workers * 2:
+                    yield from self._merge_batch_results(*pending.popleft())
+
+            while pending:
+                yield from self._merge_batch_results(*pending.popleft())
+
+    def _iter_insert_statements(
+        self, statements: Iterable[str]
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        INSERT 문만 골라 반환하면서 CREATE TABLE 문은 스키마로 등록
 
-        logger.info(f"파싱 완료: {len(tables_data)}개 테이블, 총 {sum(len(v) for v in tables_data.values())}개 레코드")
-        logger.info(f"INSERT 문 발견: {insert_count}개, 성공: {insert_count - failed_count}개, 실패: {failed_count}개")
-        return tables_data
+        덤프에서 CREATE TABLE은 해당 테이블의 INSERT보다 앞에 오므로,
+        INSERT 문이 파싱(또는 워커로 전송)될 때는 이미 스키마가 등록되어 있다.
+        """
+        for i, statement in enumerate(statements):
+            head = statement[:100].upper()
+            if "INSERT INTO" in head:
+                yield i, statement
+            elif "CREATE TABLE" in head:
+                schema = parse_create_table(statement)
+                if schema:
+                    self.schemas[schema.name] = schema
+                    logger.debug(
+                        f"스키마 등록: {schema.name} ({len(schema.columns)}개 컬럼, "
+                        f"PK={schema.primary_key})"
+                    )
+
+    @staticmethod
+    def _batch_statements(
+        inserts: Iterable[Tuple[int, str]]
+    ) -> Iterator[List[Tuple[int, str]]]:
+        """INSERT 문을 PARSE_TASK_BYTES 크기 단위의 작업 묶음으로 그룹화"""
+        batch = []
+        batch_size = 0
+        for item in inserts:
+            batch.append(item)
+            batch_size += len(item[1])
+            if batch_size >= PARSE_TASK_BYTES:
+                yield batch
+                batch = []
+                batch_size = 0
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _merge_batch_results(meta, future):
+        """워커 결과를 원래 문장 순서대로 펼치기"""
+        for (i, head), (table_name, records) in zip(meta, future.result()):
+            yield i, head, table_name, records
 
     def _parse_insert_statement(
         self, statement: str
@@ -88,89 +287,36 @@ class PCDataParser:
             (테이블명, 레코드 리스트)
         """
         try:
-            # MySQL 특수 주석 제거
-            statement = re.sub(r'/\*!.*?\*/', '', statement, flags=re.DOTALL)
-            
+            # MySQL 특수 주석 제거 (스트리밍 분할기를 거친 문장에는 이미 없음)
+            if "/*!" in statement:
+                statement = re.sub(r'/\*!.*?\*/', '', statement, flags=re.DOTALL)
+
             # 테이블명 추출 (두 가지 형식 지원)
             # 형식 1: INSERT INTO table (col1, col2) VALUES
-            table_match_with_cols = re.search(
-                r"INSERT INTO\s+`?(\w+)`?\s*\(([^)]+)\)\s*VALUES", 
-                statement, 
-                re.IGNORECASE
-            )
-            
-            # 형식 2: INSERT INTO table VALUES (MySQL 덤프 스타일)
-            table_match_no_cols = re.search(
-                r"INSERT INTO\s+`?(\w+)`?\s+VALUES",
-                statement,
-                re.IGNORECASE
-            )
-            
-            table_name = None
-            columns = None
-            
-            if table_match_with_cols:
-                # 컬럼명이 있는 경우
-                table_name = table_match_with_cols.group(1)
-                columns = [col.strip().strip("`") for col in table_match_with_cols.group(2).split(",")]
-            elif table_match_no_cols:
-                # 컬럼명이 없는 경우 (MySQL 덤프 스타일)
-                table_name = table_match_no_cols.group(1)
-                # 컬럼명 없이 인덱스 기반 저장
-                columns = None
-            else:
+            # 형식 2: INSERT INTO table VALUES (MySQL 덤프 스타일, 컬럼명 없음)
+            table_name, columns, values_pos = parse_insert_header(statement)
+            if not table_name:
                 return None, []
 
-            # VALUES 절 추출
-            values_match = re.search(r"VALUES\s*(.+);?\s*$", statement, re.IGNORECASE | re.DOTALL)
-            if not values_match:
-                return table_name, []
-
-            values_str = values_match.group(1)
+            # CREATE TABLE 스키마가 있으면 실제 컬럼명과 타입 사용
+            kinds = None
+            schema = self.schemas.get(table_name)
+            if schema:
+                if columns:
+                    kind_map = schema.kind_map()
+                    kinds = [kind_map.get(col, "str") for col in columns]
+                else:
+                    columns, kinds = schema.columns, schema.kinds
 
-            # 각 레코드 파싱 - 중첩 괄호 처리 개선
             records = []
-            
-            # 괄호 기반 값 그룹 추출 (중첩 괄호 고려)
-            pattern = r'\(([^()]*(?:\([^()]*\)[^()]*)*)\)'
-            value_groups = re.findall(pattern, values_str)
-            
-            for idx, value_group in enumerate(value_groups):
-                try:
-                    # 값들을 파싱 (쉼표로 구분, 문자열 내부 쉼표는 무시)
-                    values = self._split_values(value_group)
-                    
-                    if columns:
-                        # 컬럼명이 있는 경우
-                        if len(values) == len(columns):
-                            record = {}
-                            for col, val in zip(columns, values):
-                                # 값 정제
-                                val = val.strip().strip("'\"")
-                                if val.upper() == "NULL" or val == "":
-                                    val = None
-                                record[col] = val
-                            records.append(record)
-                        else:
-                            logger.debug(f"컬럼 수 불일치: {len(columns)} vs {len(values)} - {table_name}")
-                    else:
-                        # 컬럼명이 없는 경우 - 인덱스 기반 저장
-                        record = {}
-                        for i, val in enumerate(values):
-                            val = val.strip().strip("'\"")
-                            if val.upper() == "NULL" or val == "":
-                                val = None
-                            # field_0, field_1, ... 형식으로 저장
-                            record[f"field_{i}"] = val
-                        
-                        # 첫 몇 개 필드를 주요 속성으로 간주
-                        if len(values) > 1:
-                            record["name"] = record.get("field_1", "Unknown")  # 보통 두 번째 필드가 이름
+            try:
+                for values in iter_value_tuples(statement, values_pos):
+                    record = self._build_record(table_name, columns, kinds, values)
+                    if record is not None:
                         records.append(record)
-                        
-                except Exception as e:
-                    logger.debug(f"레코드 파싱 오류: {str(e)}")
-                    continue
+            except ValueError as e:
+                # 문법 오류 이전까지 파싱된 레코드는 유지
+                logger.debug(f"VALUES 토큰화 오류 ({table_name}): {str(e)}")
 
             return table_name, records
 
@@ -178,45 +324,56 @@ class PCDataParser:
             logger.warning(f"INSERT 문 파싱 중 오류: {str(e)}")
             return None, []
 
-    def _split_values(self, value_string: str) -> List[str]:
+    def _build_record(
+        self,
+        table_name: str,
+        columns: Optional[List[str]],
+        kinds: Optional[List[str]],
+        values: List[Any],
+    ) -> Optional[Dict[str, Any]]:
         """
-        쉼표로 구분된 값들을 분리 (문자열 내부 쉼표는 무시)
+        토큰화된 값 리스트를 레코드 딕셔너리로 변환
 
         Args:
-            value_string: 값 문자열
+            table_name: 테이블명
+            columns: INSERT 문에 명시된 컬럼 또는 스키마의 컬럼 리스트 (없으면 None)
+            kinds: 컬럼별 값 종류 (스키마가 없으면 None, 변환하지 않음)
+            values: 튜플 하나의 값 리스트
 
         Returns:
-            값 리스트
+            레코드 딕셔너리 (컬럼 수가 맞지 않으면 None)
         """
-        values = []
-        current_value = ""
-        in_quotes = False
-        quote_char = None
-
-        for char in value_string:
-            if char in ("'", '"') and (not in_quotes or char == quote_char):
-                in_quotes = not in_quotes
-                quote_char = char if in_quotes else None
-                current_value += char
-            elif char == "," and not in_quotes:
-                values.append(current_value.strip())
-                current_value = ""
-            else:
-                current_value += char
-
-        if current_value:
-            values.append(current_value.strip())
-
-        return values
+        # 빈 문자열은 NULL과 동일하게 취급
+        values = [None if val == "" else val for val in values]
+
+        if columns:
+            # 컬럼명이 있는 경우
+            if len(values) != len(columns):
+                logger.debug(f"컬럼 수 불일치: {len(columns)} vs {len(values)} - {table_name}")
+                return None
+            if kinds:
+                return {
+                    col: convert_value(kind, val)
+                    for col, kind, val in zip(columns, kinds, values)
+                }
+            return dict(zip(columns, values))
+
+        # 스키마도 컬럼명도 없는 경우 - field_0, field_1, ... 형식으로 인덱스 기반 저장
+        record = {f"field_{i}": val for i, val in enumerate(values)}
+
+        # 첫 몇 개 필드를 주요 속성으로 간주
+        if len(values) > 1:
+            record["name"] = record.get("field_1", "Unknown")  # 보통 두 번째 필드가 이름
+        return record
 
     def create_component_documents(
-        self, tables_data: Dict[str, List[Dict[str, Any]]]
+        self, tables_data: Dict[str, Iterable[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """
         부품 데이터를 문서 형태로 변환 (RAG용)
 
         Args:
-            tables_data: 테이블별 부품 정보
+            tables_data: 테이블별 부품 정보 (레코드 리스트 또는 ColumnarTable)
 
         Returns:
             문서 리스트 (각 문서는 부품 하나를 나타냄)
@@ -225,15 +382,33 @@ class PCDataParser:
 
         for table_name, records in tables_data.items():
             logger.info(f"{table_name} 테이블 처리 중: {len(records)}개 레코드")
-
-            for record in records:
-                doc = self._create_document_from_record(table_name, record)
-                if doc:
-                    documents.append(doc)
+            documents.extend(
+                self.iter_component_documents((table_name, record) for record in records)
+            )
 
         logger.info(f"총 {len(documents)}개의 문서 생성 완료")
         return documents
 
+    def iter_component_documents(
+        self, records: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        (테이블명, 레코드) 스트림을 문서 스트림으로 변환
+
+        iter_records()와 연결하면 덤프 뒷부분을 읽는 동안에도
+        앞 테이블의 문서를 바로 다음 단계(임베딩/저장)로 넘길 수 있다.
+
+        Args:
+            records: (테이블명, 레코드) 이터러블
+
+        Returns:
+            문서 이터레이터
+        """
+        for table_name, record in records:
+            doc = self._create_document_from_record(table_name, record)
+            if doc:
+                yield doc
+
     def _create_document_from_record(
         self, table_name: str, record: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -256,25 +431,42 @@ class PCDataParser:
                 or "Unknown"
             )
 
-            # 텍스트 설명 생성 (검색용)
-            text_parts = [f"카테고리: {table_name}", f"제품명: {name}"]
-
-            # 주요 스펙 추가
-            for key, value in record.items():
-                if value and key not in ["id", "created_at", "updated_at"]:
-                    text_parts.append(f"{key}: {value}")
+            schema = self.schemas.get(table_name)
+            primary_key = schema.primary_key if schema else None
+            excluded_keys = {"id", "created_at", "updated_at", primary_key}
 
-            text = "\n".join(text_parts)
-
-            # 메타데이터
+            # 메타데이터 (ChromaDB가 받는 타입으로 바로 정제하여 재복사 방지)
             metadata = {
                 "category": table_name,
-                "name": name,
+                "name": name if isinstance(name, (bool, int, float, str)) else str(name),
                 "source": "sql_database",
-                **record,
             }
 
-            return {"text": text, "metadata": metadata}
+            # 템플릿 적용 전 방식(모든 필드 나열)의 토큰 수도 함께 집계
+            tokens_before = estimate_tokens(f"카테고리: {table_name}\n제품명: {name}")
+            for key, value in record.items():
+                if value is None or value == "":
+                    metadata.pop(key, None)
+                    if value is None:
+                        continue
+                elif isinstance(value, (bool, int, float, str)):
+                    metadata[key] = value
+                else:
+                    metadata[key] = str(value)
+                if key not in excluded_keys:
+                    tokens_before += estimate_tokens(f"{key}: {value}") + 1
+
+            # 텍스트 설명 생성 (검색용, 카테고리별 템플릿 + 토큰 예산)
+            text = render_document_text(table_name, name, record, excluded_keys)
+            self.token_stats.add(tokens_before, estimate_tokens(text))
+
+            doc = {"text": text, "metadata": metadata}
+
+            # 기본 키가 있으면 재구축 후에도 변하지 않는 문서 ID 사용
+            if primary_key and record.get(primary_key) is not None:
+                doc["id"] = f"{table_name}_{record[primary_key]}"
+
+            return doc
 
         except Exception as e:
             logger.warning(f"문서 생성 실패: {table_name}, {str(e)}")
@@ -0,0 +1,245 @@
+"""
+데이터베이스 직접 적재 소스
+
+SQL 덤프 파일 대신 MySQL 호환 DB에서 부품 테이블을 바로 읽는다.
+MySQL은 서버 측 커서(SSCursor)로 결과를 버퍼링하지 않고 fetchmany로 나눠 받으므로
+테이블 크기와 무관하게 메모리에는 fetch_size 행만 올라온다.
+로컬 테스트용으로 sqlite3 연결(DB-API)도 그대로 받을 수 있다.
+"""
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from .config import (
+    DB_FETCH_SIZE,
+    MYSQL_DATABASE,
+    MYSQL_HOST,
+    MYSQL_PASSWORD,
+    MYSQL_PORT,
+    MYSQL_USER,
+)
+from .sql_schema import TableSchema, convert_value, parse_create_table
+
+
+def _quote(identifier: str) -> str:
+    """테이블/컬럼명 인용 (MySQL, SQLite 모두 백틱 지원)"""
+    return "`" + identifier.replace("`", "``") + "`"
+
+
+class DatabaseSource:
+    """MySQL 호환 DB(또는 SQLite)에서 부품 레코드를 스트리밍으로 읽는 소스"""
+
+    def __init__(
+        self,
+        connection: Any = None,
+        tables: Optional[Iterable[str]] = None,
+        fetch_size: int = DB_FETCH_SIZE,
+        **connect_kwargs: Any,
+    ):
+        """
+        Args:
+            connection: 이미 열린 DB-API 연결 (pymysql 또는 sqlite3). None이면 설정값으로 MySQL 접속
+            tables: 읽을 테이블명 (None이면 DB의 전체 테이블)
+            fetch_size: fetchmany 한 번에 받을 행 수
+            connect_kwargs: pymysql.connect에 넘길 접속 옵션 (설정값 덮어쓰기)
+        """
+        self._connection = connection
+        self._owns_connection = connection is None
+        self.connect_kwargs = connect_kwargs
+        self.tables = list(tables) if tables else None
+        self.fetch_size = max(1, fetch_size)
+        # 테이블별 스키마 (읽는 중 채워지며 문서 ID 생성에 사용)
+        self.schemas: Dict[str, TableSchema] = {}
+
+    @property
+    def connection(self) -> Any:
+        if self._connection is None:
+            self._connection = self._connect()
+        return self._connection
+
+    @property
+    def is_sqlite(self) -> bool:
+        return isinstance(self.connection, sqlite3.Connection)
+
+    @property
+    def source_key(self) -> str:
+        """동기화 상태 저장에 쓰는 소스 식별자"""
+        if self.is_sqlite:
+            cursor = self.connection.execute("PRAGMA database_list")
+            try:
+                path = next((row[2] for row in cursor if row[1] == "main"), "") or ":memory:"
+            finally:
+                cursor.close()
+            return f"sqlite://{path}"
+        options = {"host": MYSQL_HOST, "port": MYSQL_PORT, "database": MYSQL_DATABASE}
+        options.update(self.connect_kwargs)
+        return f"mysql://{options['host']}:{options['port']}/{options['database']}"
+
+    def _connect(self) -> Any:
+        """설정값으로 MySQL 접속"""
+        import pymysql
+
+        options = {
+            "host": MYSQL_HOST,
+            "port": MYSQL_PORT,
+            "user": MYSQL_USER,
+            "password": MYSQL_PASSWORD,
+            "database": MYSQL_DATABASE,
+            "charset": "utf8mb4",
+        }
+        options.update(self.connect_kwargs)
+        logger.info(f"MySQL 접속: {options['user']}@{options['host']}:{options['port']}/{options['database']}")
+        return pymysql.connect(**options)
+
+    def close(self) -> None:
+        """직접 연 연결만 닫음"""
+        if self._owns_connection and self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "DatabaseSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _cursor(self, streaming: bool = False):
+        """커서 생성 (MySQL 스트리밍 조회는 서버 측 커서 사용)"""
+        if streaming and not self.is_sqlite:
+            import pymysql.cursors
+
+            return self.connection.cursor(pymysql.cursors.SSCursor)
+        # sqlite3 커서는 fetchmany 호출 시점에 행을 읽으므로 그대로 스트리밍됨
+        return self.connection.cursor()
+
+    def list_tables(self) -> List[str]:
+        """DB의 테이블명 목록"""
+        cursor = self._cursor()
+        try:
+            if self.is_sqlite:
+                cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND name NOT LIKE 'sqlite_%' ORDER BY rowid"
+                )
+            else:
+                cursor.execute("SHOW TABLES")
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def load_schema(self, table: str) -> Optional[TableSchema]:
+        """
+        테이블 정의(CREATE TABLE 문)를 읽어 스키마로 변환
+
+        Args:
+            table: 테이블명
+
+        Returns:
+            테이블 스키마 (정의를 읽지 못하면 None)
+        """
+        cursor = self._cursor()
+        try:
+            if self.is_sqlite:
+                cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+                row = cursor.fetchone()
+                statement = row[0] if row else None
+            else:
+                cursor.execute(f"SHOW CREATE TABLE {_quote(table)}")
+                row = cursor.fetchone()
+                statement = row[1] if row else None
+        finally:
+            cursor.close()
+
+        schema = parse_create_table(statement) if statement else None
+        if schema:
+            # SQLite는 정의문의 테이블명 인용이 다를 수 있으므로 조회한 이름으로 통일
+            schema.name = table
+            self.schemas[table] = schema
+        return schema
+
+    def iter_records(
+        self, since: Optional[Dict[str, datetime]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        테이블을 순서대로 스트리밍 조회하여 레코드를 하나씩 반환
+
+        PCDataParser.iter_records()와 같은 (테이블명, 레코드) 형식이므로
+        문서 생성/중복 병합/벡터 DB 추가 단계를 그대로 이어 쓸 수 있다.
+
+        Args:
+            since: 테이블명 -> updated_at 하한. 지정된 테이블은 그 시각 이후(같은 시각 포함) 변경된 행만 조회
+
+        Returns:
+            (테이블명, 레코드) 이터레이터
+        """
+        since = since or {}
+        tables = self.tables or self.list_tables()
+        for table in tables:
+            yield from self.iter_table(table, updated_after=since.get(table))
+
+    def iter_table(
+        self, table: str, updated_after: Optional[datetime] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        테이블 하나를 fetch_size 단위로 읽어 (테이블명, 레코드) 반환
+
+        Args:
+            table: 테이블명
+            updated_after: 지정하면 updated_at이 이 시각 이후(같은 시각 포함)인 행만 DB에서 걸러 조회
+        """
+        schema = self.schemas.get(table) or self.load_schema(table)
+        kind_map = schema.kind_map() if schema else {}
+
+        query = f"SELECT * FROM {_quote(table)}"
+        params: Tuple[Any, ...] = ()
+        if updated_after is not None and "updated_at" in kind_map:
+            placeholder = "?" if self.is_sqlite else "%s"
+            # 마크와 같은 시각에 나중에 커밋된 행을 놓치지 않도록 같은 시각도 포함
+            query += f" WHERE `updated_at` >= {placeholder}"
+            # SQLite는 날짜를 문자열로 저장하므로 덤프와 같은 형식으로 비교
+            params = (updated_after.isoformat(sep=" "),)
+
+        cursor = self._cursor(streaming=True)
+        count = 0
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            columns = [description[0] for description in cursor.description]
+            kinds = [kind_map.get(column) for column in columns]
+
+            while True:
+                rows = cursor.fetchmany(self.fetch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    count += 1
+                    yield table, self._build_record(columns, kinds, row)
+        finally:
+            # 서버 측 커서는 남은 결과를 모두 소비해야 연결을 재사용할 수 있음
+            cursor.close()
+
+        logger.info(f"테이블 '{table}': {count}개 레코드 조회")
+
+    @staticmethod
+    def _build_record(
+        columns: List[str], kinds: List[Optional[str]], row: Iterable[Any]
+    ) -> Dict[str, Any]:
+        """조회한 행을 덤프 파서와 같은 형태의 레코드로 변환"""
+        record = {}
+        for column, kind, value in zip(columns, kinds, row):
+            # 빈 문자열은 NULL과 동일하게 취급 (덤프 파서와 동일)
+            if value == "":
+                value = None
+            elif isinstance(value, Decimal):
+                value = float(value)
+            elif isinstance(value, (bytes, bytearray)):
+                value = value.decode("utf-8", errors="ignore")
+            if kind:
+                value = convert_value(kind, value)
+            record[column] = value
+        return record
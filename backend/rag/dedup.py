@@ -0,0 +1,326 @@
+"""
+유사 중복 부품 문서 병합
+
+판매처, 색상, 포장만 다른 같은 제품을 임베딩 전에 하나로 묶는다.
+정규화한 제품명이 같은 문서끼리 스펙 텍스트의 MinHash 유사도를 비교하여
+임계값 이상이면 같은 그룹으로 보고, 그룹마다 대표 문서 하나만 임베딩한다.
+나머지 문서의 ID와 가격은 대표 문서 메타데이터에 붙여 둔다.
+증분 동기화는 바뀐 문서를 컬렉션에 저장된 대표 문서에 다시 병합한다 (merge_changes).
+
+열어 두는 이름 버킷 수에 상한(DEDUP_MAX_OPEN_NAMES)이 있어 스트리밍 적재의
+메모리 한도를 유지한다. 같은 제품의 변형이 상한보다 멀리 떨어져 나오면 병합되지 않는다.
+"""
+import json
+import re
+import unicodedata
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from .config import DEDUP_MAX_OPEN_NAMES, DEDUP_NUM_PERM, DEDUP_THRESHOLD
+from .doc_templates import PRICE_FIELDS, PRICE_LABEL
+from .vector_store import document_id
+
+# 제품 동일성에 영향을 주지 않는 색상/포장/유통 표기
+_VARIANT_WORDS = {
+    "black", "white", "silver", "gray", "grey", "red", "blue", "pink", "gold",
+    "retail", "bulk", "tray", "oem", "box", "boxed",
+    "블랙", "화이트", "실버", "그레이", "레드", "블루", "핑크", "골드",
+    "정품", "병행수입", "벌크", "멀티팩", "박스", "벌크포장", "해외구매",
+}
+_BRACKET_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]|\{[^}]*\}")
+_NON_WORD_RE = re.compile(r"[^\w.+]+")
+
+# MinHash 해시 계열 (a * h + b) mod p
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def normalize_name(name: Any) -> str:
+    """
+    제품명 정규화 (괄호 안 부가 정보, 색상/포장 표기, 구두점 제거)
+
+    Args:
+        name: 제품명
+
+    Returns:
+        정규화된 제품명
+    """
+    text = unicodedata.normalize("NFKC", str(name)).casefold()
+    text = _BRACKET_RE.sub(" ", text)
+    words = [word for word in _NON_WORD_RE.split(text) if word and word not in _VARIANT_WORDS]
+    return " ".join(words)
+
+
+def _spec_shingles(text: str) -> List[str]:
+    """문서 텍스트에서 제품명/가격대 줄을 뺀 스펙 부분의 단어 2-gram"""
+    words = []
+    for line in text.splitlines():
+        # 판매처마다 다른 가격이 변형 판정에 영향을 주지 않도록 제외
+        if line.startswith(("제품명:", f"{PRICE_LABEL}:")):
+            continue
+        words.extend(_NON_WORD_RE.split(unicodedata.normalize("NFKC", line).casefold()))
+    words = [word for word in words if word]
+    if len(words) < 2:
+        return words
+    return [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class MinHasher:
+    """고정 시드 MinHash 시그니처 생성기"""
+
+    def __init__(self, num_perm: int = DEDUP_NUM_PERM, seed: int = 1):
+        """
+        Args:
+            num_perm: 해시 함수(시그니처 길이) 수
+            seed: 해시 계수 시드 (같은 시드면 항상 같은 시그니처)
+        """
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, _MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        """shingle 집합의 MinHash 시그니처"""
+        hashes = np.fromiter(
+            {zlib.crc32(shingle.encode("utf-8")) % _MERSENNE_PRIME for shingle in shingles},
+            dtype=np.uint64,
+        )
+        if hashes.size == 0:
+            return np.full(self.a.shape, _MERSENNE_PRIME, dtype=np.uint64)
+        values = (self.a[:, None] * hashes[None, :] + self.b[:, None]) % _MERSENNE_PRIME
+        return values.min(axis=1)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """두 시그니처의 추정 Jaccard 유사도"""
+        return np.count_nonzero(sig_a == sig_b) / sig_a.size
+
+
+class _Group:
+    """대표 문서 하나와 병합된 변형 문서 정보"""
+
+    __slots__ = ("doc", "signature", "variant_ids", "prices", "stored")
+
+    def __init__(self, doc: Dict[str, Any], signature: Optional[np.ndarray]):
+        self.doc = doc
+        # 같은 이름의 문서가 나타날 때까지 계산을 미룸
+        self.signature = signature
+        self.variant_ids: List[str] = []
+        self.prices: List[Any] = []
+        # 컬렉션에 변형 정보와 함께 저장된 대표 문서인지 (변형이 모두 빠져도 메타데이터를 다시 씀)
+        self.stored = False
+
+    @classmethod
+    def from_stored(cls, doc: Dict[str, Any]) -> "_Group":
+        """컬렉션에서 읽은 대표 문서 ('id', 'text', 'metadata')로 그룹 복원"""
+        group = cls(doc, None)
+        group.variant_ids = stored_variant_ids(doc["metadata"])
+        # variant_prices는 [대표 문서 가격] + 변형 가격 순서
+        group.prices = json.loads(doc["metadata"].get("variant_prices") or "[]")[1:]
+        group.prices += [None] * (len(group.variant_ids) - len(group.prices))
+        group.stored = bool(group.variant_ids)
+        return group
+
+
+def stored_variant_ids(metadata: Dict[str, Any]) -> List[str]:
+    """저장된 대표 문서 메타데이터의 병합된 변형 문서 ID"""
+    return json.loads(metadata.get("variant_ids") or "[]")
+
+
+def _document_price(doc: Dict[str, Any]) -> Optional[Any]:
+    metadata = doc["metadata"]
+    for key in PRICE_FIELDS:
+        if metadata.get(key) is not None:
+            return metadata[key]
+    return None
+
+
+class NearDuplicateCollapser:
+    """문서 스트림에서 유사 중복 제품을 대표 문서로 병합"""
+
+    def __init__(
+        self,
+        threshold: float = DEDUP_THRESHOLD,
+        num_perm: int = DEDUP_NUM_PERM,
+        max_open_names: int = DEDUP_MAX_OPEN_NAMES,
+    ):
+        """
+        Args:
+            threshold: 같은 제품으로 볼 최소 스펙 유사도 (추정 Jaccard)
+            num_perm: MinHash 시그니처 길이
+            max_open_names: 동시에 열어 둘 정규화 제품명 버킷 수 (메모리 상한)
+        """
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.max_open_names = max(1, max_open_names)
+        self.input_count = 0
+        self.output_count = 0
+        self.evicted_buckets = 0
+
+    def collapse(self, documents: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        유사 중복을 병합한 문서 스트림 반환
+
+        덤프는 테이블 단위로 이어지므로 카테고리가 바뀌면 이전 카테고리의
+        대표 문서를 바로 내보낸다. 카테고리 안에서는 정규화 제품명 버킷을 최근 사용 순으로
+        max_open_names개까지만 열어 두고, 넘치면 가장 오래 쓰이지 않은 버킷의 대표 문서를
+        먼저 내보낸다. 따라서 메모리는 테이블 크기가 아니라 열린 버킷 수에 비례하며,
+        닫힌 버킷과 같은 이름이 한참 뒤에 다시 나오면 별도 대표 문서가 된다
+        (이름순으로 정렬된 입력이면 병합 결과가 항상 같다).
+
+        Args:
+            documents: 문서 이터러블
+
+        Returns:
+            대표 문서 이터레이터
+        """
+        # 정규화 제품명 -> 비교 대상 그룹 (현재 카테고리, 최근 사용 순)
+        open_names: "OrderedDict[str, List[_Group]]" = OrderedDict()
+        current = None
+
+        for index, doc in enumerate(documents):
+            self.input_count += 1
+            # 병합하지 않았을 때 add_documents()가 붙이는 ID와 같도록 입력 위치로 ID를 정함
+            # (기본 키가 없는 문서도 variant_ids와 대표 문서 ID가 컬렉션 ID와 일치)
+            doc["id"] = document_id(doc, index)
+            category = doc["metadata"].get("category", "unknown")
+            if category != current:
+                for groups in open_names.values():
+                    yield from self._flush(groups)
+                open_names.clear()
+                current = category
+
+            name_key = normalize_name(doc["metadata"].get("name", ""))
+            groups = open_names.get(name_key)
+            if groups is None:
+                groups = open_names[name_key] = []
+                if len(open_names) > self.max_open_names:
+                    _, evicted = open_names.popitem(last=False)
+                    self.evicted_buckets += 1
+                    yield from self._flush(evicted)
+            else:
+                open_names.move_to_end(name_key)
+            # 이름이 처음 나온 문서는 비교 대상이 없으므로 시그니처를 만들지 않음
+            signature = self._signature(doc) if groups else None
+
+            for group in groups:
+                if self._similar(group, signature):
+                    group.variant_ids.append(doc["id"])
+                    group.prices.append(_document_price(doc))
+                    break
+            else:
+                groups.append(_Group(doc, signature))
+
+        for groups in open_names.values():
+            yield from self._flush(groups)
+
+        logger.info(
+            f"유사 중복 병합: {self.input_count}개 -> {self.output_count}개 "
+            f"({self.input_count - self.output_count}개 병합, "
+            f"버킷 상한으로 먼저 내보낸 이름 {self.evicted_buckets}개)"
+        )
+
+    def merge_changes(
+        self, changed: Iterable[Dict[str, Any]], stored: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        증분 동기화로 바뀐 문서를 컬렉션에 저장된 대표 문서에 다시 병합
+
+        - 대표 문서가 바뀌면 내용만 교체하고 병합된 변형 목록은 유지한다.
+        - 변형 문서가 바뀌면 대표 문서와 이름/스펙이 여전히 같을 때 가격만 갱신하고,
+          달라졌으면 변형 목록에서 빼고 새 문서처럼 다시 병합한다.
+        - 새 문서는 같은 정규화 제품명의 대표 문서와 비교해 병합하거나 새 대표 문서가 된다.
+
+        Args:
+            changed: 바뀐 문서 ('id' 키 필요, 한 카테고리)
+            stored: 바뀐 문서와 관련된 저장된 대표 문서 ('id', 'text', 'metadata' 키,
+                같은 ID/같은 정규화 제품명이거나 바뀐 문서를 변형으로 가진 문서)
+
+        Returns:
+            다시 써야 할 대표 문서 리스트
+        """
+        # 정규화 제품명 -> 대표 그룹, 문서 ID(대표/변형) -> 속한 그룹
+        groups_by_name: Dict[str, List[_Group]] = {}
+        owner: Dict[str, _Group] = {}
+        for doc in stored:
+            group = _Group.from_stored(doc)
+            name_key = normalize_name(doc["metadata"].get("name", ""))
+            groups_by_name.setdefault(name_key, []).append(group)
+            owner[doc["id"]] = group
+            for variant_id in group.variant_ids:
+                owner[variant_id] = group
+
+        touched: Dict[int, _Group] = {}
+        for doc in changed:
+            self.input_count += 1
+            doc_id = doc["id"]
+            name_key = normalize_name(doc["metadata"].get("name", ""))
+            group = owner.get(doc_id)
+            if group is not None and group.doc["id"] == doc_id:
+                group.doc = doc
+                group.signature = None
+                touched[id(group)] = group
+                continue
+
+            signature = self._signature(doc)
+            if group is not None:
+                index = group.variant_ids.index(doc_id)
+                same_name = normalize_name(group.doc["metadata"].get("name", "")) == name_key
+                if same_name and self._similar(group, signature):
+                    group.prices[index] = _document_price(doc)
+                    touched[id(group)] = group
+                    continue
+                del group.variant_ids[index]
+                del group.prices[index]
+                touched[id(group)] = group
+
+            candidates = groups_by_name.setdefault(name_key, [])
+            for candidate in candidates:
+                if candidate is not group and self._similar(candidate, signature):
+                    candidate.variant_ids.append(doc_id)
+                    candidate.prices.append(_document_price(doc))
+                    break
+            else:
+                candidate = _Group(doc, signature)
+                candidates.append(candidate)
+            owner[doc_id] = candidate
+            touched[id(candidate)] = candidate
+
+        return list(self._flush(list(touched.values())))
+
+    def _similar(self, group: _Group, signature: np.ndarray) -> bool:
+        if group.signature is None:
+            group.signature = self._signature(group.doc)
+        return self.hasher.similarity(group.signature, signature) >= self.threshold
+
+    def _signature(self, doc: Dict[str, Any]) -> np.ndarray:
+        return self.hasher.signature(_spec_shingles(doc["text"]))
+
+    def _flush(self, groups: List[_Group]) -> Iterator[Dict[str, Any]]:
+        """이름 버킷 하나의 대표 문서를 처음 나온 순서대로 반환"""
+        for group in groups:
+            doc = group.doc
+            if group.variant_ids or group.stored:
+                metadata = doc["metadata"]
+                prices = [_document_price(doc)] + group.prices
+                known_prices = [price for price in prices if isinstance(price, (int, float))]
+                # ChromaDB 메타데이터는 스칼라만 허용하므로 목록은 JSON 문자열로 저장
+                metadata["variant_count"] = len(group.variant_ids) + 1
+                metadata["variant_ids"] = json.dumps(group.variant_ids, ensure_ascii=False)
+                metadata["variant_prices"] = json.dumps(prices, ensure_ascii=False, default=str)
+                if known_prices:
+                    metadata["price_min"] = min(known_prices)
+                    metadata["price_max"] = max(known_prices)
+            self.output_count += 1
+            yield doc
+
+    def stats(self) -> Dict[str, int]:
+        """병합 통계"""
+        return {
+            "input_documents": self.input_count,
+            "output_documents": self.output_count,
+            "collapsed_documents": self.input_count - self.output_count,
+            "evicted_buckets": self.evicted_buckets,
+        }
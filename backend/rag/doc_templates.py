@@ -0,0 +1,266 @@
+"""
+카테고리별 문서 템플릿
+
+부품 레코드에서 검색에 의미 있는 필드만 골라 정해진 순서로 임베딩 텍스트를 만든다.
+필드 값 길이와 문서 전체 토큰 수에 상한을 두어 임베딩 비용을 줄이고,
+field_N 같은 원시 컬럼이 유사도를 흐리지 않게 한다.
+필드 구성은 PC 부품 DB 스키마 가이드(backend/data)를 따른다.
+가격은 판매처마다 달라 정확한 값 대신 "30만원대" 같은 가격대만 넣어
+"30만원대 그래픽카드" 같은 쿼리가 벡터에서도 신호를 갖게 한다.
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import DOC_MAX_TOKENS, DOC_VALUE_MAX_CHARS
+
+# (필드명, 표시 이름, 단위)
+FieldSpec = Tuple[str, str, str]
+
+CATEGORY_TEMPLATES: Dict[str, List[FieldSpec]] = {
+    "cpu": [
+        ("brand", "제조사", ""),
+        ("socket", "소켓", ""),
+        ("core_count", "코어 수", ""),
+        ("thread_count", "스레드 수", ""),
+        ("tdp_w", "TDP", "W"),
+        ("integrated_graphics", "내장 그래픽", ""),
+        ("supported_memory_types", "지원 메모리", ""),
+    ],
+    "gpu": [
+        ("brand", "제조사", ""),
+        ("chipset", "칩셋", ""),
+        ("memory_gb", "VRAM", "GB"),
+        ("length_mm", "길이", "mm"),
+        ("required_psu_w", "권장 파워", "W"),
+        ("power_connectors", "전원 커넥터", ""),
+    ],
+    "memory": [
+        ("brand", "제조사", ""),
+        ("type", "규격", ""),
+        ("capacity_gb", "용량", "GB"),
+        ("speed_mhz", "속도", "MHz"),
+        ("module_count", "모듈 수", ""),
+    ],
+    "motherboard": [
+        ("brand", "제조사", ""),
+        ("socket", "소켓", ""),
+        ("chipset", "칩셋", ""),
+        ("form_factor", "폼팩터", ""),
+        ("ram_type", "메모리 규격", ""),
+        ("ram_slots", "램 슬롯", ""),
+        ("max_ram_gb", "최대 메모리", "GB"),
+        ("m2_slots_count", "M.2 슬롯", ""),
+        ("sata_ports_count", "SATA 포트", ""),
+    ],
+    "storage": [
+        ("brand", "제조사", ""),
+        ("type", "종류", ""),
+        ("capacity_gb", "용량", "GB"),
+        ("form_factor", "폼팩터", ""),
+        ("interface", "인터페이스", ""),
+    ],
+    "psu": [
+        ("brand", "제조사", ""),
+        ("wattage", "정격 출력", "W"),
+        ("rating", "효율 등급", ""),
+        ("form_factor", "폼팩터", ""),
+        ("is_modular", "모듈러", ""),
+        ("available_connectors", "커넥터", ""),
+    ],
+    "case": [
+        ("brand", "제조사", ""),
+        ("supported_mobo_form_factors", "지원 보드", ""),
+        ("max_gpu_length_mm", "최대 GPU 길이", "mm"),
+        ("max_cpu_cooler_height_mm", "최대 쿨러 높이", "mm"),
+        ("drive_bays_2_5_count", "2.5인치 베이", ""),
+        ("drive_bays_3_5_count", "3.5인치 베이", ""),
+    ],
+    "cpu_cooler": [
+        ("brand", "제조사", ""),
+        ("type", "냉각 방식", ""),
+        ("height_mm", "높이", "mm"),
+        ("radiator_size_mm", "라디에이터", "mm"),
+        ("supported_sockets", "지원 소켓", ""),
+    ],
+}
+
+# 가격 컬럼 후보 (앞에서부터 처음 값이 있는 컬럼 사용)
+PRICE_FIELDS = ("price", "lowest_price", "price_krw")
+PRICE_LABEL = "가격대"
+
+# 덤프 테이블명 -> 템플릿 카테고리
+CATEGORY_ALIASES = {
+    "video_card": "gpu",
+    "power_supply": "psu",
+    "pccase": "case",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    임베딩 토큰 수 추정
+
+    ASCII는 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰으로 계산한다.
+    (API 호출 없이 배치 크기/비용을 가늠하기 위한 근사치)
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    length = len(text)
+    # UTF-8에서 비ASCII 문자(한글 등)는 대부분 3바이트
+    non_ascii = (len(text.encode("utf-8")) - length) // 2
+    return (length - non_ascii + 3) // 4 + non_ascii
+
+
+def get_template(category: str) -> Optional[List[FieldSpec]]:
+    """카테고리(테이블명)에 해당하는 템플릿 (없으면 None)"""
+    category = category.lower()
+    return CATEGORY_TEMPLATES.get(CATEGORY_ALIASES.get(category, category))
+
+
+def price_bucket(value: Any) -> Optional[str]:
+    """
+    원 단위 가격을 대략적인 가격대 문자열로 변환
+
+    10만원 미만은 하나로, 100만원 미만은 10만원 단위, 그 이상은 100만원 단위로 묶는다.
+
+    Args:
+        value: 가격 (숫자 또는 숫자 문자열)
+
+    Returns:
+        "30만원대" 같은 가격대 (가격으로 볼 수 없으면 None)
+    """
+    if isinstance(value, bool):
+        return None
+    try:
+        price = int(float(str(value).replace(",", "")))
+    except ValueError:
+        return None
+    if price <= 0:
+        return None
+    if price < 100_000:
+        return "10만원 미만"
+    if price < 1_000_000:
+        return f"{price // 100_000 * 10}만원대"
+    return f"{price // 1_000_000 * 100}만원대"
+
+
+def _format_value(value: Any, unit: str, max_chars: int) -> str:
+    """값을 표시용 문자열로 변환 (JSON 배열/객체는 펼치고 길이 제한 적용)"""
+    if isinstance(value, bool):
+        text = "예" if value else "아니오"
+    elif isinstance(value, float) and value.is_integer():
+        text = str(int(value))
+    else:
+        text = str(value).strip()
+        if text[:1] in ("[", "{"):
+            try:
+                parsed = json.loads(text)
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, list):
+                text = ", ".join(str(item) for item in parsed)
+            elif isinstance(parsed, dict):
+                text = ", ".join(f"{key} {item}" for key, item in parsed.items())
+
+    if unit and not isinstance(value, bool):
+        text = f"{text}{unit}"
+    if len(text) > max_chars:
+        text = text[:max_chars].rstrip() + "…"
+    return text
+
+
+def _iter_fields(
+    category: str, record: Dict[str, Any], excluded_keys: Iterable[str]
+) -> Iterable[Tuple[str, Any, str]]:
+    """(표시 이름, 값, 단위)를 템플릿 순서대로 반환 (템플릿이 없으면 레코드 순서)"""
+    template = get_template(category)
+    if template is not None:
+        for field, label, unit in template:
+            value = record.get(field)
+            if value is not None and value != "":
+                yield label, value, unit
+        return
+
+    for key, value in record.items():
+        # 컬럼명을 알 수 없는 field_N 값은 검색 텍스트에 넣지 않음
+        if value is None or value == "" or key in excluded_keys or key.startswith("field_"):
+            continue
+        yield key, value, ""
+
+
+def render_document_text(
+    category: str,
+    name: Any,
+    record: Dict[str, Any],
+    excluded_keys: Iterable[str] = (),
+    max_tokens: int = DOC_MAX_TOKENS,
+    max_value_chars: int = DOC_VALUE_MAX_CHARS,
+) -> str:
+    """
+    레코드를 임베딩용 문서 텍스트로 변환
+
+    카테고리/제품명/가격대 줄은 항상 포함하고, 나머지 줄은 토큰 예산을 넘지 않는 범위에서 추가한다.
+
+    Args:
+        category: 부품 카테고리 (테이블명)
+        name: 제품명
+        record: 레코드 데이터
+        excluded_keys: 템플릿이 없는 카테고리에서 제외할 키 (ID, 생성일 등)
+        max_tokens: 문서 하나의 최대 추정 토큰 수
+        max_value_chars: 값 하나의 최대 문자 수
+
+    Returns:
+        문서 텍스트
+    """
+    lines = [f"카테고리: {category}", f"제품명: {_format_value(name, '', max_value_chars)}"]
+    price = next((record[key] for key in PRICE_FIELDS if record.get(key) is not None), None)
+    bucket = price_bucket(price) if price is not None else None
+    if bucket:
+        lines.append(f"{PRICE_LABEL}: {bucket}")
+    budget = max_tokens - sum(estimate_tokens(line) + 1 for line in lines)
+
+    for label, value, unit in _iter_fields(category, record, set(excluded_keys)):
+        line = f"{label}: {_format_value(value, unit, max_value_chars)}"
+        cost = estimate_tokens(line) + 1
+        if cost > budget:
+            break
+        lines.append(line)
+        budget -= cost
+
+    return "\n".join(lines)
+
+
+class TextTokenStats:
+    """문서 텍스트 추정 토큰 수 집계 (템플릿 적용 전/후 비교용)"""
+
+    def __init__(self):
+        self.documents = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self.max_after = 0
+
+    def add(self, tokens_before: int, tokens_after: int) -> None:
+        self.documents += 1
+        self.tokens_before += tokens_before
+        self.tokens_after += tokens_after
+        self.max_after = max(self.max_after, tokens_after)
+
+    def summary(self) -> Dict[str, Any]:
+        """집계 결과 딕셔너리"""
+        documents = self.documents or 1
+        reduction = (
+            (1 - self.tokens_after / self.tokens_before) * 100 if self.tokens_before else 0.0
+        )
+        return {
+            "documents": self.documents,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "avg_before": round(self.tokens_before / documents, 1),
+            "avg_after": round(self.tokens_after / documents, 1),
+            "max_after": self.max_after,
+            "reduction_pct": round(reduction, 1),
+        }
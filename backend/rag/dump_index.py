@@ -0,0 +1,183 @@
+"""
+SQL 덤프 바이트 오프셋 인덱스
+
+덤프 파일을 mmap으로 한 번 스캔하여 테이블별 CREATE/INSERT 문의
+바이트 범위를 기록한다. 인덱스가 있으면 특정 테이블만 다시 읽을 때
+해당 범위만 잘라 파싱하므로 나머지 테이블의 바이트는 건드리지 않는다.
+"""
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from .config import DUMP_INDEX_DIRECTORY
+from .sql_stream import DEFAULT_CHUNK_SIZE, iter_statement_spans
+
+_STATEMENT_HEAD_RE = re.compile(
+    rb"\s*(INSERT\s+(?:IGNORE\s+)?INTO|CREATE\s+(?:TEMPORARY\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?)\s*`?(\w+)`?",
+    re.IGNORECASE,
+)
+
+# 인덱스 파일 형식 버전
+INDEX_VERSION = 1
+
+
+def _iter_mmap_chunks(mm: mmap.mmap, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+    for offset in range(start, end, chunk_size):
+        yield mm[offset:min(offset + chunk_size, end)]
+
+
+class DumpIndex:
+    """테이블별 SQL 문 바이트 범위 인덱스"""
+
+    def __init__(self, sql_file_path: Path, entries: List[Dict], file_stat: str):
+        """
+        Args:
+            sql_file_path: SQL 덤프 파일 경로
+            entries: {"table", "kind"("create"/"insert"), "start", "end"} 리스트 (파일 순서)
+            file_stat: 인덱스를 만들 때의 파일 (크기:수정시각)
+        """
+        self.sql_file_path = Path(sql_file_path)
+        self.entries = entries
+        self.file_stat = file_stat
+
+    @staticmethod
+    def _stat_key(sql_file_path: Path) -> str:
+        stat = Path(sql_file_path).stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    @classmethod
+    def build(cls, sql_file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "DumpIndex":
+        """
+        덤프 파일을 mmap으로 한 번 스캔하여 인덱스 생성
+
+        Args:
+            sql_file_path: SQL 덤프 파일 경로
+            chunk_size: 스캔 단위 바이트 수
+
+        Returns:
+            덤프 인덱스
+        """
+        sql_file_path = Path(sql_file_path)
+        logger.info(f"덤프 인덱스 생성 중: {sql_file_path}")
+        entries = []
+
+        with open(sql_file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls(sql_file_path, entries, cls._stat_key(sql_file_path))
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                chunks = _iter_mmap_chunks(mm, 0, len(mm), chunk_size)
+                for start, end, stmt in iter_statement_spans(chunks):
+                    match = _STATEMENT_HEAD_RE.match(stmt, 0, 300)
+                    if not match:
+                        continue
+                    kind = "insert" if match.group(1)[:1].upper() == b"I" else "create"
+                    entries.append({
+                        "table": match.group(2).decode("utf-8"),
+                        "kind": kind,
+                        "start": start,
+                        "end": end,
+                    })
+
+        logger.info(f"덤프 인덱스 생성 완료: {len(entries)}개 문장")
+        return cls(sql_file_path, entries, cls._stat_key(sql_file_path))
+
+    @classmethod
+    def load_or_build(
+        cls,
+        sql_file_path: Path,
+        index_dir: Path = DUMP_INDEX_DIRECTORY,
+    ) -> "DumpIndex":
+        """
+        저장된 인덱스를 불러오고, 없거나 파일이 바뀌었으면 새로 생성해 저장
+
+        Args:
+            sql_file_path: SQL 덤프 파일 경로
+            index_dir: 인덱스 저장 디렉토리
+
+        Returns:
+            덤프 인덱스
+        """
+        sql_file_path = Path(sql_file_path).resolve()
+        index_path = Path(index_dir) / f"{sql_file_path.stem}.index.json"
+        stat_key = cls._stat_key(sql_file_path)
+
+        if index_path.exists():
+            try:
+                data = json.loads(index_path.read_text(encoding="utf-8"))
+                if (
+                    data.get("version") == INDEX_VERSION
+                    and data.get("path") == str(sql_file_path)
+                    and data.get("stat") == stat_key
+                ):
+                    return cls(sql_file_path, data["entries"], stat_key)
+            except (OSError, ValueError, KeyError):
+                pass
+            logger.info("덤프 파일이 변경되어 인덱스를 다시 생성합니다.")
+
+        index = cls.build(sql_file_path)
+        try:
+            index.save(index_path)
+        except OSError as e:
+            logger.warning(f"덤프 인덱스 저장 실패: {str(e)}")
+        return index
+
+    def save(self, index_path: Path) -> None:
+        """인덱스를 JSON 파일로 저장"""
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": INDEX_VERSION,
+                "path": str(self.sql_file_path.resolve()),
+                "stat": self.file_stat,
+                "entries": self.entries,
+            }),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, index_path)
+
+    @property
+    def tables(self) -> List[str]:
+        """인덱스에 있는 테이블명 (파일 순서)"""
+        return list(dict.fromkeys(entry["table"] for entry in self.entries))
+
+    def table_bytes(self, tables: Optional[Iterable[str]] = None) -> int:
+        """선택한 테이블의 SQL 문이 차지하는 바이트 수"""
+        wanted = set(tables) if tables is not None else None
+        return sum(
+            entry["end"] - entry["start"]
+            for entry in self.entries
+            if wanted is None or entry["table"] in wanted
+        )
+
+    def iter_statements(
+        self, tables: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        선택한 테이블의 CREATE/INSERT 문만 파일 순서대로 읽기
+
+        Args:
+            tables: 읽을 테이블명
+            chunk_size: mmap에서 잘라 읽을 바이트 수
+
+        Returns:
+            주석이 제거된 SQL 문 이터레이터
+        """
+        wanted = set(tables)
+        selected = [entry for entry in self.entries if entry["table"] in wanted]
+        if not selected:
+            return
+
+        with open(self.sql_file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for entry in selected:
+                    chunks = _iter_mmap_chunks(mm, entry["start"], entry["end"], chunk_size)
+                    for _, _, stmt in iter_statement_spans(chunks, base_offset=entry["start"]):
+                        yield stmt.decode("utf-8", errors="ignore")
@@ -1,18 +1,41 @@
 """
 Gemini API를 사용한 임베딩 생성기 (New SDK)
 """
-from google import genai
 from google.genai import types
-from typing import List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
+import numpy as np
 import time
 
-from .config import GEMINI_API_KEY, EMBEDDING_MODEL
+from .config import (
+    GEMINI_API_KEY,
+    EMBEDDING_MODEL,
+    EMBEDDING_DIMENSION,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_RPM,
+    EMBEDDING_TPM,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    EMBEDDING_BATCH_MAX_ITEMS,
+    QUERY_CACHE_ENABLED,
+    QUERY_COALESCE_ENABLED,
+)
+from .batching import BatchStats, pack_batches
+from .doc_templates import estimate_tokens
+from .coalescer import EmbeddingCoalescer
+from .embedding_cache import EmbeddingCache, make_cache_key
+from .query_cache import QueryEmbeddingCache
+from .gemini_client import ClientLane, GeminiClientPool
+from .rate_limiter import is_bad_input_error, is_rate_limit_error
 
 
 class GeminiEmbedder:
     """Gemini API를 사용하여 텍스트를 벡터로 임베딩하는 클래스"""
 
+    backend = "gemini"
+
     def __init__(
         self,
         api_key: str = GEMINI_API_KEY,
@@ -20,6 +43,16 @@ class GeminiEmbedder:
         task_type: str = "RETRIEVAL_DOCUMENT",
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        output_dimensionality: Optional[int] = EMBEDDING_DIMENSION,
+        cache: Optional[EmbeddingCache] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+        coalesce_queries: bool = QUERY_COALESCE_ENABLED,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+        requests_per_minute: int = EMBEDDING_RPM,
+        tokens_per_minute: int = EMBEDDING_TPM,
+        max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+        max_batch_items: int = EMBEDDING_BATCH_MAX_ITEMS,
+        client_pool: Optional[GeminiClientPool] = None,
     ):
         """
         Args:
@@ -28,36 +61,130 @@ class GeminiEmbedder:
             task_type: 임베딩 작업 유형 (RETRIEVAL_DOCUMENT, RETRIEVAL_QUERY 등)
             max_retries: 재시도 최대 횟수
             retry_delay: 재시도 대기 시간 (초)
+            output_dimensionality: 출력 차원 (API의 output_dimensionality 옵션, None이면 모델 기본 차원)
+            cache: 문서 임베딩 영구 캐시 (None이면 EMBEDDING_CACHE_ENABLED 설정에 따라 생성,
+                RETRIEVAL_DOCUMENT 임베딩에만 사용하고 검색 쿼리는 query_cache 사용)
+            query_cache: 검색 쿼리 임베딩 메모리 캐시 (None이면 QUERY_CACHE_ENABLED 설정에 따라 생성)
+            coalesce_queries: 동시에 들어온 쿼리 임베딩 요청을 짧은 창 동안 모아 배치로 보낼지 여부
+            max_concurrency: 동시에 보낼 수 있는 최대 배치 요청 수 (1이면 순차 처리, client_pool이 없을 때만 사용)
+            requests_per_minute: 모델의 분당 요청 수 할당량 (0이면 제한 없음, client_pool이 없을 때만 사용)
+            tokens_per_minute: 모델의 분당 토큰 수 할당량 (0이면 제한 없음, client_pool이 없을 때만 사용)
+            max_batch_tokens: 배치 요청 하나의 추정 토큰 예산 (0이면 항목 수로만 분할)
+            max_batch_items: 배치 요청 하나의 최대 텍스트 수
+            client_pool: 생성 모델과 공유하는 클라이언트 풀 (None이면 전용 풀 생성)
         """
-        self.api_key = api_key
+        self._owns_client_pool = client_pool is None
+        if client_pool is None:
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
+            client_pool = GeminiClientPool(
+                api_key=api_key,
+                embedding_rpm=requests_per_minute,
+                embedding_tpm=tokens_per_minute,
+                embedding_concurrency=max_concurrency,
+            )
+        self.client_pool = client_pool
+        self.api_key = client_pool.api_key
         self.model = model
         self.task_type = task_type
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.output_dimensionality = output_dimensionality
+        if cache is None and EMBEDDING_CACHE_ENABLED:
+            cache = EmbeddingCache()
+        self.cache = cache
+        if query_cache is None and QUERY_CACHE_ENABLED:
+            query_cache = QueryEmbeddingCache()
+        self.query_cache = query_cache
+        self.coalescer = (
+            EmbeddingCoalescer(self._embed_query_batch) if coalesce_queries else None
+        )
+        # 문서 색인은 bulk lane, 검색 쿼리는 query lane의 할당량/동시 요청 수를 사용
+        self.bulk_lane = client_pool.lane("bulk")
+        self.query_lane = client_pool.lane("query")
+        self.max_concurrency = self.bulk_lane.concurrency.max_limit
+        self.rate_limiter = self.bulk_lane.rate_limiter
+        self.concurrency = self.bulk_lane.concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_items = max_batch_items
+        self.batch_stats = BatchStats(max_batch_tokens)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
-        # Gemini API 클라이언트 초기화 (google-genai SDK)
-        self.client = genai.Client(api_key=self.api_key)
+        # 공유 클라이언트 (keep-alive 연결 풀을 생성 모델과 함께 사용)
+        self.client = client_pool.client
         logger.info(f"GeminiEmbedder 초기화 완료: model={model} (SDK: google-genai)")
 
-    def embed_text(self, text: str, task_type: str = None) -> List[float]:
+    @property
+    def dimension(self) -> int:
+        """출력 벡터 차원"""
+        return self.output_dimensionality or EMBEDDING_DIMENSION
+
+    def _lane(self, task_type: str) -> ClientLane:
+        """작업 유형에 맞는 클라이언트 풀 lane (검색 쿼리는 대량 색인 뒤에 밀리지 않도록 분리)"""
+        return self.query_lane if task_type == "RETRIEVAL_QUERY" else self.bulk_lane
+
+    def _embed_config(self, task_type: str) -> types.EmbedContentConfig:
+        http_options = self._lane(task_type).http_options
+        if self.output_dimensionality:
+            return types.EmbedContentConfig(
+                task_type=task_type,
+                output_dimensionality=self.output_dimensionality,
+                http_options=http_options,
+            )
+        return types.EmbedContentConfig(task_type=task_type, http_options=http_options)
+
+    def _uses_cache(self, task_type: str) -> bool:
+        """
+        영구 캐시 사용 여부
+
+        검색 쿼리는 메모리 캐시(query_cache)가 맡으므로 자유 형식 쿼리가
+        디스크 캐시에 쌓이거나 검색마다 디스크를 건드리지 않게 문서 임베딩만 저장한다.
+        """
+        return self.cache is not None and task_type == "RETRIEVAL_DOCUMENT"
+
+    def _cache_key(self, text: str, task_type: str) -> bytes:
+        return make_cache_key(self.model, task_type, self.output_dimensionality, text)
+
+    def _to_matrix(self, result: Any) -> np.ndarray:
+        """API 응답을 (텍스트 수, 차원) float32 배열로 변환"""
+        if not result.embeddings:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.array([e.values for e in result.embeddings], dtype=np.float32)
+
+    def embed_text(self, text: str, task_type: str = None) -> np.ndarray:
         """
         단일 텍스트를 임베딩
         """
         task_type = task_type or self.task_type
 
+        if self._uses_cache(task_type):
+            key = self._cache_key(text, task_type)
+            cached = self.cache.get_many([key])
+            if key in cached:
+                return cached[key]
+            embedding = self._embed_text_uncached(text, task_type)
+            if embedding.size:
+                self.cache.put_many([(key, embedding)])
+            return embedding
+
+        return self._embed_text_uncached(text, task_type)
+
+    def _embed_text_uncached(self, text: str, task_type: str) -> np.ndarray:
+        """API를 호출하여 단일 텍스트 임베딩 (재시도 포함)"""
+        lane = self._lane(task_type)
         for attempt in range(self.max_retries):
             try:
-                result = self.client.models.embed_content(
+                result = lane.call(
+                    self.client.models.embed_content,
                     model=self.model,
                     contents=text,
-                    config=types.EmbedContentConfig(
-                        task_type=task_type
-                    )
+                    config=self._embed_config(task_type),
+                    tokens=estimate_tokens(text),
                 )
                 # 단일 텍스트의 경우 embeddings 리스트의 첫 번째 요소의 values 반환
                 if result.embeddings and len(result.embeddings) > 0:
-                    return result.embeddings[0].values
-                return []
+                    return self._to_matrix(result)[0]
+                return np.empty(0, dtype=np.float32)
 
             except Exception as e:
                 logger.warning(
@@ -70,60 +197,458 @@ class GeminiEmbedder:
                     raise
 
     def embed_batch(
-        self, texts: List[str], task_type: str = None, batch_size: int = 100
-    ) -> List[List[float]]:
+        self, texts: List[str], task_type: str = None, batch_size: Optional[int] = None
+    ) -> np.ndarray:
         """
         여러 텍스트를 배치로 임베딩
+
+        캐시가 있으면 먼저 조회하여 캐시에 없는 텍스트만 API로 임베딩하고,
+        결과는 입력 순서대로 (텍스트 수, 차원) float32 배열로 반환한다.
+        하나라도 실패하면 예외를 발생시킨다 (실패한 텍스트만 건너뛰려면 embed_batch_with_failures 사용).
+
+        Args:
+            texts: 텍스트 리스트
+            task_type: 임베딩 작업 유형
+            batch_size: 요청 하나의 최대 텍스트 수 (None이면 max_batch_items,
+                요청은 max_batch_tokens 토큰 예산 안에서 채움)
+        """
+        embeddings, failures = self.embed_batch_with_failures(texts, task_type, batch_size)
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)}개 텍스트 임베딩 실패 (첫 오류: {failures[0]['error']})"
+            )
+        return embeddings
+
+    def embed_batch_with_failures(
+        self, texts: List[str], task_type: str = None, batch_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        여러 텍스트를 배치로 임베딩하고, 실패한 텍스트는 건너뛰고 목록으로 반환
+
+        입력 때문에 거절된 배치(4xx, 응답 검증 실패)는 반으로 나눠 재귀적으로 재시도하므로
+        문제 텍스트만 격리되고 같은 배치의 나머지 텍스트는 정상적으로 임베딩된다.
+        할당량 초과(429)와 일시적 오류(5xx, 시간 초과, 연결 오류)는 텍스트 문제가 아니므로
+        백오프로 재시도한 뒤에도 실패하면 예외를 발생시킨다 (정상 텍스트를 실패로 버리지 않음).
+
+        Returns:
+            (입력 순서의 (텍스트 수, 차원) float32 배열 (실패한 행은 0),
+             실패 목록 [{"index": 입력 위치, "error": 오류 메시지, "text": 텍스트 앞부분}])
         """
         task_type = task_type or self.task_type
-        all_embeddings = []
+        if not self._uses_cache(task_type):
+            return self._embed_batch_uncached(texts, task_type, batch_size)
+
+        keys = [self._cache_key(text, task_type) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing = self._missing_texts(keys, texts, cached)
+
+        errors: Dict[bytes, str] = {}
+        if missing:
+            new_embeddings, new_failures = self._embed_batch_uncached(
+                list(missing.values()), task_type, batch_size
+            )
+            new_items, errors = self._new_cache_items(missing, new_embeddings, new_failures)
+            self.cache.put_many(new_items)
+            cached.update(new_items)
+
+        return self._assemble_cached(keys, texts, cached, errors)
+
+    @staticmethod
+    def _missing_texts(
+        keys: List[bytes], texts: List[str], cached: Dict[bytes, np.ndarray]
+    ) -> Dict[bytes, str]:
+        """캐시에 없는 키 -> 텍스트 (같은 배치 안의 중복 텍스트는 한 번만 임베딩)"""
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        logger.info(f"임베딩 캐시: {len(texts) - len(missing)}/{len(texts)}개 적중")
+        return missing
+
+    @staticmethod
+    def _new_cache_items(
+        missing: Dict[bytes, str],
+        embeddings: np.ndarray,
+        failures: List[Dict[str, Any]],
+    ) -> Tuple[List[Tuple[bytes, np.ndarray]], Dict[bytes, str]]:
+        """새로 임베딩한 결과를 (캐시에 저장할 항목, 실패한 키 -> 오류)로 분리"""
+        missing_keys = list(missing.keys())
+        errors = {missing_keys[failure["index"]]: failure["error"] for failure in failures}
+        new_items = [
+            (key, embeddings[index])
+            for index, key in enumerate(missing_keys)
+            if key not in errors
+        ]
+        return new_items, errors
+
+    def _assemble_cached(
+        self,
+        keys: List[bytes],
+        texts: List[str],
+        cached: Dict[bytes, np.ndarray],
+        errors: Dict[bytes, str],
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """캐시/새 임베딩을 입력 순서의 배열과 실패 목록으로 조립"""
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for index, key in enumerate(keys):
+            vector = cached.get(key)
+            if vector is not None:
+                embeddings[index] = vector
+        failures = [
+            {"index": index, "error": errors[key], "text": text[:100]}
+            for index, (key, text) in enumerate(zip(keys, texts))
+            if key in errors
+        ]
+        return embeddings, failures
+
+    def _embed_batch_uncached(
+        self, texts: List[str], task_type: str, batch_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        API를 호출하여 여러 텍스트를 배치로 임베딩
+
+        max_concurrency가 2 이상이면 여러 배치 요청을 스레드 풀에서 동시에 보내고,
+        요청 속도는 RPM/TPM 토큰 버킷과 429 기반 동시성 제한이 조절한다.
+        결과는 미리 할당한 하나의 float32 배열에 입력 순서대로 채운다.
+        """
+        spans = self._pack_batches(texts, batch_size)
+        batches = [texts[start:end] for start, end in spans]
+        offsets = [start for start, _ in spans]
+        logger.info(f"{len(texts)}개의 텍스트를 임베딩 중... ({len(batches)}개 요청)")
+
+        if self.max_concurrency > 1 and len(batches) > 1:
+            futures = [
+                self._get_executor().submit(self._embed_bisect, batch, task_type, offset)
+                for batch, offset in zip(batches, offsets)
+            ]
+            results = (future.result() for future in futures)
+        else:
+            results = (
+                self._embed_bisect(batch, task_type, offset)
+                for batch, offset in zip(batches, offsets)
+            )
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        failures: List[Dict[str, Any]] = []
+        for offset, (batch_embeddings, batch_failures) in zip(offsets, results):
+            embeddings[offset : offset + len(batch_embeddings)] = batch_embeddings
+            failures.extend(batch_failures)
+
+        logger.info(f"임베딩 완료: {len(texts) - len(failures)}개 (실패 {len(failures)}개)")
+        return embeddings, failures
+
+    def _pack_batches(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        """추정 토큰 수 기준으로 텍스트를 연속 구간 배치로 분할"""
+        return pack_batches(
+            [estimate_tokens(text) for text in texts],
+            self.max_batch_tokens,
+            batch_size or self.max_batch_items,
+        )
+
+    def _embed_bisect(
+        self, batch: List[str], task_type: str, offset: int
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        배치를 임베딩하고, 입력 때문에 거절되면 반으로 나눠 재귀적으로 재시도
+
+        Args:
+            batch: 텍스트 리스트
+            task_type: 임베딩 작업 유형
+            offset: batch[0]의 입력 전체 기준 위치 (실패 목록의 index)
+
+        Returns:
+            (float32 임베딩 배열 (실패한 행은 0), 실패 목록)
+        """
+        try:
+            # 입력 오류인 여러 텍스트 배치는 같은 요청을 반복하지 않고 바로 나눠서 재시도
+            embeddings = self._embed_request(batch, task_type, fail_fast=len(batch) > 1)
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"임베딩 수가 요청 수와 다릅니다: {len(embeddings)} != {len(batch)}"
+                )
+            return embeddings, []
+        except Exception as e:
+            # 할당량/일시적 오류는 나눠도 해결되지 않으므로 그대로 발생
+            if not is_bad_input_error(e):
+                raise
+            if len(batch) == 1:
+                logger.error(f"임베딩 실패 텍스트 격리 (위치 {offset}): {batch[0][:50]}...")
+                failed = np.zeros((1, self.dimension), dtype=np.float32)
+                return failed, [{"index": offset, "error": str(e), "text": batch[0][:100]}]
+
+        middle = len(batch) // 2
+        logger.warning(f"배치 임베딩 실패: {len(batch)}개를 {middle}/{len(batch) - middle}개로 나눠 재시도")
+        left, left_failures = self._embed_bisect(batch[:middle], task_type, offset)
+        right, right_failures = self._embed_bisect(batch[middle:], task_type, offset + middle)
+        return np.concatenate([left, right]), left_failures + right_failures
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="embedder"
+            )
+        return self._executor
 
-        logger.info(f"{len(texts)}개의 텍스트를 임베딩 중...")
+    def _embed_request(
+        self, batch: List[str], task_type: str, fail_fast: bool = False
+    ) -> np.ndarray:
+        """
+        배치 하나를 임베딩 (속도 제한 및 재시도 포함)
+
+        429 응답이면 토큰 버킷을 비우고 동시 요청 수를 줄인 뒤 지수적으로 대기하고,
+        그 밖의 오류는 기존과 같이 선형으로 대기한 뒤 재시도한다.
+        fail_fast면 입력 오류(4xx, is_bad_input_error)만 재시도하지 않고 바로 발생시킨다.
+        """
+        tokens = sum(estimate_tokens(text) for text in batch)
+        lane = self._lane(task_type)
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            logger.debug(
-                f"배치 처리 중: {i + 1}-{min(i + batch_size, len(texts))}/{len(texts)}"
+        for attempt in range(self.max_retries):
+            lane.rate_limiter.acquire(tokens)
+            lane.concurrency.acquire()
+            throttled = False
+            try:
+                result = self.client.models.embed_content(
+                    model=self.model,
+                    contents=batch,
+                    config=self._embed_config(task_type),
+                )
+                self.batch_stats.record(len(batch), tokens)
+                return self._to_matrix(result)
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                error = e
+            finally:
+                lane.concurrency.release(throttled=throttled)
+
+            logger.warning(
+                f"배치 임베딩 실패 (시도 {attempt + 1}/{self.max_retries}): {str(error)}"
             )
+            if fail_fast and is_bad_input_error(error):
+                raise error
+            if attempt == self.max_retries - 1:
+                logger.error("배치 처리 최종 실패.")
+                raise error
+            if throttled:
+                lane.rate_limiter.drain()
+                time.sleep(self.retry_delay * (2 ** attempt))
+            else:
+                time.sleep(self.retry_delay * (attempt + 1))
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """쿼리 메모리 캐시 / 임베딩 영구 캐시 적중 통계"""
+        return {
+            "query_cache": self.query_cache.stats() if self.query_cache is not None else None,
+            "embedding_cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    def get_rate_stats(self) -> Dict[str, Any]:
+        """동시 요청 수 조정 및 속도 제한 대기 통계 (대량 색인 lane 기준, 쿼리 lane은 query 키)"""
+        return {**self.bulk_lane.stats(), "query": self.query_lane.stats()}
+
+    def get_batch_stats(self) -> Dict[str, float]:
+        """배치 요청당 평균 텍스트/토큰 수와 토큰 예산 대비 채움 비율"""
+        return self.batch_stats.stats()
 
-            batch_success = False
-            for attempt in range(self.max_retries):
-                try:
-                    result = self.client.models.embed_content(
-                        model=self.model,
-                        contents=batch,
-                        config=types.EmbedContentConfig(
-                            task_type=task_type
-                        )
-                    )
-                    
-                    if result.embeddings:
-                        batch_embeddings = [e.values for e in result.embeddings]
-                        all_embeddings.extend(batch_embeddings)
-                    
-                    batch_success = True
-                    break
-
-                except Exception as e:
-                    logger.warning(
-                        f"배치 임베딩 실패 (시도 {attempt + 1}/{self.max_retries}): {str(e)}"
-                    )
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (attempt + 1))
-                    else:
-                        logger.error("배치 처리 최종 실패.")
-                        raise
-
-            if i + batch_size < len(texts):
-                time.sleep(0.5)
-
-        logger.info(f"임베딩 완료: {len(all_embeddings)}개")
-        return all_embeddings
-
-    def embed_query(self, query: str) -> List[float]:
-        """검색 쿼리를 임베딩"""
-        return self.embed_text(query, task_type="RETRIEVAL_QUERY")
-
-    def embed_document(self, document: str) -> List[float]:
+    def embed_query(self, query: str) -> np.ndarray:
+        """검색 쿼리를 임베딩 (정규화한 쿼리 기준 메모리 캐시 우선)"""
+        if self.query_cache is not None:
+            cached = self.query_cache.get(query, "RETRIEVAL_QUERY")
+            if cached is not None:
+                return cached
+        if self.coalescer is not None:
+            embedding = self.coalescer.submit(query).result()
+        else:
+            embedding = self.embed_text(query, task_type="RETRIEVAL_QUERY")
+        if self.query_cache is not None:
+            self.query_cache.put(query, "RETRIEVAL_QUERY", embedding)
+        return embedding
+
+    def _embed_query_batch(self, queries: List[str]) -> List[Optional[np.ndarray]]:
+        """쿼리 묶음을 한 번의 배치 호출로 임베딩 (마이크로 배칭용, 실패한 쿼리는 None)"""
+        embeddings, failures = self.embed_batch_with_failures(queries, task_type="RETRIEVAL_QUERY")
+        failed = {failure["index"] for failure in failures}
+        return [None if index in failed else embedding for index, embedding in enumerate(embeddings)]
+
+    def embed_document(self, document: str) -> np.ndarray:
         """문서를 임베딩"""
         return self.embed_text(document, task_type="RETRIEVAL_DOCUMENT")
+
+    # ------------------------------------------------------------------
+    # asyncio API
+    #
+    # 클라이언트 풀의 비동기 클라이언트(client.aio)를 사용하므로 HTTP 연결 풀을
+    # 요청마다 새로 만들지 않고 공유한다. 재시도/429 처리/속도 제한은 동기 버전과 같다.
+    # ------------------------------------------------------------------
+
+    async def aembed_text(self, text: str, task_type: str = None) -> np.ndarray:
+        """embed_text()의 asyncio 버전"""
+        task_type = task_type or self.task_type
+
+        if self._uses_cache(task_type):
+            key = self._cache_key(text, task_type)
+            cached = await asyncio.to_thread(self.cache.get_many, [key])
+            if key in cached:
+                return cached[key]
+            embeddings = await self._aembed_request([text], task_type)
+            embedding = embeddings[0] if len(embeddings) else np.empty(0, dtype=np.float32)
+            if embedding.size:
+                await asyncio.to_thread(self.cache.put_many, [(key, embedding)])
+            return embedding
+
+        embeddings = await self._aembed_request([text], task_type)
+        return embeddings[0] if len(embeddings) else np.empty(0, dtype=np.float32)
+
+    async def aembed_batch(
+        self, texts: List[str], task_type: str = None, batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        embed_batch()의 asyncio 버전
+
+        하나라도 실패하면 예외를 발생시킨다 (실패한 텍스트만 건너뛰려면
+        aembed_batch_with_failures 사용).
+        """
+        embeddings, failures = await self.aembed_batch_with_failures(texts, task_type, batch_size)
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)}개 텍스트 임베딩 실패 (첫 오류: {failures[0]['error']})"
+            )
+        return embeddings
+
+    async def aembed_batch_with_failures(
+        self, texts: List[str], task_type: str = None, batch_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """
+        embed_batch_with_failures()의 asyncio 버전
+
+        캐시에 없는 텍스트만 배치 요청으로 나눠 동시에 보내고, 동시 요청 수는 동기 경로와
+        같은 lane의 AIMD 제한을 따른다. 실패한 배치는 반으로 나눠 문제 텍스트만 격리한다.
+        """
+        task_type = task_type or self.task_type
+        if not self._uses_cache(task_type):
+            return await self._aembed_batch_uncached(texts, task_type, batch_size)
+
+        keys = [self._cache_key(text, task_type) for text in texts]
+        cached = await asyncio.to_thread(self.cache.get_many, keys)
+        missing = self._missing_texts(keys, texts, cached)
+
+        errors: Dict[bytes, str] = {}
+        if missing:
+            new_embeddings, new_failures = await self._aembed_batch_uncached(
+                list(missing.values()), task_type, batch_size
+            )
+            new_items, errors = self._new_cache_items(missing, new_embeddings, new_failures)
+            await asyncio.to_thread(self.cache.put_many, new_items)
+            cached.update(new_items)
+
+        return self._assemble_cached(keys, texts, cached, errors)
+
+    async def _aembed_batch_uncached(
+        self, texts: List[str], task_type: str, batch_size: Optional[int] = None
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """_embed_batch_uncached()의 asyncio 버전 (배치 요청을 동시에 보냄)"""
+        spans = self._pack_batches(texts, batch_size)
+        logger.info(f"{len(texts)}개의 텍스트를 임베딩 중... ({len(spans)}개 요청)")
+        results = await asyncio.gather(
+            *(self._aembed_bisect(texts[start:end], task_type, start) for start, end in spans)
+        )
+
+        embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        failures: List[Dict[str, Any]] = []
+        for (start, _), (batch_embeddings, batch_failures) in zip(spans, results):
+            embeddings[start : start + len(batch_embeddings)] = batch_embeddings
+            failures.extend(batch_failures)
+
+        logger.info(f"임베딩 완료: {len(texts) - len(failures)}개 (실패 {len(failures)}개)")
+        return embeddings, failures
+
+    async def _aembed_bisect(
+        self, batch: List[str], task_type: str, offset: int
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """_embed_bisect()의 asyncio 버전"""
+        try:
+            embeddings = await self._aembed_request(batch, task_type, fail_fast=len(batch) > 1)
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"임베딩 수가 요청 수와 다릅니다: {len(embeddings)} != {len(batch)}"
+                )
+            return embeddings, []
+        except Exception as e:
+            # 할당량/일시적 오류는 나눠도 해결되지 않으므로 그대로 발생
+            if not is_bad_input_error(e):
+                raise
+            if len(batch) == 1:
+                logger.error(f"임베딩 실패 텍스트 격리 (위치 {offset}): {batch[0][:50]}...")
+                failed = np.zeros((1, self.dimension), dtype=np.float32)
+                return failed, [{"index": offset, "error": str(e), "text": batch[0][:100]}]
+
+        middle = len(batch) // 2
+        logger.warning(f"배치 임베딩 실패: {len(batch)}개를 {middle}/{len(batch) - middle}개로 나눠 재시도")
+        (left, left_failures), (right, right_failures) = await asyncio.gather(
+            self._aembed_bisect(batch[:middle], task_type, offset),
+            self._aembed_bisect(batch[middle:], task_type, offset + middle),
+        )
+        return np.concatenate([left, right]), left_failures + right_failures
+
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """검색 쿼리를 임베딩 (asyncio, 정규화한 쿼리 기준 메모리 캐시 우선)"""
+        if self.query_cache is not None:
+            cached = self.query_cache.get(query, "RETRIEVAL_QUERY")
+            if cached is not None:
+                return cached
+        if self.coalescer is not None:
+            embedding = await asyncio.wrap_future(self.coalescer.submit(query))
+        else:
+            embedding = await self.aembed_text(query, task_type="RETRIEVAL_QUERY")
+        if self.query_cache is not None:
+            self.query_cache.put(query, "RETRIEVAL_QUERY", embedding)
+        return embedding
+
+    async def _aembed_request(
+        self, batch: List[str], task_type: str, fail_fast: bool = False
+    ) -> np.ndarray:
+        """_embed_request()의 asyncio 버전 (같은 lane 슬롯을 사용하고 대기는 모두 asyncio.sleep)"""
+        tokens = sum(estimate_tokens(text) for text in batch)
+        lane = self._lane(task_type)
+
+        for attempt in range(self.max_retries):
+            await lane.rate_limiter.acquire_async(tokens)
+            await lane.concurrency.acquire_async()
+            throttled = False
+            try:
+                result = await self.client.aio.models.embed_content(
+                    model=self.model,
+                    contents=batch,
+                    config=self._embed_config(task_type),
+                )
+                self.batch_stats.record(len(batch), tokens)
+                return self._to_matrix(result)
+            except Exception as e:
+                throttled = is_rate_limit_error(e)
+                error = e
+            finally:
+                lane.concurrency.release(throttled=throttled)
+
+            logger.warning(
+                f"비동기 임베딩 실패 (시도 {attempt + 1}/{self.max_retries}): {str(error)}"
+            )
+            if fail_fast and is_bad_input_error(error):
+                raise error
+            if attempt == self.max_retries - 1:
+                logger.error("비동기 임베딩 최종 실패.")
+                raise error
+            if throttled:
+                lane.rate_limiter.drain()
+                await asyncio.sleep(self.retry_delay * (2 ** attempt))
+            else:
+                await asyncio.sleep(self.retry_delay * (attempt + 1))
+
+    async def aclose(self) -> None:
+        """마이크로 배칭 스레드 정리, 캐시 사용 시각 기록 (전용 클라이언트 풀이면 연결 풀도 정리)"""
+        if self.coalescer is not None:
+            await asyncio.to_thread(self.coalescer.close)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.flush)
+        if self._owns_client_pool:
+            await self.client_pool.aclose()
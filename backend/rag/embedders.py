@@ -0,0 +1,292 @@
+"""
+임베딩 백엔드
+
+벡터 DB와 파이프라인은 아래 Embedder 프로토콜만 사용하므로 백엔드를 바꿔 끼울 수 있다.
+- gemini: Gemini API (GeminiEmbedder)
+- local: 로컬 CPU 임베딩 모델 (sentence-transformers, 오프라인 대량 색인/저지연 쿼리용)
+- hashing: 결정적 해싱 임베딩 (API/모델 없이 테스트와 벤치마크용)
+
+사용할 백엔드는 EMBEDDING_BACKEND 설정으로 고르며, 벡터 DB 컬렉션 메타데이터에
+백엔드/모델/차원을 기록해 다른 임베딩으로 만든 색인을 섞어 쓰지 않도록 한다.
+"""
+import asyncio
+import hashlib
+import re
+import unicodedata
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+
+import numpy as np
+from loguru import logger
+
+from .config import (
+    EMBEDDING_BACKEND,
+    EMBEDDING_DIMENSION,
+    LOCAL_EMBEDDING_DEVICE,
+    LOCAL_EMBEDDING_DIMENSION,
+    LOCAL_EMBEDDING_MODEL,
+)
+
+if TYPE_CHECKING:
+    from .gemini_client import GeminiClientPool
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    """벡터 DB/검색기가 사용하는 임베딩 생성기 인터페이스"""
+
+    backend: str
+    model: str
+
+    @property
+    def dimension(self) -> int: ...
+
+    def embed_text(self, text: str, task_type: str = None) -> np.ndarray: ...
+
+    def embed_batch(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> np.ndarray: ...
+
+    def embed_batch_with_failures(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]: ...
+
+    def embed_query(self, query: str) -> np.ndarray: ...
+
+    def embed_document(self, document: str) -> np.ndarray: ...
+
+    async def aembed_query(self, query: str) -> np.ndarray: ...
+
+    async def aembed_batch(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> np.ndarray: ...
+
+    async def aclose(self) -> None: ...
+
+
+class LocalEmbedder:
+    """
+    프로세스 안에서 계산하는 임베딩 백엔드의 공통 구현
+
+    하위 클래스는 (텍스트 수, 차원) float32 배열을 반환하는 _encode()만 구현하면 된다. API 호출이 없으므로
+    재시도/속도 제한 없이 배치를 바로 계산하고, asyncio 메서드는 스레드에서 실행한다.
+    """
+
+    backend = "local"
+    model = ""
+    task_type = "RETRIEVAL_DOCUMENT"
+
+    @property
+    def dimension(self) -> int:
+        raise NotImplementedError
+
+    def _encode(self, texts: List[str], task_type: str) -> np.ndarray:
+        raise NotImplementedError
+
+    def embed_text(self, text: str, task_type: str = None) -> np.ndarray:
+        """단일 텍스트를 임베딩"""
+        return self._encode([text], task_type or self.task_type)[0]
+
+    def embed_batch(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> np.ndarray:
+        """여러 텍스트를 batch_size 단위로 임베딩 (입력 순서의 (텍스트 수, 차원) float32 배열)"""
+        task_type = task_type or self.task_type
+        embeddings = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for i in range(0, len(texts), batch_size):
+            embeddings[i : i + batch_size] = self._encode(texts[i : i + batch_size], task_type)
+        return embeddings
+
+    def embed_batch_with_failures(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """GeminiEmbedder와 같은 형식 (로컬 계산은 텍스트별 실패가 없으므로 실패 목록은 비어 있음)"""
+        return self.embed_batch(texts, task_type, batch_size), []
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """검색 쿼리를 임베딩"""
+        return self.embed_text(query, task_type="RETRIEVAL_QUERY")
+
+    def embed_document(self, document: str) -> np.ndarray:
+        """문서를 임베딩"""
+        return self.embed_text(document, task_type="RETRIEVAL_DOCUMENT")
+
+    async def aembed_query(self, query: str) -> np.ndarray:
+        """검색 쿼리를 임베딩 (asyncio, 계산은 스레드에서 수행)"""
+        return await asyncio.to_thread(self.embed_query, query)
+
+    async def aembed_batch(
+        self, texts: List[str], task_type: str = None, batch_size: int = 100
+    ) -> np.ndarray:
+        """embed_batch()의 asyncio 버전 (계산은 스레드에서 수행)"""
+        return await asyncio.to_thread(self.embed_batch, texts, task_type, batch_size)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class HashingEmbedder(LocalEmbedder):
+    """
+    결정적 해싱 임베딩 (테스트/벤치마크용)
+
+    단어와 단어 내부 문자 3-gram을 부호 있는 해싱(feature hashing)으로 고정 차원 벡터에
+    누적한 뒤 L2 정규화한다. 같은 텍스트는 프로세스/실행 환경과 무관하게 항상 같은 벡터가 되며,
+    어휘가 겹치는 텍스트끼리 코사인 유사도가 높아진다.
+    """
+
+    backend = "hashing"
+    model = "feature-hashing-v1"
+
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION, ngram: int = 3):
+        """
+        Args:
+            dimension: 벡터 차원
+            ngram: 단어 내부 문자 n-gram 길이 (한국어 조사/어미 변화 대응)
+        """
+        self._dimension = dimension
+        self.ngram = ngram
+        logger.info(f"HashingEmbedder 초기화 완료: dimension={dimension}")
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        """텍스트를 (특징, 가중치) 리스트로 변환"""
+        features = []
+        for token in _TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold()):
+            features.append((token, 1.0))
+            if len(token) > self.ngram:
+                padded = f"<{token}>"
+                features.extend(
+                    (padded[i : i + self.ngram], 0.5)
+                    for i in range(len(padded) - self.ngram + 1)
+                )
+        return features
+
+    def _encode(self, texts: List[str], task_type: str) -> np.ndarray:
+        vectors = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                digest = int.from_bytes(
+                    hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                sign = 1.0 if digest >> 63 else -1.0
+                vectors[row, digest % self._dimension] += sign * weight
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors /= norms
+        return vectors
+
+
+class SentenceTransformerEmbedder(LocalEmbedder):
+    """로컬 CPU 임베딩 모델 (sentence-transformers 호환 모델, ONNX 백엔드 포함)"""
+
+    backend = "local"
+
+    def __init__(
+        self,
+        model: str = LOCAL_EMBEDDING_MODEL,
+        device: str = LOCAL_EMBEDDING_DEVICE,
+        dimension: int = LOCAL_EMBEDDING_DIMENSION,
+        **model_kwargs: Any,
+    ):
+        """
+        Args:
+            model: 모델 이름 또는 로컬 경로
+            device: 실행 장치 (cpu, cuda 등)
+            dimension: 출력 차원 (모델 차원보다 작으면 앞쪽 차원만 남기고 재정규화, 0이면 모델 기본 차원)
+            model_kwargs: SentenceTransformer 생성자 추가 옵션 (예: backend="onnx")
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "로컬 임베딩 백엔드를 사용하려면 sentence-transformers를 설치하세요: "
+                "pip install sentence-transformers"
+            ) from e
+
+        self.model = model
+        self._model = SentenceTransformer(model, device=device, **model_kwargs)
+        model_dimension = self._model.get_sentence_embedding_dimension()
+        self._dimension = min(dimension, model_dimension) if dimension > 0 else model_dimension
+        logger.info(
+            f"SentenceTransformerEmbedder 초기화 완료: model={model}, device={device}, "
+            f"dimension={self._dimension}"
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def _encode(self, texts: List[str], task_type: str) -> np.ndarray:
+        embeddings = self._model.encode(
+            texts,
+            batch_size=len(texts),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        return truncate_embeddings(embeddings, self._dimension)
+
+
+def truncate_embeddings(embeddings: np.ndarray, dimension: int) -> np.ndarray:
+    """
+    임베딩을 앞쪽 dimension개 차원만 남기고 L2 재정규화 (Matryoshka 방식 차원 축소)
+
+    색인과 쿼리에 같은 변환을 적용해야 하므로 임베딩 백엔드 안에서만 사용한다.
+
+    Args:
+        embeddings: (텍스트 수, 원래 차원) 배열
+        dimension: 남길 차원 수
+
+    Returns:
+        (텍스트 수, dimension) float32 배열
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if dimension >= embeddings.shape[1]:
+        return embeddings
+    truncated = np.ascontiguousarray(embeddings[:, :dimension])
+    norms = np.linalg.norm(truncated, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    truncated /= norms
+    return truncated
+
+
+def create_embedder(
+    backend: str = EMBEDDING_BACKEND,
+    client_pool: Optional["GeminiClientPool"] = None,
+    **kwargs: Any,
+) -> Embedder:
+    """
+    설정된 백엔드의 임베딩 생성기 생성
+
+    Args:
+        backend: gemini, local, hashing 중 하나
+        client_pool: 생성 모델과 공유할 Gemini 클라이언트 풀 (gemini 백엔드만 사용)
+        kwargs: 백엔드 생성자에 넘길 옵션
+
+    Returns:
+        임베딩 생성기
+    """
+    backend = backend.lower()
+    if backend == "gemini":
+        from .embedder import GeminiEmbedder
+
+        return GeminiEmbedder(client_pool=client_pool, **kwargs)
+    if backend == "local":
+        return SentenceTransformerEmbedder(**kwargs)
+    if backend == "hashing":
+        return HashingEmbedder(**kwargs)
+    raise ValueError(f"지원하지 않는 임베딩 백엔드입니다: {backend} (gemini, local, hashing)")
+
+
+def embedder_signature(embedder: Embedder) -> Dict[str, Any]:
+    """컬렉션 메타데이터에 기록할 임베딩 백엔드/모델/차원"""
+    return {
+        "embedding_backend": embedder.backend,
+        "embedding_model": embedder.model,
+        "embedding_dimension": embedder.dimension,
+    }
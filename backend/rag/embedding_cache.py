@@ -0,0 +1,195 @@
+"""
+임베딩 영구 캐시
+
+(모델, 작업 유형, 출력 차원, 텍스트)의 해시를 키로 임베딩 벡터를 SQLite 파일에 저장한다.
+벡터는 float32 바이트로 압축 저장하고, 항목 수가 상한을 넘으면
+가장 오래 사용되지 않은 항목부터 지운다(LRU).
+재구축 시 바뀌지 않은 텍스트는 API를 호출하지 않고 캐시에서 읽는다.
+조회 시 사용 시각 갱신은 메모리에 모았다가 저장/정리 시점에 한 번에 기록하므로
+읽기마다 디스크 쓰기가 일어나지 않는다.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .config import EMBEDDING_CACHE_MAX_ENTRIES, EMBEDDING_CACHE_PATH
+
+# SQLite 바인딩 변수 개수 제한보다 작게 나눠 조회
+_QUERY_CHUNK = 500
+# 모아 둔 사용 시각 갱신이 이 수를 넘으면 조회 중에도 기록
+_TOUCH_FLUSH_SIZE = 5000
+
+
+def make_cache_key(
+    model: str, task_type: str, output_dimensionality: Optional[int], text: str
+) -> bytes:
+    """
+    임베딩 캐시 키 생성
+
+    Args:
+        model: 임베딩 모델 이름
+        task_type: 임베딩 작업 유형
+        output_dimensionality: 출력 차원 (None이면 모델 기본 차원)
+        text: 임베딩할 텍스트
+
+    Returns:
+        SHA-256 다이제스트
+    """
+    digest = hashlib.sha256()
+    for part in (model, task_type or "", str(output_dimensionality or "")):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    digest.update(text.encode("utf-8"))
+    return digest.digest()
+
+
+class EmbeddingCache:
+    """SQLite 기반 임베딩 캐시 (LRU 용량 제한)"""
+
+    def __init__(
+        self,
+        path: Path = EMBEDDING_CACHE_PATH,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            path: 캐시 SQLite 파일 경로
+            max_entries: 최대 보관 항목 수 (넘으면 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # 아직 기록하지 않은 키 -> 마지막 사용 시각
+        self._touched: Dict[bytes, int] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key BLOB PRIMARY KEY,"
+            " vector BLOB NOT NULL,"
+            " last_used INTEGER NOT NULL"
+            ")"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        logger.info(f"임베딩 캐시: {self.path} ({self._count}개 항목)")
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        여러 키를 한 번에 조회하고 사용 시각 갱신 (갱신은 모아 두었다가 나중에 기록)
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            찾은 키 -> float32 임베딩 벡터 (읽기 전용, 복사 없이 저장된 바이트를 그대로 사용)
+        """
+        found: Dict[bytes, np.ndarray] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        now = time.time_ns()
+
+        with self._lock:
+            for start in range(0, len(unique_keys), _QUERY_CHUNK):
+                chunk = unique_keys[start:start + _QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+
+            if found:
+                self._touched.update(dict.fromkeys(found, now))
+                if len(self._touched) >= _TOUCH_FLUSH_SIZE:
+                    self._flush_touched()
+                    self._conn.commit()
+
+            hits = sum(1 for key in keys if key in found)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, Sequence[float]]]) -> None:
+        """
+        임베딩 저장 (float32) 후 용량 상한을 넘으면 LRU 정리
+
+        Args:
+            items: (캐시 키, 임베딩 벡터) 이터러블
+        """
+        now = time.time_ns()
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes(), now)
+            for key, vector in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)", rows
+            )
+            self._count += self._conn.total_changes - before
+            # LRU 정리 전에 모아 둔 사용 시각을 반영
+            self._flush_touched()
+            if self.max_entries and self._count > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _flush_touched(self) -> None:
+        """모아 둔 사용 시각 갱신 기록 (호출자가 잠금을 잡고 커밋)"""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE embeddings SET last_used = ? WHERE key = ?",
+            [(used, key) for key, used in self._touched.items()],
+        )
+        self._touched = {}
+
+    def _evict(self) -> None:
+        """상한의 90%까지 오래 사용하지 않은 항목 삭제 (잦은 정리 방지)"""
+        target = int(self.max_entries * 0.9)
+        excess = self._count - target
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN ("
+            " SELECT key FROM embeddings ORDER BY last_used LIMIT ?"
+            ")",
+            (excess,),
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        logger.info(f"임베딩 캐시 정리: {excess}개 항목 삭제 (현재 {self._count}개)")
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def flush(self) -> None:
+        """모아 둔 사용 시각 갱신을 디스크에 기록"""
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,226 @@
+"""
+Gemini API 공유 클라이언트 풀
+
+임베딩 생성기와 응답 생성기가 하나의 genai.Client(= 하나의 HTTP 연결 풀)를 함께 쓰도록 한다.
+keep-alive 연결을 재사용하므로 요청마다 TLS 핸드셰이크를 다시 하지 않고,
+트래픽 유형(lane)별로 할당량과 동시 요청 수를 따로 두어 서로 밀리지 않게 한다.
+
+- bulk: 문서 색인용 대량 임베딩
+- query: 검색 쿼리 임베딩 (임베딩 할당량 중 EMBEDDING_QUERY_QUOTA_SHARE 몫을 전용으로 사용)
+- generation: 응답 생성
+"""
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from google import genai
+from google.genai import types
+from loguru import logger
+
+from .config import (
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_QUERY_MAX_CONCURRENCY,
+    EMBEDDING_QUERY_QUOTA_SHARE,
+    EMBEDDING_QUERY_TIMEOUT_SECONDS,
+    EMBEDDING_RPM,
+    EMBEDDING_TIMEOUT_SECONDS,
+    EMBEDDING_TPM,
+    GEMINI_API_KEY,
+    GEMINI_HTTP_KEEPALIVE_SECONDS,
+    GEMINI_HTTP_MAX_CONNECTIONS,
+    GENERATION_MAX_CONCURRENCY,
+    GENERATION_RPM,
+    GENERATION_TIMEOUT_SECONDS,
+)
+from .rate_limiter import AdaptiveConcurrency, RateLimiter, is_rate_limit_error
+
+T = TypeVar("T")
+
+
+class ClientLane:
+    """트래픽 유형 하나의 할당량(RPM/TPM), 동시 요청 수, 요청별 제한 시간"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int,
+        timeout: float,
+    ):
+        """
+        Args:
+            name: lane 이름 (bulk, query, generation)
+            requests_per_minute: 분당 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 입력 토큰 수 (0이면 제한 없음)
+            max_concurrency: 최대 동시 요청 수
+            timeout: 요청별 제한 시간 (초)
+        """
+        self.name = name
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+        # SDK 요청 옵션의 timeout 단위는 밀리초
+        self.http_options = types.HttpOptions(timeout=int(timeout * 1000))
+
+    def call(self, func: Callable[..., T], *args: Any, tokens: int = 0, **kwargs: Any) -> T:
+        """
+        할당량과 동시 요청 슬롯을 확보한 뒤 API 호출
+
+        Args:
+            func: 호출할 함수
+            tokens: 이번 요청의 추정 입력 토큰 수
+
+        Returns:
+            func의 반환값
+        """
+        self.rate_limiter.acquire(tokens)
+        self.concurrency.acquire()
+        throttled = False
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            raise
+        finally:
+            self.concurrency.release(throttled=throttled)
+
+    async def acall(
+        self, func: Callable[..., Awaitable[T]], *args: Any, tokens: int = 0, **kwargs: Any
+    ) -> T:
+        """call()의 asyncio 버전 (스레드 경로와 같은 동시 요청 슬롯을 공유)"""
+        await self.rate_limiter.acquire_async(tokens)
+        await self.concurrency.acquire_async()
+        throttled = False
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            raise
+        finally:
+            self.concurrency.release(throttled=throttled)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.concurrency.stats(),
+            "rate_limit_wait_seconds": round(self.rate_limiter.waited_seconds, 2),
+        }
+
+
+class GeminiClientPool:
+    """임베딩/생성 모델이 공유하는 Gemini 클라이언트와 lane별 예산"""
+
+    def __init__(
+        self,
+        api_key: str = GEMINI_API_KEY,
+        max_connections: int = GEMINI_HTTP_MAX_CONNECTIONS,
+        keepalive_expiry: float = GEMINI_HTTP_KEEPALIVE_SECONDS,
+        embedding_rpm: int = EMBEDDING_RPM,
+        embedding_tpm: int = EMBEDDING_TPM,
+        embedding_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+        query_share: float = EMBEDDING_QUERY_QUOTA_SHARE,
+        query_concurrency: int = EMBEDDING_QUERY_MAX_CONCURRENCY,
+        generation_rpm: int = GENERATION_RPM,
+        generation_concurrency: int = GENERATION_MAX_CONCURRENCY,
+    ):
+        """
+        Args:
+            api_key: Gemini API 키 (클라이언트를 처음 사용할 때 확인)
+            max_connections: HTTP 연결 풀 최대 연결 수 (keep-alive 연결 수도 같음)
+            keepalive_expiry: 쉬는 연결을 유지하는 시간 (초)
+            embedding_rpm: 임베딩 모델 분당 요청 수 할당량 (0이면 제한 없음)
+            embedding_tpm: 임베딩 모델 분당 토큰 수 할당량 (0이면 제한 없음)
+            embedding_concurrency: 대량 임베딩 최대 동시 요청 수
+            query_share: 임베딩 할당량 중 검색 쿼리 전용 몫 (0~1)
+            query_concurrency: 검색 쿼리 임베딩 최대 동시 요청 수
+            generation_rpm: 생성 모델 분당 요청 수 할당량 (0이면 제한 없음)
+            generation_concurrency: 생성 모델 최대 동시 요청 수
+        """
+        self.api_key = api_key
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+
+        query_share = min(max(query_share, 0.0), 1.0)
+
+        def split(quota: int, share: float) -> int:
+            # 0은 제한 없음이므로 할당량이 있으면 최소 1은 남김
+            return max(1, round(quota * share)) if quota else 0
+
+        self.lanes: Dict[str, ClientLane] = {
+            "bulk": ClientLane(
+                "bulk",
+                split(embedding_rpm, 1.0 - query_share),
+                split(embedding_tpm, 1.0 - query_share),
+                embedding_concurrency,
+                EMBEDDING_TIMEOUT_SECONDS,
+            ),
+            "query": ClientLane(
+                "query",
+                split(embedding_rpm, query_share),
+                split(embedding_tpm, query_share),
+                query_concurrency,
+                EMBEDDING_QUERY_TIMEOUT_SECONDS,
+            ),
+            "generation": ClientLane(
+                "generation", generation_rpm, 0, generation_concurrency, GENERATION_TIMEOUT_SECONDS
+            ),
+        }
+
+        self._client: Optional[genai.Client] = None
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def lane(self, name: str) -> ClientLane:
+        """lane 조회 (bulk, query, generation)"""
+        return self.lanes[name]
+
+    @property
+    def client(self) -> genai.Client:
+        """공유 genai.Client (처음 접근할 때 연결 풀과 함께 생성)"""
+        with self._lock:
+            if self._client is None:
+                if not self.api_key:
+                    raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
+                limits = httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                )
+                # 기본 제한 시간은 가장 긴 lane 기준, 요청별 제한 시간은 lane의 http_options로 지정
+                timeout = httpx.Timeout(
+                    max(lane.timeout for lane in self.lanes.values()), connect=10.0
+                )
+                self._http_client = httpx.Client(limits=limits, timeout=timeout)
+                self._async_http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+                self._client = genai.Client(
+                    api_key=self.api_key,
+                    http_options=types.HttpOptions(
+                        httpx_client=self._http_client,
+                        httpx_async_client=self._async_http_client,
+                    ),
+                )
+                logger.info(
+                    f"GeminiClientPool 초기화 완료: max_connections={self.max_connections}, "
+                    f"keepalive={self.keepalive_expiry}s"
+                )
+            return self._client
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """lane별 동시 요청 수 조정 및 속도 제한 대기 통계"""
+        return {name: lane.stats() for name, lane in self.lanes.items()}
+
+    def close(self) -> None:
+        """동기 HTTP 연결 풀 정리"""
+        if self._http_client is not None:
+            self._http_client.close()
+
+    async def aclose(self) -> None:
+        """동기/비동기 HTTP 연결 풀 정리"""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+        self.close()
+        with self._lock:
+            self._client = None
+            self._http_client = None
+            self._async_http_client = None
@@ -1,13 +1,13 @@
 """
 Gemini API를 사용한 추천 응답 생성기 (New SDK)
 """
-from google import genai
 from google.genai import types
 from typing import List, Dict, Any, Optional
 from loguru import logger
 import json
 
 from .config import GEMINI_API_KEY, GENERATION_MODEL
+from .gemini_client import GeminiClientPool
 
 
 class PCRecommendationGenerator:
@@ -18,20 +18,29 @@ class PCRecommendationGenerator:
         api_key: str = GEMINI_API_KEY,
         model: str = GENERATION_MODEL,
         temperature: float = 0.7,
+        client_pool: Optional[GeminiClientPool] = None,
     ):
         """
         Args:
             api_key: Gemini API 키
             model: 생성 모델 이름
             temperature: 생성 온도 (0~1, 높을수록 창의적)
+            client_pool: 임베딩 생성기와 공유하는 클라이언트 풀 (None이면 전용 풀 생성)
         """
-        self.api_key = api_key
+        self._owns_client_pool = client_pool is None
+        if client_pool is None:
+            if not api_key:
+                raise ValueError("GEMINI_API_KEY 환경 변수가 설정되지 않았습니다.")
+            client_pool = GeminiClientPool(api_key=api_key)
+        self.client_pool = client_pool
+        self.api_key = client_pool.api_key
         self.model_name = model
         self.temperature = temperature
 
-        # Gemini API 클라이언트 초기화 (google-genai SDK)
-        self.client = genai.Client(api_key=self.api_key)
-        
+        # 공유 클라이언트 (generation lane의 할당량/동시 요청 수 사용)
+        self.client = client_pool.client
+        self.lane = client_pool.lane("generation")
+
         logger.info(f"PCRecommendationGenerator 초기화: model={model} (SDK: google-genai)")
 
     def generate_recommendation(
@@ -43,30 +52,71 @@ class PCRecommendationGenerator:
         """
         사용자 쿼리와 검색된 부품 정보를 기반으로 추천 생성
         """
-        # 컨텍스트 구성
-        context = self._build_context(retrieved_components)
-
-        # 프롬프트 생성
-        prompt = self._build_prompt(user_query, context, system_instruction)
+        prompt = self._build_recommendation_prompt(user_query, retrieved_components, system_instruction)
 
         try:
             # Gemini API 호출
-            response = self.client.models.generate_content(
+            response = self.lane.call(
+                self.client.models.generate_content,
                 model=self.model_name,
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=self.temperature,
-                    max_output_tokens=2048,
-                    response_mime_type="application/json",
-                ),
+                config=self._generation_config(self.temperature),
             )
+        except Exception as e:
+            logger.error(f"추천 생성 실패: {str(e)}")
+            raise
 
-            # 응답 파싱
-            result = json.loads(response.text)
-            
-            logger.info(f"추천 생성 완료: '{user_query[:50]}...'")
-            return result
+        return self._parse_recommendation(response, user_query)
+
+    async def agenerate_recommendation(
+        self,
+        user_query: str,
+        retrieved_components: List[Dict[str, Any]],
+        system_instruction: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        generate_recommendation()의 asyncio 버전 (client.aio 사용)
+        """
+        prompt = self._build_recommendation_prompt(user_query, retrieved_components, system_instruction)
 
+        try:
+            response = await self.lane.acall(
+                self.client.aio.models.generate_content,
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config(self.temperature),
+            )
+        except Exception as e:
+            logger.error(f"추천 생성 실패: {str(e)}")
+            raise
+
+        return self._parse_recommendation(response, user_query)
+
+    def _generation_config(self, temperature: float) -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=2048,
+            response_mime_type="application/json",
+            http_options=self.lane.http_options,
+        )
+
+    def _build_recommendation_prompt(
+        self,
+        user_query: str,
+        retrieved_components: List[Dict[str, Any]],
+        system_instruction: Optional[str] = None,
+    ) -> str:
+        # 컨텍스트 구성
+        context = self._build_context(retrieved_components)
+
+        # 프롬프트 생성
+        return self._build_prompt(user_query, context, system_instruction)
+
+    @staticmethod
+    def _parse_recommendation(response: Any, user_query: str) -> Dict[str, Any]:
+        """응답 JSON 파싱 (JSON이 아니면 텍스트를 분석 항목에 담아 반환)"""
+        try:
+            result = json.loads(response.text)
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {str(e)}")
             # JSON이 아닌 경우 텍스트 그대로 반환 시도
@@ -76,9 +126,9 @@ class PCRecommendationGenerator:
                 "total_price": "0",
                 "additional_notes": "JSON 형식이 아닙니다."
             }
-        except Exception as e:
-            logger.error(f"추천 생성 실패: {str(e)}")
-            raise
+
+        logger.info(f"추천 생성 완료: '{user_query[:50]}...'")
+        return result
 
     def _build_context(self, components: List[Dict[str, Any]]) -> str:
         """
@@ -159,9 +209,54 @@ class PCRecommendationGenerator:
         """
         여러 부품을 비교 분석
         """
+        prompt = self._build_comparison_prompt(components_to_compare)
+
+        try:
+            response = self.lane.call(
+                self.client.models.generate_content,
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config(0.5),
+            )
+
+            return json.loads(response.text)
+
+        except Exception as e:
+            logger.error(f"비교 분석 실패: {str(e)}")
+            raise
+
+    async def agenerate_comparison(
+        self,
+        components_to_compare: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        generate_comparison()의 asyncio 버전 (client.aio 사용)
+        """
+        prompt = self._build_comparison_prompt(components_to_compare)
+
+        try:
+            response = await self.lane.acall(
+                self.client.aio.models.generate_content,
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config(0.5),
+            )
+
+            return json.loads(response.text)
+
+        except Exception as e:
+            logger.error(f"비교 분석 실패: {str(e)}")
+            raise
+
+    async def aclose(self) -> None:
+        """전용 클라이언트 풀이면 연결 풀 정리 (공유 풀은 소유자가 정리)"""
+        if self._owns_client_pool:
+            await self.client_pool.aclose()
+
+    def _build_comparison_prompt(self, components_to_compare: List[Dict[str, Any]]) -> str:
         context = self._build_context(components_to_compare)
 
-        prompt = f"""다음 PC 부품들을 비교 분석해주세요:
+        return f"""다음 PC 부품들을 비교 분석해주세요:
 
 {context}
 
@@ -180,20 +275,3 @@ class PCRecommendationGenerator:
     "best_choice": "최고의 선택과 이유",
     "budget_choice": "가성비 선택과 이유"
 }}"""
-
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.5,
-                    max_output_tokens=2048,
-                    response_mime_type="application/json",
-                ),
-            )
-
-            return json.loads(response.text)
-
-        except Exception as e:
-            logger.error(f"비교 분석 실패: {str(e)}")
-            raise
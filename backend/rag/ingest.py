@@ -0,0 +1,207 @@
+"""
+단계별 적재 파이프라인
+
+문서 준비(메타데이터 정제/ID/해시) -> 임베딩(네트워크) -> ChromaDB 저장(디스크/CPU)을
+각각 다른 스레드에서 실행하고, 단계 사이를 크기가 제한된 큐로 연결한다.
+앞 단계가 다음 배치를 준비하는 동안 뒤 단계가 이전 배치를 처리하므로 전체 구축 시간은
+세 단계 시간의 합이 아니라 가장 느린 단계의 시간에 가까워진다.
+큐가 가득 차면 앞 단계가 기다리므로(backpressure) 메모리에 올라가는 배치 수는 큐 깊이로 제한된다.
+
+배치 순서는 유지된다 (단계마다 스레드 하나, FIFO 큐).
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .config import INGEST_QUEUE_DEPTH
+
+# 단계 함수가 이 값을 반환하면 배치를 다음 단계로 넘기지 않음
+DROP = None
+
+# 입력이 끝났음을 다음 단계에 알리는 표식
+_DONE = object()
+
+# 다른 단계 실패를 확인하는 주기 (초)
+_POLL_SECONDS = 0.1
+
+
+class StageStats:
+    """단계 하나의 처리량과 대기 시간 집계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches = 0
+        self.items = 0
+        # 단계 함수 실행 시간
+        self.busy_seconds = 0.0
+        # 앞 단계의 배치를 기다린 시간 (이 단계가 놀고 있던 시간)
+        self.starved_seconds = 0.0
+        # 뒤 단계 큐가 가득 차서 기다린 시간 (backpressure)
+        self.blocked_seconds = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 2),
+            "starved_seconds": round(self.starved_seconds, 2),
+            "blocked_seconds": round(self.blocked_seconds, 2),
+            "items_per_second": (
+                round(self.items / self.busy_seconds, 1) if self.busy_seconds else 0.0
+            ),
+        }
+
+
+class StagedPipeline:
+    """크기 제한 큐로 연결한 단계별 스레드 실행기"""
+
+    def __init__(
+        self,
+        stages: Sequence[Tuple[str, Callable[[Any], Any]]],
+        size: Callable[[Any], int] = len,
+        queue_depth: int = INGEST_QUEUE_DEPTH,
+    ):
+        """
+        Args:
+            stages: (단계 이름, 배치를 받아 다음 단계 배치를 반환하는 함수) 리스트.
+                함수가 None(DROP)을 반환하면 해당 배치는 다음 단계로 넘기지 않는다.
+                마지막 단계는 run()을 호출한 스레드에서 실행된다.
+            size: 단계 입력 배치의 항목 수 (처리량 집계용)
+            queue_depth: 단계 사이 큐 하나에 쌓을 수 있는 최대 배치 수
+        """
+        if not stages:
+            raise ValueError("단계가 하나 이상 필요합니다.")
+        self.stages = list(stages)
+        self.size = size
+        self.queue_depth = max(1, queue_depth)
+        self.stage_stats: Dict[str, StageStats] = {name: StageStats(name) for name, _ in stages}
+        self.wall_seconds = 0.0
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def _put(self, out_queue: queue.Queue, item: Any, stats: StageStats) -> bool:
+        """다음 단계 큐에 넣기 (가득 차면 대기, 파이프라인이 중단되면 False)"""
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    out_queue.put(item, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        finally:
+            stats.blocked_seconds += time.perf_counter() - started
+
+    def _get(self, in_queue: queue.Queue, stats: StageStats) -> Any:
+        """앞 단계 큐에서 꺼내기 (파이프라인이 중단되면 _DONE)"""
+        started = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return in_queue.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+            return _DONE
+        finally:
+            stats.starved_seconds += time.perf_counter() - started
+
+    def _process(self, func: Callable[[Any], Any], item: Any, stats: StageStats) -> Any:
+        started = time.perf_counter()
+        result = func(item)
+        stats.busy_seconds += time.perf_counter() - started
+        stats.batches += 1
+        stats.items += self.size(item)
+        return result
+
+    def _iter_source(self, source: Iterable[Any], stats: StageStats) -> Any:
+        """첫 단계 입력 이터레이터 (입력을 만드는 시간도 대기 시간으로 집계)"""
+        iterator = iter(source)
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                stats.starved_seconds += time.perf_counter() - started
+            yield item
+
+    def _worker(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        inputs: Optional[queue.Queue],
+        source: Optional[Iterable[Any]],
+        out_queue: queue.Queue,
+    ) -> None:
+        stats = self.stage_stats[name]
+        try:
+            if inputs is None:
+                items = self._iter_source(source, stats)
+            else:
+                items = iter(lambda: self._get(inputs, stats), _DONE)
+            for item in items:
+                result = self._process(func, item, stats)
+                if result is not DROP and not self._put(out_queue, result, stats):
+                    return
+        except BaseException as e:
+            logger.error(f"적재 단계 '{name}' 실패: {str(e)}")
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            # 정상 종료면 남은 배치 뒤에 종료 표식 전달 (중단된 경우 다음 단계는 _stop으로 종료)
+            if not self._stop.is_set():
+                self._put(out_queue, _DONE, stats)
+
+    def run(self, source: Iterable[Any]) -> None:
+        """
+        입력 배치를 모든 단계에 통과시킴 (한 단계라도 예외가 나면 나머지를 멈추고 다시 발생)
+
+        Args:
+            source: 첫 단계에 넣을 배치 이터러블 (첫 단계 스레드에서 소비)
+        """
+        started = time.perf_counter()
+        threads: List[threading.Thread] = []
+        inputs: Optional[queue.Queue] = None
+        for name, func in self.stages[:-1]:
+            out_queue: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+            thread = threading.Thread(
+                target=self._worker,
+                args=(name, func, inputs, source if inputs is None else None, out_queue),
+                name=f"ingest-{name}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+            inputs = out_queue
+
+        name, func = self.stages[-1]
+        stats = self.stage_stats[name]
+        try:
+            if inputs is None:
+                items = self._iter_source(source, stats)
+            else:
+                items = iter(lambda: self._get(inputs, stats), _DONE)
+            for item in items:
+                self._process(func, item, stats)
+        except BaseException as e:
+            self._errors.append(e)
+            self._stop.set()
+        finally:
+            for thread in threads:
+                thread.join()
+            self.wall_seconds = time.perf_counter() - started
+
+        if self._errors:
+            raise self._errors[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """단계별 처리량/대기 시간과 전체 경과 시간"""
+        return {
+            "wall_seconds": round(self.wall_seconds, 2),
+            "stages": {name: stats.stats() for name, stats in self.stage_stats.items()},
+        }
@@ -0,0 +1,393 @@
+"""
+SQL 덤프 파싱 결과 캐시
+
+덤프 파일 내용 해시 + 파서 버전을 키로 하여 파싱된 레코드를
+테이블 단위 컬럼형 NumPy(.npz) 파일로 저장한다.
+덤프가 바뀌지 않았다면 재구축 시 SQL을 다시 파싱하지 않고 캐시에서 바로 읽는다.
+
+디렉토리 구조:
+    <cache_dir>/<key>/manifest.json      테이블 순서, 컬럼, 스키마
+    <cache_dir>/<key>/part_00000.npz     컬럼별 배열
+    <cache_dir>/hash_index.json          (경로, 크기, 수정시각) -> 내용 해시 메모
+"""
+import hashlib
+import json
+import os
+import shutil
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .columnar import MISSING, ColumnarTable
+from .config import PARSE_CACHE_DIRECTORY
+from .sql_schema import TableSchema
+
+# 값 종류 코드
+_ABSENT, _NONE, _INT, _FLOAT, _BOOL, _STR, _DATE, _DATETIME, _BIGINT = range(9)
+
+# 파트 하나에 담을 최대 행 수 (쓰기 중 메모리 상한)
+PART_MAX_ROWS = 50_000
+
+_HASH_CHUNK_SIZE = 4 << 20
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+def _value_code(value: Any) -> int:
+    if value is None:
+        return _NONE
+    if isinstance(value, bool):
+        return _BOOL
+    if isinstance(value, int):
+        return _INT if _INT64_MIN <= value <= _INT64_MAX else _BIGINT
+    if isinstance(value, float):
+        return _FLOAT
+    if isinstance(value, datetime):
+        return _DATETIME
+    if isinstance(value, date):
+        return _DATE
+    return _STR
+
+
+def _encode_texts(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 리스트를 UTF-8 바이트 블롭 + 오프셋 배열로 인코딩"""
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_texts(blob: bytes, offsets: List[int]) -> List[str]:
+    return [blob[offsets[n]:offsets[n + 1]].decode("utf-8") for n in range(len(offsets) - 1)]
+
+
+def _encode_part(table: ColumnarTable) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    컬럼형 테이블을 npz 배열로 인코딩
+
+    Returns:
+        (npz에 저장할 배열 딕셔너리, manifest에 기록할 파트 정보)
+    """
+    rows = len(table)
+    arrays = {"layout_ids": np.asarray(table.layout_ids, dtype=np.uint32)}
+
+    # 컬럼별로 값 종류 코드 + 종류별 배열 저장
+    for ci, column_values in enumerate(table.data):
+        codes = np.zeros(rows, dtype=np.uint8)
+        ints = None
+        floats = None
+        texts: List[str] = []
+        for row, value in enumerate(column_values):
+            if value is MISSING:
+                continue
+            code = _value_code(value)
+            codes[row] = code
+            if code == _INT or code == _BOOL:
+                if ints is None:
+                    ints = np.zeros(rows, dtype=np.int64)
+                ints[row] = int(value)
+            elif code == _FLOAT:
+                if floats is None:
+                    floats = np.zeros(rows, dtype=np.float64)
+                floats[row] = value
+            elif code == _STR:
+                texts.append(str(value))
+            elif code == _DATE or code == _DATETIME:
+                texts.append(value.isoformat())
+            elif code == _BIGINT:
+                texts.append(str(value))
+
+        arrays[f"c{ci}.codes"] = codes
+        if ints is not None:
+            arrays[f"c{ci}.ints"] = ints
+        if floats is not None:
+            arrays[f"c{ci}.floats"] = floats
+        if texts:
+            unique = dict.fromkeys(texts)
+            if len(unique) * 2 <= len(texts):
+                # 반복이 많은 컬럼(브랜드, 소켓, 날짜 등)은 사전 인코딩
+                unique_index = {text: n for n, text in enumerate(unique)}
+                arrays[f"c{ci}.text_ids"] = np.array(
+                    [unique_index[text] for text in texts], dtype=np.uint32
+                )
+                texts = list(unique)
+            blob, offsets = _encode_texts(texts)
+            arrays[f"c{ci}.text"] = blob
+            arrays[f"c{ci}.offsets"] = offsets
+
+    info = {
+        "table": table.name,
+        "rows": rows,
+        "columns": list(table.columns),
+        "layouts": [list(layout) for layout in table.layouts],
+    }
+    return arrays, info
+
+
+def _decode_column(arrays, ci: int, rows: int) -> Tuple[np.ndarray, List[Any]]:
+    """컬럼 하나를 (코드 배열, 값 리스트)로 복원"""
+    codes = arrays[f"c{ci}.codes"]
+    values: List[Any] = [None] * rows
+
+    if f"c{ci}.ints" in arrays.files:
+        ints = arrays[f"c{ci}.ints"].tolist()
+        for row in np.flatnonzero(codes == _INT).tolist():
+            values[row] = ints[row]
+        for row in np.flatnonzero(codes == _BOOL).tolist():
+            values[row] = bool(ints[row])
+    if f"c{ci}.floats" in arrays.files:
+        floats = arrays[f"c{ci}.floats"].tolist()
+        for row in np.flatnonzero(codes == _FLOAT).tolist():
+            values[row] = floats[row]
+    if f"c{ci}.text" in arrays.files:
+        texts = _decode_texts(arrays[f"c{ci}.text"].tobytes(), arrays[f"c{ci}.offsets"].tolist())
+        if f"c{ci}.text_ids" in arrays.files:
+            texts = [texts[n] for n in arrays[f"c{ci}.text_ids"].tolist()]
+        text_rows = np.flatnonzero(
+            (codes == _STR) | (codes == _DATE) | (codes == _DATETIME) | (codes == _BIGINT)
+        ).tolist()
+        codes_list = codes.tolist()
+        for text, row in zip(texts, text_rows):
+            code = codes_list[row]
+            if code == _STR:
+                values[row] = text
+            elif code == _DATE:
+                values[row] = date.fromisoformat(text)
+            elif code == _DATETIME:
+                values[row] = datetime.fromisoformat(text)
+            else:
+                values[row] = int(text)
+
+    return codes, values
+
+
+def _decode_part(path: Path, info: Dict[str, Any]) -> ColumnarTable:
+    """npz 파트 파일을 컬럼형 테이블로 복원 (행 딕셔너리는 만들지 않음)"""
+    rows = info["rows"]
+    columns = info["columns"]
+    data = []
+    with np.load(path, allow_pickle=False) as arrays:
+        layout_ids = arrays["layout_ids"].tolist()
+        for ci in range(len(columns)):
+            codes, values = _decode_column(arrays, ci, rows)
+            for row in np.flatnonzero(codes == _ABSENT).tolist():
+                values[row] = MISSING
+            data.append(values)
+
+    layouts = [tuple(layout) for layout in info["layouts"]]
+    return ColumnarTable(info["table"], columns, data, layouts, layout_ids)
+
+
+def _schema_to_dict(schema: TableSchema) -> Dict[str, Any]:
+    return {
+        "name": schema.name,
+        "columns": schema.columns,
+        "kinds": schema.kinds,
+        "primary_key": schema.primary_key,
+    }
+
+
+def _schema_from_dict(data: Dict[str, Any]) -> TableSchema:
+    return TableSchema(data["name"], data["columns"], data["kinds"], data.get("primary_key"))
+
+
+class ParsedDumpCache:
+    """SQL 덤프 파싱 결과를 컬럼형 바이너리로 보관하는 캐시"""
+
+    def __init__(
+        self,
+        parser_version: str,
+        cache_dir: Path = PARSE_CACHE_DIRECTORY,
+    ):
+        """
+        Args:
+            parser_version: 파서 버전 (파싱 결과 형태가 바뀌면 올려서 기존 캐시 무효화)
+            cache_dir: 캐시 저장 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.parser_version = str(parser_version)
+
+    def file_hash(self, sql_file_path: Path) -> str:
+        """
+        덤프 파일 내용의 SHA-256 해시
+
+        (경로, 크기, 수정시각)이 같으면 이전에 계산한 해시를 재사용한다.
+        """
+        sql_file_path = Path(sql_file_path).resolve()
+        stat = sql_file_path.stat()
+        index_path = self.cache_dir / "hash_index.json"
+        stat_key = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+        index = {}
+        if index_path.exists():
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                index = {}
+
+        entry = index.get(str(sql_file_path))
+        if entry and entry.get("stat") == stat_key:
+            return entry["sha256"]
+
+        digest = hashlib.sha256()
+        with open(sql_file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+
+        index[str(sql_file_path)] = {"stat": stat_key, "sha256": sha256}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            logger.debug(f"해시 인덱스 저장 실패: {str(e)}")
+
+        return sha256
+
+    def key_for(self, sql_file_path: Path) -> str:
+        """덤프 파일의 캐시 키 (내용 해시 + 파서 버전)"""
+        return f"{self.file_hash(sql_file_path)[:32]}-v{self.parser_version}"
+
+    def entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def has(self, key: str) -> bool:
+        return (self.entry_dir(key) / "manifest.json").exists()
+
+    def read_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목의 manifest 조회 (없으면 None)"""
+        manifest_path = self.entry_dir(key) / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    def load_schemas(self, key: str) -> Dict[str, TableSchema]:
+        """캐시에 저장된 테이블 스키마 조회"""
+        manifest = self.read_manifest(key) or {}
+        return {
+            name: _schema_from_dict(data) for name, data in manifest.get("schemas", {}).items()
+        }
+
+    def iter_records(
+        self, key: str, tables: Optional[Iterable[str]] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        캐시된 레코드를 원래 파싱 순서대로 반환
+
+        Args:
+            key: 캐시 키
+            tables: 읽을 테이블명 (None이면 전체). 다른 테이블의 파트 파일은 열지 않는다.
+
+        Returns:
+            (테이블명, 레코드) 이터레이터
+        """
+        for part in self.iter_parts(key, tables):
+            for record in part:
+                yield part.name, record
+
+    def iter_parts(
+        self, key: str, tables: Optional[Iterable[str]] = None
+    ) -> Iterator[ColumnarTable]:
+        """
+        캐시된 파트를 컬럼형 테이블 그대로 반환
+
+        Args:
+            key: 캐시 키
+            tables: 읽을 테이블명 (None이면 전체)
+
+        Returns:
+            파트별 컬럼형 테이블 이터레이터
+        """
+        manifest = self.read_manifest(key)
+        if manifest is None:
+            raise FileNotFoundError(f"파싱 캐시가 없습니다: {key}")
+
+        wanted = set(tables) if tables is not None else None
+        entry_dir = self.entry_dir(key)
+        for part in manifest["parts"]:
+            if wanted is not None and part["table"] not in wanted:
+                continue
+            yield _decode_part(entry_dir / part["file"], part)
+
+    def load_tables(
+        self, key: str, tables: Optional[Iterable[str]] = None
+    ) -> Dict[str, ColumnarTable]:
+        """캐시된 레코드를 테이블별 컬럼형 테이블로 로드"""
+        tables_data: Dict[str, ColumnarTable] = {}
+        for part in self.iter_parts(key, tables):
+            if part.name in tables_data:
+                tables_data[part.name].extend(part)
+            else:
+                tables_data[part.name] = part
+        return tables_data
+
+    def writer(self, key: str) -> "ParsedDumpCacheWriter":
+        """스트리밍 파싱 결과를 캐시에 기록하는 writer 생성"""
+        return ParsedDumpCacheWriter(self, key)
+
+
+class ParsedDumpCacheWriter:
+    """파싱 중인 레코드를 테이블 단위 파트로 나눠 임시 디렉토리에 기록"""
+
+    def __init__(self, cache: ParsedDumpCache, key: str):
+        self.cache = cache
+        self.key = key
+        self.tmp_dir = cache.cache_dir / f".{key}.{os.getpid()}.tmp"
+        if self.tmp_dir.exists():
+            shutil.rmtree(self.tmp_dir)
+        self.tmp_dir.mkdir(parents=True)
+        self.parts: List[Dict[str, Any]] = []
+        self._part: Optional[ColumnarTable] = None
+
+    def add(self, table_name: str, record: Dict[str, Any]) -> None:
+        """레코드 추가 (테이블이 바뀌거나 파트가 가득 차면 파일로 기록)"""
+        part = self._part
+        if part is None or table_name != part.name or len(part) >= PART_MAX_ROWS:
+            self._flush()
+            part = self._part = ColumnarTable(table_name)
+        part.append(record)
+
+    def _flush(self) -> None:
+        if self._part is None or not len(self._part):
+            return
+        file_name = f"part_{len(self.parts):05d}.npz"
+        arrays, info = _encode_part(self._part)
+        np.savez(self.tmp_dir / file_name, **arrays)
+        info["file"] = file_name
+        self.parts.append(info)
+        self._part = None
+
+    def commit(self, schemas: Dict[str, TableSchema]) -> None:
+        """남은 레코드를 기록하고 캐시 항목을 원자적으로 확정"""
+        self._flush()
+        manifest = {
+            "key": self.key,
+            "parser_version": self.cache.parser_version,
+            "tables": self._table_counts(),
+            "schemas": {name: _schema_to_dict(schema) for name, schema in schemas.items()},
+            "parts": self.parts,
+        }
+        (self.tmp_dir / "manifest.json").write_text(
+            json.dumps(manifest, ensure_ascii=False), encoding="utf-8"
+        )
+
+        entry_dir = self.cache.entry_dir(self.key)
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir)
+        os.replace(self.tmp_dir, entry_dir)
+        logger.info(f"파싱 캐시 저장: {entry_dir} ({len(self.parts)}개 파트)")
+
+    def abort(self) -> None:
+        """기록 중단 (임시 파일 삭제)"""
+        self._part = None
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _table_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for part in self.parts:
+            counts[part["table"]] = counts.get(part["table"], 0) + part["rows"]
+        return counts
@@ -1,16 +1,31 @@
 """
 RAG 파이프라인 - 전체 시스템 통합
 """
-from typing import Dict, Any, List, Optional
+import asyncio
+from itertools import groupby
+from typing import Dict, Any, Iterable, List, Iterator, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
-from .embedder import GeminiEmbedder
-from .vector_store import PCComponentVectorStore
+from .embedders import Embedder, create_embedder, embedder_signature
+from .vector_store import PCComponentVectorStore, document_id
 from .retriever import PCComponentRetriever
 from .generator import PCRecommendationGenerator
-from .data_parser import PCDataParser
-from .config import SQL_DUMP_PATH, CHROMA_PERSIST_DIRECTORY, CHROMA_COLLECTION_NAME
+from .gemini_client import GeminiClientPool
+from .batch_embedding import BatchEmbeddingJob
+from .checkpoint import BuildCheckpoint
+from .data_parser import PCDataParser, PARSER_VERSION
+from .parse_cache import ParsedDumpCache
+from .dedup import NearDuplicateCollapser, normalize_name, stored_variant_ids
+from .db_source import DatabaseSource
+from .sync import ChangeTracker, SyncState
+from .config import (
+    SQL_DUMP_PATH,
+    CHROMA_PERSIST_DIRECTORY,
+    CHROMA_COLLECTION_NAME,
+    PARSE_CACHE_ENABLED,
+    DEDUP_ENABLED,
+)
 
 
 class RAGPipeline:
@@ -18,37 +33,67 @@ class RAGPipeline:
 
     def __init__(
         self,
-        embedder: Optional[GeminiEmbedder] = None,
+        embedder: Optional[Embedder] = None,
         vector_store: Optional[PCComponentVectorStore] = None,
         retriever: Optional[PCComponentRetriever] = None,
         generator: Optional[PCRecommendationGenerator] = None,
+        client_pool: Optional[GeminiClientPool] = None,
     ):
         """
         Args:
-            embedder: 임베딩 생성기
+            embedder: 임베딩 생성기 (None이면 EMBEDDING_BACKEND 설정으로 생성)
             vector_store: 벡터 데이터베이스
             retriever: 검색기
-            generator: 응답 생성기
+            generator: 응답 생성기 (None이면 처음 사용할 때 생성)
+            client_pool: 임베딩/생성 모델이 공유할 Gemini 클라이언트 풀 (None이면 생성)
         """
+        # 임베딩/생성 모델이 하나의 연결 풀과 lane별 할당량을 공유 (클라이언트는 처음 사용할 때 생성)
+        self.client_pool = client_pool or GeminiClientPool()
+
         # 각 컴포넌트 초기화
-        self.embedder = embedder or GeminiEmbedder()
+        self.embedder = embedder or create_embedder(client_pool=self.client_pool)
         self.vector_store = vector_store or PCComponentVectorStore(embedder=self.embedder)
         self.retriever = retriever or PCComponentRetriever(vector_store=self.vector_store)
-        self.generator = generator or PCRecommendationGenerator()
+        # 색인 구축만 할 때는 생성 모델(Gemini API 키)이 필요 없으므로 지연 생성
+        self._generator = generator
 
         logger.info("RAGPipeline 초기화 완료")
 
+    @property
+    def generator(self) -> PCRecommendationGenerator:
+        if self._generator is None:
+            self._generator = PCRecommendationGenerator(client_pool=self.client_pool)
+        return self._generator
+
     def initialize_database(
         self,
         sql_file_path: Path = SQL_DUMP_PATH,
         force_rebuild: bool = False,
+        parse_workers: Optional[int] = None,
+        tables: Optional[List[str]] = None,
+        dedup: bool = DEDUP_ENABLED,
+        batch_job: Optional[BatchEmbeddingJob] = None,
+        resume: bool = True,
+        state: Optional[SyncState] = None,
     ) -> Dict[str, Any]:
         """
         SQL 데이터를 파싱하고 벡터 데이터베이스 구축
 
+        저장한 배치마다 구축 체크포인트를 남기므로, 같은 덤프(크기/수정 시각)와 임베딩 설정으로
+        중단된 구축이 있으면 컬렉션을 지우지 않고 저장되지 않은 문서부터 이어서 진행한다.
+        force_rebuild면 체크포인트를 무시하고 처음부터 다시 구축한다.
+
         Args:
             sql_file_path: SQL 덤프 파일 경로
-            force_rebuild: 기존 데이터를 삭제하고 재구축할지 여부
+            force_rebuild: 기존 데이터와 중단된 구축 체크포인트를 버리고 재구축할지 여부
+            parse_workers: SQL 파싱 프로세스 수 (None이면 설정값 사용)
+            tables: 재구축할 테이블(카테고리)명. 지정하면 해당 카테고리 문서만
+                교체하고 덤프에서도 해당 테이블 구간만 읽는다.
+            dedup: 유사 중복 제품을 대표 문서 하나로 병합할지 여부
+            batch_job: 지정하면 온라인 API 호출 대신 오프라인 배치 작업으로 임베딩
+                (배치 작업은 자체 매니페스트로 이어서 진행하므로 체크포인트를 쓰지 않음)
+            resume: False면 중단된 구축 체크포인트를 무시하고 처음부터 구축
+            state: 증분 동기화 하이 워터 마크 저장소 (None이면 기본 경로, 구축 성공 시 기록)
 
         Returns:
             초기화 결과 정보
@@ -57,56 +102,397 @@ class RAGPipeline:
         logger.info("벡터 데이터베이스 초기화 시작")
         logger.info("=" * 60)
 
+        checkpoint = self._build_checkpoint(batch_job)
+        source_key = f"dump://{Path(sql_file_path).resolve()}"
+        skipped = self._prepare_collection(
+            force_rebuild, tables, checkpoint, source_key, resume, batch_job,
+            fingerprint=self._dump_fingerprint(sql_file_path),
+        )
+        if skipped:
+            return skipped
+
+        # 1~3. SQL 스트리밍 파싱 -> 문서 생성 -> 벡터 데이터베이스에 추가
+        # 덤프를 끝까지 읽기 전에 앞 테이블부터 문서가 만들어져 바로 저장된다.
+        logger.info("Step 1: SQL 데이터 스트리밍 파싱 및 문서 생성")
+        parser_kwargs = {"workers": parse_workers} if parse_workers else {}
+        if tables:
+            parser_kwargs["tables"] = tables
+        if PARSE_CACHE_ENABLED:
+            parser_kwargs["cache"] = ParsedDumpCache(parser_version=PARSER_VERSION)
+        parser = PCDataParser(sql_file_path=sql_file_path, **parser_kwargs)
+        return self._ingest_records(
+            parser, parser.iter_records(), dedup, batch_job, checkpoint, tables,
+            source_key, state,
+        )
+
+    def initialize_from_database(
+        self,
+        source: DatabaseSource,
+        force_rebuild: bool = False,
+        dedup: bool = DEDUP_ENABLED,
+        batch_job: Optional[BatchEmbeddingJob] = None,
+        resume: bool = True,
+        state: Optional[SyncState] = None,
+    ) -> Dict[str, Any]:
+        """
+        SQL 덤프 없이 DB에서 부품 테이블을 직접 읽어 벡터 데이터베이스 구축
+
+        DB 행은 서버 측 커서로 fetch_size씩 받아 바로 문서로 변환하므로
+        테이블 전체를 메모리에 올리지 않는다.
+
+        Args:
+            source: DB 적재 소스 (source.tables가 지정되면 해당 카테고리 문서만 교체)
+            force_rebuild: 기존 데이터와 중단된 구축 체크포인트를 버리고 재구축할지 여부
+            dedup: 유사 중복 제품을 대표 문서 하나로 병합할지 여부
+            batch_job: 지정하면 온라인 API 호출 대신 오프라인 배치 작업으로 임베딩
+            resume: False면 중단된 구축 체크포인트를 무시하고 처음부터 구축
+            state: 증분 동기화 하이 워터 마크 저장소 (None이면 기본 경로, 구축 성공 시 기록)
+
+        Returns:
+            초기화 결과 정보
+        """
+        logger.info("=" * 60)
+        logger.info("벡터 데이터베이스 초기화 시작 (DB 직접 적재)")
+        logger.info("=" * 60)
+
+        checkpoint = self._build_checkpoint(batch_job)
+        source_key = source.source_key
+        skipped = self._prepare_collection(
+            force_rebuild, source.tables, checkpoint, source_key, resume, batch_job
+        )
+        if skipped:
+            return skipped
+
+        logger.info("Step 1: DB 스트리밍 조회 및 문서 생성")
+        parser = PCDataParser()
+        # 소스가 읽으면서 채우는 스키마를 문서 ID(기본 키) 생성에 그대로 사용
+        parser.schemas = source.schemas
+        return self._ingest_records(
+            parser, source.iter_records(), dedup, batch_job, checkpoint, source.tables,
+            source_key, state,
+        )
+
+    def sync_database(
+        self,
+        sql_file_path: Path = SQL_DUMP_PATH,
+        source: Optional[DatabaseSource] = None,
+        tables: Optional[List[str]] = None,
+        state: Optional[SyncState] = None,
+        dedup: bool = DEDUP_ENABLED,
+    ) -> Dict[str, Any]:
+        """
+        updated_at 기반 증분 동기화
+
+        이전 동기화의 하이 워터 마크 이후 updated_at이 바뀐 행만 문서로 만들어
+        다시 임베딩하고 같은 ID로 업서트한다. 문서 ID가 기본 키 기반이어야
+        기존 문서를 덮어쓸 수 있다. 삭제된 행은 반영하지 않으므로
+        주기적으로 전체 재구축을 병행한다.
+
+        dedup이면 바뀐 행을 컬렉션에 저장된 대표 문서에 다시 병합해 대표 문서만 업서트한다
+        (_merge_changed 참고). 병합한 대표 문서가 있는 컬렉션을 dedup=False로 동기화하면
+        변형 행이 별도 문서로 중복 저장되므로 ValueError를 낸다.
+
+        Args:
+            sql_file_path: SQL 덤프 파일 경로 (source가 없을 때 사용)
+            source: DB 적재 소스 (지정하면 DB에서 WHERE updated_at >= 마크로 조회)
+            tables: 동기화할 테이블명 (None이면 전체)
+            state: 하이 워터 마크 저장소 (None이면 기본 경로)
+            dedup: 바뀐 행을 저장된 대표 문서에 다시 병합할지 여부
+
+        Returns:
+            동기화 결과 정보
+        """
+        if not dedup and self.vector_store.has_merged_variants():
+            raise ValueError(
+                "컬렉션에 유사 중복 병합으로 만든 대표 문서가 있어 병합 없이 동기화할 수 없습니다. "
+                "--no-dedup 없이 동기화하거나 --no-dedup --force로 재구축하세요."
+            )
+        state = state or SyncState()
+        logger.info("=" * 60)
+        logger.info("벡터 데이터베이스 증분 동기화 시작")
+        logger.info("=" * 60)
+
+        parser_kwargs = {}
+        if source is not None:
+            if tables:
+                source.tables = tables
+            source_key = source.source_key
+            marks = state.load(source_key)
+            parser = PCDataParser()
+            parser.schemas = source.schemas
+            records = source.iter_records(since=marks)
+        else:
+            if tables:
+                parser_kwargs["tables"] = tables
+            if PARSE_CACHE_ENABLED:
+                parser_kwargs["cache"] = ParsedDumpCache(parser_version=PARSER_VERSION)
+            parser = PCDataParser(sql_file_path=sql_file_path, **parser_kwargs)
+            source_key = f"dump://{Path(sql_file_path).resolve()}"
+            marks = state.load(source_key)
+            records = parser.iter_records()
+
+        if marks:
+            logger.info(f"하이 워터 마크: { {t: m.isoformat() for t, m in marks.items()} }")
+        else:
+            logger.info("이전 동기화 기록이 없어 updated_at이 있는 모든 행을 반영합니다.")
+
+        tracker = ChangeTracker(marks)
+        documents = parser.iter_component_documents(tracker.iter_changed(records))
+        collapser = NearDuplicateCollapser() if dedup else None
+        if collapser:
+            documents = self._merge_changed(documents, collapser)
+        upserted = self.vector_store.add_documents(documents, upsert=True)
+
+        # 업서트가 끝난 뒤에만 마크를 올려 중간 실패 시 다음 동기화에서 다시 반영
+        # (임베딩에 실패한 문서가 있는 테이블은 마크를 유지해 다음 동기화에서 재시도)
+        new_marks = self._save_sync_marks(source_key, tracker, state)
+
+        logger.info(f"증분 동기화 완료: {upserted}개 문서 업서트 {tracker.changed}")
+        return {
+            "status": "success",
+            "message": "증분 동기화 완료",
+            "upserted_documents": upserted,
+            "ingest_stats": self.vector_store.ingest_stats,
+            "changed_by_table": tracker.changed,
+            "dedup_stats": collapser.stats() if collapser else None,
+            "high_water_marks": {t: m.isoformat() for t, m in new_marks.items()},
+            "failed_documents": self.vector_store.failed_documents,
+            "embedding_cache_stats": self._embedding_cache_stats(),
+            "embedding_batch_stats": self._embedding_batch_stats(),
+        }
+
+    def _merge_changed(
+        self, documents: Iterable[Dict[str, Any]], collapser: NearDuplicateCollapser
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        바뀐 문서를 카테고리별로 모아 저장된 대표 문서에 다시 병합
+
+        카테고리마다 저장된 문서의 메타데이터를 훑어 바뀐 문서와 ID나 정규화 제품명이 같거나
+        바뀐 문서를 변형으로 가진 대표 문서만 불러온다. 바뀐 문서는 카테고리 단위로 메모리에 모은다.
+        대표 문서는 바뀌어도 대표로 남으며, 삭제된 행과 마찬가지로 병합 결과가 전체 구축과
+        달라질 수 있어 주기적인 전체 재구축으로 정리한다.
+
+        Returns:
+            다시 써야 할 대표 문서 이터레이터
+        """
+        index = 0
+        for category, group in groupby(
+            documents, key=lambda doc: doc["metadata"].get("category", "unknown")
+        ):
+            changed = []
+            for doc in group:
+                changed.append({**doc, "id": document_id(doc, index)})
+                index += 1
+            ids = {doc["id"] for doc in changed}
+            names = {normalize_name(doc["metadata"].get("name", "")) for doc in changed}
+            related = [
+                doc_id
+                for doc_id, metadata in self.vector_store.iter_metadatas({"category": category})
+                if doc_id in ids
+                or normalize_name(metadata.get("name", "")) in names
+                or not ids.isdisjoint(stored_variant_ids(metadata))
+            ]
+            stored = self.vector_store.get_documents(related)
+            yield from collapser.merge_changes(changed, stored)
+
+    def _build_checkpoint(
+        self, batch_job: Optional[BatchEmbeddingJob]
+    ) -> Optional[BuildCheckpoint]:
+        """온라인 임베딩 구축용 체크포인트 (배치 작업이면 None)"""
+        if batch_job is not None:
+            return None
+        return BuildCheckpoint(self.vector_store.collection_name)
+
+    def _prepare_collection(
+        self,
+        force_rebuild: bool,
+        tables: Optional[List[str]],
+        checkpoint: Optional[BuildCheckpoint] = None,
+        source_key: str = "",
+        resume: bool = True,
+        batch_job: Optional[BatchEmbeddingJob] = None,
+        fingerprint: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        적재 전 컬렉션 정리
+
+        같은 입력(소스/테이블/입력 지문)과 임베딩 설정으로 중단된 구축 체크포인트가 있으면
+        컬렉션을 그대로 두고 이어서 구축한다. force_rebuild면 체크포인트를 무시한다.
+        선택 테이블 재구축은 여기서 지우지 않고, 새 문서를 업서트한 뒤 _ingest_records()에서
+        입력에 없던 문서만 삭제한다 (중간에 실패해도 해당 카테고리가 비지 않도록).
+
+        Returns:
+            기존 데이터가 있어 초기화를 건너뛰면 결과 정보, 진행하면 None
+        """
+        embedder = embedder_signature(self.vector_store.embedder)
+        if (
+            checkpoint is not None
+            and resume
+            and not force_rebuild
+            and checkpoint.pending(source_key, tables, fingerprint, embedder)
+        ):
+            return None
+        if batch_job is not None and not force_rebuild and batch_job.pending():
+            # 제출한 배치 작업이 남아 있으면 컬렉션에 일부 적재되어 있어도 이어서 적재 (업서트)
+            logger.info("진행 중인 배치 작업이 있어 기존 데이터를 유지하고 이어서 적재합니다.")
+            return None
+
         # 기존 데이터 확인
         current_count = self.vector_store.collection.count()
-        if current_count > 0 and not force_rebuild:
+        if tables:
+            # 선택 테이블 재구축: 해당 카테고리 문서만 교체 (삭제는 적재가 끝난 뒤)
+            logger.info(f"선택 카테고리 문서 교체: {tables}")
+        elif current_count > 0 and not force_rebuild:
             logger.info(f"기존 데이터 존재: {current_count}개 문서. 초기화 건너뜀.")
             return {
                 "status": "skipped",
                 "message": "기존 데이터가 존재합니다.",
                 "document_count": current_count,
             }
-
-        if force_rebuild:
+        elif force_rebuild:
             logger.warning("기존 데이터 삭제 중...")
             self.vector_store.delete_collection()
+        if checkpoint is not None:
+            checkpoint.start(source_key, tables, fingerprint, embedder)
+        return None
+
+    @staticmethod
+    def _dump_fingerprint(sql_file_path: Path) -> Optional[str]:
+        """덤프 파일 지문 (크기:수정 시각, 파일이 없으면 None)"""
+        try:
+            stat = Path(sql_file_path).stat()
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def _ingest_records(
+        self,
+        parser: PCDataParser,
+        records: Iterable[Tuple[str, Dict[str, Any]]],
+        dedup: bool,
+        batch_job: Optional[BatchEmbeddingJob] = None,
+        checkpoint: Optional[BuildCheckpoint] = None,
+        tables: Optional[List[str]] = None,
+        source_key: str = "",
+        state: Optional[SyncState] = None,
+    ) -> Dict[str, Any]:
+        """
+        (테이블명, 레코드) 스트림을 문서로 변환해 벡터 데이터베이스에 추가
 
-        # 1. SQL 파일 파싱
-        logger.info("Step 1: SQL 데이터 파싱")
-        parser = PCDataParser(sql_file_path=sql_file_path)
-        tables_data = parser.parse_sql_dump()
-
-        # 2. 문서 생성
-        logger.info("Step 2: 문서 생성")
-        documents = parser.create_component_documents(tables_data)
-
-        if not documents:
+        tables가 지정되면 해당 카테고리 문서를 업서트로 덮어쓰고, 적재가 끝난 뒤
+        이번 입력에 없던 문서만 삭제한다. 읽은 행의 테이블별 최대 updated_at은
+        구축이 끝난 뒤 증분 동기화 하이 워터 마크로 기록한다.
+        """
+        # 전체 구축 직후의 --sync가 모든 행을 다시 임베딩하지 않도록 마크를 함께 수집
+        tracker = ChangeTracker({})
+        documents = parser.iter_component_documents(tracker.iter_observed(records))
+
+        # 판매처/색상/포장만 다른 유사 중복 제품은 대표 문서 하나만 임베딩
+        collapser = NearDuplicateCollapser() if dedup else None
+        if collapser:
+            documents = collapser.collapse(documents)
+
+        # 선택 카테고리 교체: 다시 쓴 문서 ID (임베딩에 실패한 문서는 이전 문서 유지)
+        seen_ids = set() if tables else None
+        if batch_job is not None:
+            logger.info("Step 2: 오프라인 배치 작업으로 임베딩 후 벡터 데이터베이스에 적재")
+            added_count = batch_job.run(documents, self.vector_store, seen_ids=seen_ids)
+        else:
+            logger.info("Step 2: 벡터 데이터베이스에 추가")
+            added_count = self.vector_store.add_documents(
+                documents, upsert=bool(tables), checkpoint=checkpoint, seen_ids=seen_ids
+            )
+        resumed_count = self.vector_store.skipped_documents if checkpoint is not None else 0
+
+        if not added_count and not resumed_count:
             raise ValueError("생성된 문서가 없습니다.")
 
-        # 3. 벡터 데이터베이스에 추가
-        logger.info("Step 3: 벡터 데이터베이스에 추가")
-        self.vector_store.add_documents(documents)
+        if tables:
+            self.vector_store.delete_stale(tables, seen_ids)
+        self._save_sync_marks(source_key, tracker, state, replace=not tables)
+
+        if checkpoint is not None:
+            if self.vector_store.failed_documents:
+                # 체크포인트를 남겨 다음 실행에서 실패한 문서만 다시 임베딩
+                logger.warning("임베딩에 실패한 문서가 있어 구축 체크포인트를 유지합니다.")
+            else:
+                checkpoint.clear()
 
-        # 4. 통계 정보
+        # 3. 통계 정보
         stats = self.vector_store.get_stats()
+        token_stats = parser.token_stats.summary()
 
         logger.info("=" * 60)
         logger.info("벡터 데이터베이스 초기화 완료")
         logger.info(f"총 문서 수: {stats['total_documents']}")
+        logger.info(
+            f"문서 추정 토큰: {token_stats['tokens_before']} -> {token_stats['tokens_after']} "
+            f"({token_stats['reduction_pct']}% 감소)"
+        )
         logger.info("=" * 60)
 
         return {
             "status": "success",
             "message": "벡터 데이터베이스 초기화 완료",
+            "token_stats": token_stats,
+            "dedup_stats": collapser.stats() if collapser else None,
+            "resumed_documents": resumed_count,
+            "ingest_stats": self.vector_store.ingest_stats if batch_job is None else None,
+            "failed_documents": self.vector_store.failed_documents,
+            "embedding_cache_stats": self._embedding_cache_stats(),
+            "embedding_batch_stats": self._embedding_batch_stats(),
             **stats,
         }
 
+    def _save_sync_marks(
+        self,
+        source_key: str,
+        tracker: ChangeTracker,
+        state: Optional[SyncState] = None,
+        replace: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        반영을 마친 테이블의 하이 워터 마크 저장
+
+        임베딩에 실패한 문서가 있는 테이블은 마크를 올리지 않아 다음 동기화에서 다시 반영한다.
+
+        Args:
+            source_key: 입력 소스 식별자
+            tracker: 레코드를 읽으며 마크를 모은 추적기
+            state: 하이 워터 마크 저장소 (None이면 기본 경로)
+            replace: True면 소스의 기존 마크를 지우고 저장 (전체 재구축)
+
+        Returns:
+            저장한 테이블별 마크
+        """
+        state = state or SyncState()
+        failed_tables = {doc["category"] for doc in self.vector_store.failed_documents}
+        new_marks = {
+            table: mark for table, mark in tracker.new_marks.items()
+            if table not in failed_tables
+        }
+        if replace:
+            state.reset(source_key)
+        state.save(source_key, new_marks)
+        return new_marks
+
+    def _embedding_cache_stats(self) -> Optional[Dict[str, float]]:
+        """임베딩 캐시 적중 통계 (캐시를 쓰지 않으면 None)"""
+        cache = getattr(self.embedder, "cache", None)
+        return cache.stats() if cache is not None else None
+
+    def _embedding_batch_stats(self) -> Optional[Dict[str, float]]:
+        """임베딩 배치 요청 채움 통계 (API 백엔드가 아니면 None)"""
+        get_batch_stats = getattr(self.embedder, "get_batch_stats", None)
+        return get_batch_stats() if get_batch_stats is not None else None
+
     def query(
         self,
         user_query: str,
         top_k: int = 5,
         category: Optional[str] = None,
         include_context: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         사용자 쿼리에 대한 PC 부품 추천 생성
@@ -116,6 +502,7 @@ class RAGPipeline:
             top_k: 검색할 부품 수
             category: 특정 카테고리로 제한
             include_context: 검색된 원본 데이터 포함 여부
+            filters: 메타데이터 조건 (ChromaDB where 문법, 예: {"wattage": {"$gte": 750}})
 
         Returns:
             추천 결과 딕셔너리
@@ -127,19 +514,11 @@ class RAGPipeline:
             query=user_query,
             top_k=top_k,
             category=category,
+            where=filters,
         )
 
         if not retrieved_components:
-            logger.warning("검색된 부품이 없습니다.")
-            return {
-                "query": user_query,
-                "recommendation": {
-                    "analysis": "죄송합니다. 요청하신 조건에 맞는 부품을 찾을 수 없습니다.",
-                    "components": [],
-                    "total_price": 0,
-                },
-                "retrieved_count": 0,
-            }
+            return self._empty_query_result(user_query)
 
         # 2. 추천 생성
         recommendation = self.generator.generate_recommendation(
@@ -148,6 +527,65 @@ class RAGPipeline:
         )
 
         # 3. 결과 구성
+        return self._build_query_result(
+            user_query, recommendation, retrieved_components, include_context
+        )
+
+    async def aquery(
+        self,
+        user_query: str,
+        top_k: int = 5,
+        category: Optional[str] = None,
+        include_context: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        query()의 asyncio 버전
+
+        쿼리 임베딩과 응답 생성 모두 비동기 API를 사용하므로
+        API 서버의 이벤트 루프를 막지 않는다.
+        """
+        logger.info(f"쿼리 처리 시작: '{user_query}'")
+
+        retrieved_components = await self.retriever.aretrieve(
+            query=user_query,
+            top_k=top_k,
+            category=category,
+            where=filters,
+        )
+
+        if not retrieved_components:
+            return self._empty_query_result(user_query)
+
+        recommendation = await self.generator.agenerate_recommendation(
+            user_query=user_query,
+            retrieved_components=retrieved_components,
+        )
+
+        return self._build_query_result(
+            user_query, recommendation, retrieved_components, include_context
+        )
+
+    @staticmethod
+    def _empty_query_result(user_query: str) -> Dict[str, Any]:
+        logger.warning("검색된 부품이 없습니다.")
+        return {
+            "query": user_query,
+            "recommendation": {
+                "analysis": "죄송합니다. 요청하신 조건에 맞는 부품을 찾을 수 없습니다.",
+                "components": [],
+                "total_price": 0,
+            },
+            "retrieved_count": 0,
+        }
+
+    @staticmethod
+    def _build_query_result(
+        user_query: str,
+        recommendation: Dict[str, Any],
+        retrieved_components: List[Dict[str, Any]],
+        include_context: bool,
+    ) -> Dict[str, Any]:
         result = {
             "query": user_query,
             "recommendation": recommendation,
@@ -189,7 +627,41 @@ class RAGPipeline:
         for category, components in components_by_category.items():
             all_components.extend(components)
 
-        # 3. 전체 쿼리 생성
+        # 3. 추천 생성
+        recommendation = self.generator.generate_recommendation(
+            user_query=self._build_specs_user_query(requirements),
+            retrieved_components=all_components,
+        )
+
+        return self._build_specs_result(requirements, recommendation, components_by_category)
+
+    async def aquery_by_specs(
+        self,
+        requirements: Dict[str, Any],
+        top_k: int = 3,
+    ) -> Dict[str, Any]:
+        """query_by_specs()의 asyncio 버전 (카테고리별 검색을 동시에 수행)"""
+        logger.info(f"사양 기반 쿼리 처리: {requirements}")
+
+        components_by_category = await self.retriever.aretrieve_by_specs(
+            requirements=requirements,
+            top_k=top_k,
+        )
+
+        all_components = []
+        for category, components in components_by_category.items():
+            all_components.extend(components)
+
+        recommendation = await self.generator.agenerate_recommendation(
+            user_query=self._build_specs_user_query(requirements),
+            retrieved_components=all_components,
+        )
+
+        return self._build_specs_result(requirements, recommendation, components_by_category)
+
+    @staticmethod
+    def _build_specs_user_query(requirements: Dict[str, Any]) -> str:
+        """요구사항으로 추천 생성용 사용자 쿼리 구성"""
         query_parts = []
         if "purpose" in requirements:
             query_parts.append(f"{requirements['purpose']}용")
@@ -197,14 +669,14 @@ class RAGPipeline:
             query_parts.append(f"예산 {requirements['budget']}만원")
         query_parts.append("PC 조립")
 
-        user_query = " ".join(query_parts)
-
-        # 4. 추천 생성
-        recommendation = self.generator.generate_recommendation(
-            user_query=user_query,
-            retrieved_components=all_components,
-        )
+        return " ".join(query_parts)
 
+    @staticmethod
+    def _build_specs_result(
+        requirements: Dict[str, Any],
+        recommendation: Dict[str, Any],
+        components_by_category: Dict[str, List[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
         return {
             "requirements": requirements,
             "recommendation": recommendation,
@@ -212,7 +684,7 @@ class RAGPipeline:
                 cat: [c["metadata"]["name"] for c in comps]
                 for cat, comps in components_by_category.items()
             },
-            "total_retrieved": len(all_components),
+            "total_retrieved": sum(len(comps) for comps in components_by_category.values()),
         }
 
     def compare_components(
@@ -230,19 +702,7 @@ class RAGPipeline:
         """
         logger.info(f"부품 비교: {len(component_ids)}개")
 
-        # ChromaDB에서 부품 조회
-        components = []
-        for comp_id in component_ids:
-            result = self.vector_store.collection.get(ids=[comp_id])
-            if result["ids"]:
-                components.append({
-                    "id": result["ids"][0],
-                    "document": result["documents"][0],
-                    "metadata": result["metadatas"][0],
-                })
-
-        if len(components) < 2:
-            raise ValueError("비교하려면 최소 2개의 부품이 필요합니다.")
+        components = self._get_components(component_ids)
 
         # 비교 분석 생성
         comparison = self.generator.generate_comparison(components)
@@ -252,7 +712,94 @@ class RAGPipeline:
             "comparison": comparison,
         }
 
-    def get_stats(self) -> Dict[str, Any]:
-        """시스템 통계 조회"""
-        return self.vector_store.get_stats()
+    async def acompare_components(
+        self,
+        component_ids: List[str],
+    ) -> Dict[str, Any]:
+        """compare_components()의 asyncio 버전"""
+        logger.info(f"부품 비교: {len(component_ids)}개")
+
+        # ChromaDB 조회는 동기 API이므로 스레드에서 실행
+        components = await asyncio.to_thread(self._get_components, component_ids)
+        comparison = await self.generator.agenerate_comparison(components)
 
+        return {
+            "compared_components": [c["metadata"]["name"] for c in components],
+            "comparison": comparison,
+        }
+
+    def _get_components(self, component_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        ChromaDB에서 비교할 부품 조회 (2개 미만이면 ValueError)
+
+        유사 중복 병합으로 대표 문서에 합쳐진 변형 ID는 대표 문서로 바꿔 조회한다.
+        """
+        docs = {doc["id"]: doc for doc in self.vector_store.get_documents(component_ids)}
+        missing = [comp_id for comp_id in component_ids if comp_id not in docs]
+        representatives = self._find_representatives(missing) if missing else {}
+        for doc in self.vector_store.get_documents(
+            [doc_id for doc_id in set(representatives.values()) if doc_id not in docs]
+        ):
+            docs[doc["id"]] = doc
+
+        components = []
+        for comp_id in component_ids:
+            doc_id = representatives.get(comp_id, comp_id)
+            if doc_id not in docs:
+                logger.warning(f"부품을 찾을 수 없습니다: {comp_id}")
+                continue
+            if doc_id != comp_id:
+                logger.info(f"병합된 변형 {comp_id} -> 대표 문서 {doc_id}")
+            # 같은 대표 문서로 합쳐진 부품은 한 번만 비교
+            if any(component["id"] == doc_id for component in components):
+                continue
+            doc = docs[doc_id]
+            components.append({"id": doc_id, "document": doc["text"], "metadata": doc["metadata"]})
+
+        if len(components) < 2:
+            if representatives:
+                raise ValueError(
+                    "비교하려면 최소 2개의 부품이 필요합니다. "
+                    "유사 중복 병합으로 같은 대표 문서에 합쳐진 부품은 하나로 취급됩니다."
+                )
+            raise ValueError("비교하려면 최소 2개의 부품이 필요합니다.")
+
+        return components
+
+    def _find_representatives(self, variant_ids: List[str]) -> Dict[str, str]:
+        """
+        병합된 변형 ID가 속한 대표 문서 ID 조회 (병합된 대표 문서만 훑음)
+
+        Returns:
+            변형 ID -> 대표 문서 ID (찾지 못한 ID는 제외)
+        """
+        wanted = set(variant_ids)
+        representatives = {}
+        for doc_id, metadata in self.vector_store.iter_metadatas({"variant_count": {"$gt": 1}}):
+            for variant_id in wanted.intersection(stored_variant_ids(metadata)):
+                representatives[variant_id] = doc_id
+            if len(representatives) == len(wanted):
+                break
+        return representatives
+
+    def get_stats(self) -> Dict[str, Any]:
+        """시스템 통계 조회 (벡터 DB + 임베딩 캐시 적중률)"""
+        stats = self.vector_store.get_stats()
+        get_cache_stats = getattr(self.embedder, "get_cache_stats", None)
+        if get_cache_stats is not None:
+            stats["cache"] = get_cache_stats()
+        coalescer = getattr(self.embedder, "coalescer", None)
+        if coalescer is not None:
+            stats["query_coalescer"] = coalescer.stats()
+        batch_stats = self._embedding_batch_stats()
+        if batch_stats is not None:
+            stats["embedding_batches"] = batch_stats
+        stats["gemini_lanes"] = self.client_pool.stats()
+        return stats
+
+    async def aclose(self) -> None:
+        """임베딩/생성 모델과 공유 클라이언트 풀의 연결 정리"""
+        await self.embedder.aclose()
+        if self._generator is not None:
+            await self._generator.aclose()
+        await self.client_pool.aclose()
@@ -0,0 +1,120 @@
+"""
+검색 쿼리 임베딩 메모리 캐시
+
+같은 쿼리(또는 retrieve_by_specs가 만드는 템플릿 쿼리)가 반복되면
+임베딩 API 왕복 없이 메모리에서 바로 벡터를 돌려준다.
+키는 공백/대소문자/전각·반각 차이를 정규화한 텍스트이며,
+LRU 항목 수 상한과 TTL로 메모리 사용량을 제한한다.
+"""
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL_SECONDS
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """
+    쿼리 캐시 키용 정규화 (NFKC로 전각/반각 통일, 소문자화, 공백 정리)
+
+    Args:
+        text: 검색 쿼리
+
+    Returns:
+        정규화된 쿼리
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+class QueryEmbeddingCache:
+    """LRU + TTL 쿼리 임베딩 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = QUERY_CACHE_TTL_SECONDS,
+    ):
+        """
+        Args:
+            max_entries: 최대 보관 쿼리 수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+            ttl_seconds: 항목 유효 시간 (0이면 만료 없음)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (작업 유형, 정규화 쿼리) -> (만료 시각, float32 벡터)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, task_type: str) -> Optional[np.ndarray]:
+        """
+        캐시된 쿼리 임베딩 조회
+
+        Args:
+            query: 검색 쿼리 (원문)
+            task_type: 임베딩 작업 유형
+
+        Returns:
+            float32 임베딩 벡터 (읽기 전용, 없거나 만료되었으면 None)
+        """
+        key = (task_type, normalize_query(query))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (not self.ttl_seconds or entry[0] > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, query: str, task_type: str, embedding: Sequence[float]) -> None:
+        """
+        쿼리 임베딩 저장
+
+        Args:
+            query: 검색 쿼리 (원문)
+            task_type: 임베딩 작업 유형
+            embedding: 임베딩 벡터
+        """
+        if len(embedding) == 0 or self.max_entries <= 0:
+            return
+        key = (task_type, normalize_query(query))
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        # 호출자 배열과 분리하고, 여러 호출자가 공유하므로 읽기 전용으로 보관
+        vector = np.array(embedding, dtype=np.float32)
+        vector.flags.writeable = False
+        with self._lock:
+            self._entries[key] = (expires, vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
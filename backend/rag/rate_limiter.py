@@ -0,0 +1,222 @@
+"""
+임베딩 API 호출 속도 제한 및 오류 분류
+
+- RateLimiter: 분당 요청 수(RPM)와 분당 토큰 수(TPM) 할당량을 따르는 토큰 버킷
+- AdaptiveConcurrency: 429 응답이면 동시 요청 수를 절반으로 줄이고,
+  성공이 이어지면 하나씩 늘리는 AIMD 방식 동시성 제한
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """API 할당량 초과(429 / RESOURCE_EXHAUSTED) 오류인지 확인"""
+    if getattr(error, "code", None) == 429 or getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    """오류의 HTTP 상태 코드 (없으면 None)"""
+    for attr in ("code", "status_code"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_transient_error(error: Exception) -> bool:
+    """서버 오류(5xx), 요청 시간 초과, 연결 오류처럼 같은 요청을 다시 보내면 성공할 수 있는 오류인지 확인"""
+    status = _error_status(error)
+    if status is not None:
+        return status >= 500 or status == 408
+    return isinstance(error, (TimeoutError, ConnectionError, httpx.TransportError))
+
+
+def is_bad_input_error(error: Exception) -> bool:
+    """
+    요청 내용(텍스트) 때문에 거절된 오류인지 확인 (429/408을 뺀 4xx, 응답 검증 실패)
+
+    이 오류만 배치를 나눠 문제 텍스트를 격리할 대상이 된다.
+    """
+    if is_rate_limit_error(error) or is_transient_error(error):
+        return False
+    status = _error_status(error)
+    if status is not None:
+        return 400 <= status < 500
+    return isinstance(error, ValueError)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RateLimiter:
+    """분당 요청 수 / 분당 토큰 수 토큰 버킷"""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 최대 입력 토큰 수 (0이면 제한 없음)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_allowance = float(requests_per_minute)
+        self._token_allowance = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute:
+            self._request_allowance = min(
+                float(self.requests_per_minute),
+                self._request_allowance + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                float(self.tokens_per_minute),
+                self._token_allowance + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    def _reserve(self, tokens: int) -> float:
+        """허용량이 있으면 차감하고 0을, 없으면 기다려야 할 시간(초)을 반환"""
+        # 한 요청이 버킷 용량보다 크면 가득 찬 버킷 하나로 제한
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0
+            if self.requests_per_minute and self._request_allowance < 1:
+                wait = (1 - self._request_allowance) * 60.0 / self.requests_per_minute
+            if self.tokens_per_minute and self._token_allowance < tokens:
+                wait = max(
+                    wait,
+                    (tokens - self._token_allowance) * 60.0 / self.tokens_per_minute,
+                )
+            if wait <= 0:
+                if self.requests_per_minute:
+                    self._request_allowance -= 1
+                if self.tokens_per_minute:
+                    self._token_allowance -= tokens
+                return 0.0
+            self.waited_seconds += wait
+            return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """
+        요청 1건과 토큰 tokens개를 쓸 수 있을 때까지 대기 후 차감
+
+        Args:
+            tokens: 이번 요청의 추정 입력 토큰 수
+        """
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 0) -> None:
+        """acquire()의 asyncio 버전 (이벤트 루프를 막지 않고 대기)"""
+        while True:
+            wait = self._reserve(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def drain(self) -> None:
+        """429를 받았을 때 남은 허용량을 비워 버킷이 다시 찰 때까지 요청을 멈춤"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._request_allowance = min(self._request_allowance, 0.0)
+            self._token_allowance = min(self._token_allowance, 0.0)
+
+
+class AdaptiveConcurrency:
+    """429 응답에 따라 동시 요청 수를 조절하는 AIMD 제한"""
+
+    def __init__(self, max_limit: int, initial: Optional[int] = None, min_limit: int = 1):
+        """
+        Args:
+            max_limit: 최대 동시 요청 수
+            initial: 시작 동시 요청 수 (None이면 최대값의 절반)
+            min_limit: 최소 동시 요청 수
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        start = initial if initial is not None else (self.max_limit + 1) // 2
+        self.limit = max(self.min_limit, min(start, self.max_limit))
+        self.in_flight = 0
+        self.throttled = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+        # 슬롯을 기다리는 asyncio 대기자 (이벤트 루프, future)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def acquire(self) -> None:
+        """동시 요청 슬롯이 빌 때까지 대기"""
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """acquire()의 asyncio 버전 (스레드 경로와 같은 슬롯/제한값을 공유)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            # 슬롯 반환/제한값 변경 시 깨어나 다시 확인
+            await waiter
+
+    def _notify(self) -> None:
+        """스레드 대기자와 asyncio 대기자를 모두 깨움 (잠금을 잡은 상태에서 호출)"""
+        self._condition.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def release(self, throttled: bool = False) -> None:
+        """
+        슬롯 반환 및 동시 요청 수 조정
+
+        Args:
+            throttled: 이번 요청이 429로 거절되었는지 여부
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self._adjust(throttled)
+            self._notify()
+
+    def _adjust(self, throttled: bool) -> None:
+        if throttled:
+            self.throttled += 1
+            self._successes = 0
+            new_limit = max(self.min_limit, self.limit // 2)
+            if new_limit != self.limit:
+                logger.warning(f"임베딩 할당량 초과: 동시 요청 수 {self.limit} -> {new_limit}")
+            self.limit = new_limit
+        else:
+            # 현재 동시 요청 수만큼 연속 성공하면 하나 늘림
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self._successes = 0
+                self.limit += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"limit": self.limit, "max_limit": self.max_limit, "throttled": self.throttled}
@@ -1,6 +1,7 @@
 """
 PC 부품 검색 및 추천 모듈
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
@@ -31,6 +32,7 @@ class PCComponentRetriever:
         top_k: Optional[int] = None,
         category: Optional[str] = None,
         min_similarity: float = 0.5,
+        where: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         쿼리에 맞는 PC 부품 검색
@@ -40,6 +42,8 @@ class PCComponentRetriever:
             top_k: 검색 결과 수
             category: 특정 카테고리로 필터링 (예: "gpu")
             min_similarity: 최소 유사도 (0~1)
+            where: 추가 메타데이터 조건 (ChromaDB where 문법, 예: {"memory_gb": {"$gte": 12}})
+                숫자 컬럼이 네이티브 타입으로 저장되므로 벡터 DB 안에서 바로 필터링된다.
 
         Returns:
             검색 결과 리스트
@@ -47,7 +51,7 @@ class PCComponentRetriever:
         top_k = top_k or self.top_k
 
         # 메타데이터 필터 구성
-        filter_metadata = {"category": category} if category else None
+        filter_metadata = self._build_filter(category, where)
 
         # 벡터 검색 수행
         results = self.vector_store.search(
@@ -55,7 +59,35 @@ class PCComponentRetriever:
             top_k=top_k * 2,  # 필터링을 고려하여 더 많이 검색
             filter_metadata=filter_metadata,
         )
+        return self._select(results, query, top_k, category, min_similarity)
 
+    async def aretrieve(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        category: Optional[str] = None,
+        min_similarity: float = 0.5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """retrieve()의 asyncio 버전"""
+        top_k = top_k or self.top_k
+        filter_metadata = self._build_filter(category, where)
+        results = await self.vector_store.asearch(
+            query=query,
+            top_k=top_k * 2,
+            filter_metadata=filter_metadata,
+        )
+        return self._select(results, query, top_k, category, min_similarity)
+
+    @staticmethod
+    def _select(
+        results: List[Dict[str, Any]],
+        query: str,
+        top_k: int,
+        category: Optional[str],
+        min_similarity: float,
+    ) -> List[Dict[str, Any]]:
+        """유사도 기준으로 거른 뒤 상위 top_k개 선택"""
         # 유사도 필터링
         filtered_results = [r for r in results if r["similarity"] >= min_similarity]
 
@@ -69,6 +101,24 @@ class PCComponentRetriever:
 
         return filtered_results
 
+    @staticmethod
+    def _build_filter(
+        category: Optional[str], where: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """카테고리 조건과 추가 조건을 ChromaDB where 필터로 결합"""
+        conditions = []
+        if category:
+            conditions.append({"category": category})
+        if where:
+            # {"a": 1, "b": {"$gt": 2}} 형태는 조건별로 분리해 $and로 결합
+            conditions.extend({key: value} for key, value in where.items())
+
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
+
     def retrieve_by_specs(
         self,
         requirements: Dict[str, Any],
@@ -90,17 +140,7 @@ class PCComponentRetriever:
             카테고리별 검색 결과 딕셔너리
         """
         top_k = top_k or self.top_k
-
-        # 쿼리 문자열 생성
-        query_parts = []
-        if "purpose" in requirements:
-            query_parts.append(f"목적: {requirements['purpose']}")
-        if "budget" in requirements:
-            query_parts.append(f"예산: {requirements['budget']}만원")
-        if "preferences" in requirements:
-            query_parts.append(f"선호사항: {requirements['preferences']}")
-
-        base_query = " ".join(query_parts)
+        base_query = self._build_specs_query(requirements)
 
         # 카테고리별 검색
         results_by_category = {}
@@ -122,6 +162,42 @@ class PCComponentRetriever:
 
         return results_by_category
 
+    async def aretrieve_by_specs(
+        self,
+        requirements: Dict[str, Any],
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """retrieve_by_specs()의 asyncio 버전 (카테고리별 검색을 동시에 수행)"""
+        top_k = top_k or self.top_k
+        base_query = self._build_specs_query(requirements)
+        categories = requirements.get("categories", ["cpu", "gpu", "memory", "motherboard"])
+
+        results = await asyncio.gather(*(
+            self.aretrieve(query=f"{base_query} {category}", top_k=top_k, category=category)
+            for category in categories
+        ))
+        results_by_category = dict(zip(categories, results))
+
+        logger.info(
+            f"사양 기반 검색 완료: {len(categories)}개 카테고리, "
+            f"총 {sum(len(v) for v in results_by_category.values())}개 부품"
+        )
+
+        return results_by_category
+
+    @staticmethod
+    def _build_specs_query(requirements: Dict[str, Any]) -> str:
+        """요구사항 딕셔너리를 검색 쿼리 문자열로 변환"""
+        query_parts = []
+        if "purpose" in requirements:
+            query_parts.append(f"목적: {requirements['purpose']}")
+        if "budget" in requirements:
+            query_parts.append(f"예산: {requirements['budget']}만원")
+        if "preferences" in requirements:
+            query_parts.append(f"선호사항: {requirements['preferences']}")
+
+        return " ".join(query_parts)
+
     def retrieve_compatible_components(
         self,
         base_component: Dict[str, Any],
@@ -0,0 +1,205 @@
+"""
+CREATE TABLE 정의 기반 스키마 해석 모듈
+
+컬럼명이 없는 MySQL 덤프 INSERT 문의 위치 기반 값을 실제 컬럼명에 매핑하고,
+컬럼 타입에 맞춰 값을 파이썬 기본 타입(int/float/bool/date/datetime)으로 변환한다.
+"""
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+_CREATE_TABLE_RE = re.compile(
+    r"\s*CREATE\s+(?:TEMPORARY\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?\s*\(",
+    re.IGNORECASE,
+)
+_PRIMARY_KEY_RE = re.compile(r"PRIMARY\s+KEY\s*\(([^)]*)\)", re.IGNORECASE)
+
+# 컬럼 정의가 아닌 제약조건/인덱스 정의의 시작 키워드
+_CONSTRAINT_KEYWORDS = {
+    "PRIMARY", "KEY", "INDEX", "UNIQUE", "CONSTRAINT", "FOREIGN", "FULLTEXT", "SPATIAL", "CHECK",
+}
+
+_INT_TYPES = {"tinyint", "smallint", "mediumint", "int", "integer", "bigint", "year"}
+_FLOAT_TYPES = {"decimal", "numeric", "float", "double", "real"}
+_BOOL_TYPES = {"bool", "boolean"}
+_DATETIME_TYPES = {"datetime", "timestamp"}
+
+_TRUE_STRINGS = {"1", "true", "t", "y", "yes"}
+_FALSE_STRINGS = {"0", "false", "f", "n", "no"}
+
+
+class TableSchema:
+    """CREATE TABLE 문에서 추출한 테이블 구조"""
+
+    def __init__(
+        self,
+        name: str,
+        columns: List[str],
+        kinds: List[str],
+        primary_key: Optional[str] = None,
+    ):
+        """
+        Args:
+            name: 테이블명
+            columns: 컬럼명 리스트 (정의 순서)
+            kinds: 컬럼별 값 종류 (int, float, bool, date, datetime, str)
+            primary_key: 단일 컬럼 기본 키 (복합 키이거나 없으면 None)
+        """
+        self.name = name
+        self.columns = columns
+        self.kinds = kinds
+        self.primary_key = primary_key
+
+    def kind_map(self) -> Dict[str, str]:
+        """컬럼명 -> 값 종류 매핑"""
+        return dict(zip(self.columns, self.kinds))
+
+    def __repr__(self) -> str:
+        return f"TableSchema({self.name!r}, columns={len(self.columns)}, primary_key={self.primary_key!r})"
+
+
+def _split_definitions(body: str) -> List[str]:
+    """괄호/따옴표 깊이를 고려해 최상위 쉼표로 컬럼 정의 분리"""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    i = 0
+    length = len(body)
+    while i < length:
+        char = body[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in ("'", '"', "`"):
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            if depth == 0:
+                # CREATE TABLE 본문의 끝
+                parts.append(body[start:i])
+                return [p.strip() for p in parts if p.strip()]
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+        i += 1
+    parts.append(body[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _column_kind(type_spec: str) -> str:
+    """MySQL 컬럼 타입 문자열을 값 종류로 변환"""
+    type_spec = type_spec.lower()
+    base = re.match(r"[a-z]+", type_spec)
+    base = base.group() if base else ""
+
+    # tinyint(1)은 MySQL의 관례적인 불리언 컬럼
+    if base in _BOOL_TYPES or type_spec.startswith("tinyint(1)"):
+        return "bool"
+    if base in _INT_TYPES:
+        return "int"
+    if base in _FLOAT_TYPES:
+        return "float"
+    if base == "date":
+        return "date"
+    if base in _DATETIME_TYPES:
+        return "datetime"
+    return "str"
+
+
+def parse_create_table(statement: str) -> Optional[TableSchema]:
+    """
+    CREATE TABLE 문 파싱
+
+    Args:
+        statement: SQL CREATE TABLE 문
+
+    Returns:
+        테이블 스키마 (CREATE TABLE 문이 아니거나 컬럼이 없으면 None)
+    """
+    match = _CREATE_TABLE_RE.match(statement)
+    if not match:
+        return None
+
+    columns = []
+    kinds = []
+    primary_key = None
+
+    for definition in _split_definitions(statement[match.end():]):
+        first_word = definition.split(None, 1)[0].upper()
+        if first_word in _CONSTRAINT_KEYWORDS:
+            pk_match = _PRIMARY_KEY_RE.match(definition)
+            if pk_match:
+                pk_columns = [c.strip().strip("`") for c in pk_match.group(1).split(",")]
+                # 길이 지정(`col`(10)) 제거 후 단일 컬럼 키만 문서 ID로 사용
+                if len(pk_columns) == 1:
+                    primary_key = re.sub(r"\(.*$", "", pk_columns[0]).strip("`")
+            continue
+
+        if definition.startswith("`"):
+            end = definition.index("`", 1)
+            name = definition[1:end]
+            rest = definition[end + 1:].strip()
+        else:
+            name, _, rest = definition.partition(" ")
+            rest = rest.strip()
+
+        columns.append(name)
+        kinds.append(_column_kind(rest))
+
+    if not columns:
+        return None
+    return TableSchema(match.group(1), columns, kinds, primary_key)
+
+
+def convert_value(kind: str, value: Any) -> Any:
+    """
+    토큰화된 값을 컬럼 종류에 맞는 파이썬 타입으로 변환
+
+    변환할 수 없는 값은 원래 값을 그대로 반환한다.
+
+    Args:
+        kind: 컬럼 값 종류 (int, float, bool, date, datetime, str)
+        value: 토크나이저가 반환한 값
+
+    Returns:
+        변환된 값
+    """
+    if value is None:
+        return None
+    if kind == "str":
+        return value if isinstance(value, str) else str(value)
+
+    try:
+        if kind == "int":
+            if isinstance(value, int):
+                return value
+            return int(value) if not isinstance(value, float) else value
+        if kind == "float":
+            return float(value)
+        if kind == "bool":
+            if isinstance(value, (int, float)):
+                return bool(value)
+            lowered = str(value).strip().lower()
+            if lowered in _TRUE_STRINGS:
+                return True
+            if lowered in _FALSE_STRINGS:
+                return False
+            return value
+        if kind == "date":
+            if str(value).startswith("0000-00-00"):
+                return None
+            return date.fromisoformat(str(value)[:10])
+        if kind == "datetime":
+            if str(value).startswith("0000-00-00"):
+                return None
+            return datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return value
+
+    return value
+
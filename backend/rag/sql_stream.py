@@ -0,0 +1,178 @@
+"""
+SQL 덤프 스트리밍 분할 모듈
+
+덤프 파일 전체를 메모리에 올리지 않고 청크 단위로 읽으면서
+SQL 문 경계(;)를 직접 찾아 한 문장씩 돌려준다.
+"""
+import re
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Tuple
+
+# 1MB 단위로 읽기
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# 따옴표 밖에서 의미가 있는 토큰: 문장 끝, 따옴표/백틱, 주석 시작
+_OUTSIDE_RE = re.compile(rb"[;'\"`#]|--|/\*")
+# 따옴표 안에서 의미가 있는 토큰: 이스케이프 또는 닫는 따옴표
+_QUOTE_RES = {
+    ord("'"): re.compile(rb"[\\']"),
+    ord('"'): re.compile(rb'[\\"]'),
+    ord("`"): re.compile(rb"`"),
+}
+_BACKSLASH = ord("\\")
+_WHITESPACE = b" \t\r\n\f\v"
+
+
+def iter_file_chunks(file: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """바이너리 파일을 chunk_size 단위로 읽기"""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def iter_statement_spans(
+    chunks: Iterable[bytes], base_offset: int = 0
+) -> Iterator[Tuple[int, int, bytes]]:
+    """
+    바이트 청크 스트림에서 SQL 문을 하나씩 분리
+
+    따옴표(', ", `) 내부의 세미콜론과 백슬래시 이스케이프를 고려하며,
+    주석(--, #, /* */, MySQL 특수 주석 /*! */)은 문장에서 제거한다.
+    UTF-8 멀티바이트 문자는 ASCII 바이트를 포함하지 않으므로 바이트 단위로 안전하게 스캔할 수 있다.
+
+    Args:
+        chunks: 덤프 파일의 바이트 청크 이터러블
+        base_offset: 첫 청크의 파일 내 오프셋
+
+    Returns:
+        (시작 오프셋, 끝 오프셋, 주석이 제거된 문장 바이트) 이터레이터
+        끝 오프셋은 세미콜론 바로 다음 위치
+    """
+    buf = bytearray()
+    buf_offset = base_offset  # buf[0]의 파일 내 오프셋
+    stmt_start = 0  # 현재 문장의 buf 내 시작 위치
+    pieces = []  # 주석으로 잘린 현재 문장의 앞부분들
+    piece_start = 0  # 아직 pieces에 넣지 않은 구간의 시작
+    pos = 0  # 다음 스캔 위치
+    quote = None  # 현재 열려 있는 따옴표 (바이트 값)
+    eof = False
+    chunk_iter = iter(chunks)
+
+    def flush_statement(end: int):
+        pieces.append(bytes(buf[piece_start:end]))
+        data = b"".join(pieces).strip()
+        pieces.clear()
+        return data
+
+    while True:
+        need_more = False
+
+        if quote is not None:
+            match = _QUOTE_RES[quote].search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                need_more = True
+            else:
+                idx = match.start()
+                if buf[idx] == _BACKSLASH:
+                    if idx + 1 >= len(buf) and not eof:
+                        pos = idx
+                        need_more = True
+                    else:
+                        pos = idx + 2
+                elif idx + 1 < len(buf) and buf[idx + 1] == quote:
+                    # 연속된 따옴표('')는 이스케이프된 따옴표
+                    pos = idx + 2
+                elif idx + 1 >= len(buf) and not eof:
+                    pos = idx
+                    need_more = True
+                else:
+                    quote = None
+                    pos = idx + 1
+        else:
+            match = _OUTSIDE_RE.search(buf, pos)
+            if match is None:
+                # 청크 경계에 걸친 2바이트 토큰(--, /*)을 놓치지 않도록 마지막 바이트는 다시 스캔
+                pos = max(pos, len(buf) - 1)
+                need_more = True
+            else:
+                idx = match.start()
+                token = match.group()
+                if token == b";":
+                    stmt = flush_statement(idx)
+                    if stmt:
+                        yield buf_offset + stmt_start, buf_offset + idx + 1, stmt
+                    pos = piece_start = stmt_start = idx + 1
+                elif token in (b"'", b'"', b"`"):
+                    quote = token[0]
+                    pos = idx + 1
+                else:
+                    # 주석: -- 는 뒤에 공백이 와야 주석으로 인정 (MySQL 규칙)
+                    if token == b"--":
+                        if idx + 2 >= len(buf) and not eof:
+                            pos = idx
+                            need_more = True
+                        elif idx + 2 < len(buf) and buf[idx + 2] not in _WHITESPACE:
+                            pos = idx + 2
+                            token = None
+                    if token is not None and not need_more:
+                        if token == b"/*":
+                            end = buf.find(b"*/", idx + 2)
+                            comment_end = end + 2 if end != -1 else -1
+                        else:
+                            end = buf.find(b"\n", idx)
+                            comment_end = end + 1 if end != -1 else -1
+                        if comment_end == -1 and not eof:
+                            pos = idx
+                            need_more = True
+                        else:
+                            if comment_end == -1:
+                                comment_end = len(buf)
+                            pieces.append(bytes(buf[piece_start:idx]))
+                            # 주석 자리에 공백을 남겨 앞뒤 토큰이 붙지 않도록 함
+                            pieces.append(b" ")
+                            pos = piece_start = comment_end
+
+        if not need_more:
+            continue
+        if eof:
+            break
+
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            eof = True
+            continue
+
+        # 이미 처리한 문장은 버퍼에서 버려 메모리를 문장 하나 + 청크 하나 크기로 유지
+        if stmt_start:
+            del buf[:stmt_start]
+            buf_offset += stmt_start
+            pos -= stmt_start
+            piece_start -= stmt_start
+            stmt_start = 0
+        buf += chunk
+
+    # 마지막 문장 (세미콜론 없이 끝난 경우)
+    stmt = flush_statement(len(buf))
+    if stmt:
+        yield buf_offset + stmt_start, buf_offset + len(buf), stmt
+
+
+def iter_sql_statements(
+    sql_file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    SQL 덤프 파일에서 문장을 하나씩 읽기
+
+    Args:
+        sql_file_path: SQL 덤프 파일 경로
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Returns:
+        주석이 제거된 SQL 문 이터레이터
+    """
+    with open(sql_file_path, "rb") as f:
+        for _, _, stmt in iter_statement_spans(iter_file_chunks(f, chunk_size)):
+            yield stmt.decode("utf-8", errors="ignore")
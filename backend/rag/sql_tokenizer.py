@@ -0,0 +1,147 @@
+"""
+INSERT 문 VALUES 절 토크나이저
+
+VALUES (..),(..),... 를 한 번의 선형 스캔으로 튜플/필드 단위로 분리한다.
+MySQL 문자열 이스케이프(\\', '', \\n 등), NULL, 숫자 리터럴을 처리하며
+따옴표 안의 괄호와 쉼표는 값의 일부로 취급한다.
+"""
+import re
+from typing import Any, Iterator, List, Optional, Tuple
+
+# INSERT 헤더: INSERT [IGNORE] INTO `table` [(`col1`, `col2`)] VALUES
+_INSERT_HEADER_RE = re.compile(
+    r"\s*INSERT\s+(?:IGNORE\s+)?INTO\s+`?(\w+)`?\s*(?:\(([^)]*)\))?\s*VALUES\s*",
+    re.IGNORECASE,
+)
+
+# 필드 하나와 뒤따르는 구분자: 따옴표 문자열 / 숫자 / NULL / 기타 토큰(0x.., TRUE 등)
+# 뒤에 ',' 가 오면 같은 튜플의 다음 필드, ')' 가 오면 튜플 끝이며 '),(' 까지 한 번에 소비한다.
+# 문자열 패턴은 unrolled-loop 형태로 작성해 긴 문자열에서도 역추적이 없다.
+_FIELD_RE = re.compile(
+    r"""\s*(?:
+        '(?P<sq>[^'\\]*(?:(?:\\.|'')[^'\\]*)*)'
+      | (?P<num>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)(?=\s*[,)])
+      | (?P<null>NULL)(?=\s*[,)])
+      | "(?P<dq>[^"\\]*(?:(?:\\.|"")[^"\\]*)*)"
+      | (?P<bare>[^,()'"\s]+)
+    )\s*(?:(?P<sep>,)|\)\s*(?P<next>,\s*\()?)""",
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+_EMPTY_TUPLE_RE = re.compile(r"\s*\)\s*(?P<next>,\s*\()?")
+_WS_RE = re.compile(r"\s*")
+
+_ESCAPE_RE = re.compile(r"\\(.)|''|\"\"", re.DOTALL)
+_ESCAPES = {
+    "0": "\x00",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "Z": "\x1a",
+    # LIKE 패턴용 이스케이프는 MySQL에서도 백슬래시를 유지한다
+    "%": "\\%",
+    "_": "\\_",
+}
+
+
+def _unescape_match(match: "re.Match[str]") -> str:
+    char = match.group(1)
+    if char is None:
+        # '' 또는 "" -> 따옴표 하나
+        return match.group(0)[0]
+    return _ESCAPES.get(char, char)
+
+
+def unescape_string(value: str) -> str:
+    """MySQL 문자열 리터럴 내부의 이스케이프 시퀀스 해제"""
+    if "\\" not in value and "''" not in value and '""' not in value:
+        return value
+    return _ESCAPE_RE.sub(_unescape_match, value)
+
+
+def iter_value_tuples(sql: str, pos: int = 0) -> Iterator[List[Any]]:
+    """
+    VALUES 절의 튜플을 하나씩 파싱
+
+    Args:
+        sql: VALUES 절을 포함한 문자열
+        pos: 첫 번째 '(' 를 찾기 시작할 위치
+
+    Returns:
+        튜플별 값 리스트 이터레이터
+        (문자열은 str, 숫자는 int/float, NULL은 None)
+
+    Raises:
+        ValueError: 문법이 맞지 않는 위치를 만난 경우
+    """
+    field_match = _FIELD_RE.match
+    unescape = unescape_string
+
+    pos = _WS_RE.match(sql, pos).end()
+    if pos >= len(sql):
+        return
+    if sql[pos] != "(":
+        raise ValueError(f"'(' 가 필요합니다 (위치 {pos}): {sql[pos:pos + 50]!r}")
+    pos += 1
+
+    row = []
+    while True:
+        match = field_match(sql, pos)
+        if match is None:
+            # 빈 튜플 ()
+            empty = None if row else _EMPTY_TUPLE_RE.match(sql, pos)
+            if empty is None:
+                raise ValueError(f"값을 해석할 수 없습니다 (위치 {pos}): {sql[pos:pos + 50]!r}")
+            pos = empty.end()
+            yield []
+            if empty.group("next") is None:
+                break
+            continue
+
+        sq, num, null, dq, bare, sep, next_tuple = match.groups()
+        if sq is not None:
+            row.append(unescape(sq))
+        elif num is not None:
+            if "." in num or "e" in num or "E" in num:
+                row.append(float(num))
+            else:
+                row.append(int(num))
+        elif null is not None:
+            row.append(None)
+        elif dq is not None:
+            row.append(unescape(dq))
+        else:
+            row.append(bare)
+        pos = match.end()
+
+        if sep is None:
+            yield row
+            row = []
+            if next_tuple is None:
+                break
+
+    # 마지막 튜플 뒤에는 공백이나 세미콜론만 허용
+    rest = sql[pos:].strip()
+    if rest and rest != ";":
+        raise ValueError(f"VALUES 절 뒤에 예상치 못한 내용이 있습니다 (위치 {pos}): {rest[:50]!r}")
+
+
+def parse_insert_header(statement: str) -> Tuple[Optional[str], Optional[List[str]], int]:
+    """
+    INSERT 문 헤더에서 테이블명과 컬럼 목록 추출
+
+    Args:
+        statement: SQL INSERT 문
+
+    Returns:
+        (테이블명, 컬럼 리스트 또는 None, VALUES 절 시작 위치)
+        INSERT 문이 아니면 (None, None, 0)
+    """
+    match = _INSERT_HEADER_RE.match(statement)
+    if not match:
+        return None, None, 0
+
+    columns = None
+    if match.group(2):
+        columns = [col.strip().strip("`") for col in match.group(2).split(",")]
+    return match.group(1), columns, match.end()
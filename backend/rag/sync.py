@@ -0,0 +1,151 @@
+"""
+updated_at 기반 증분 동기화
+
+테이블별로 마지막으로 반영한 updated_at(하이 워터 마크)을 기억해 두고,
+다음 동기화 때는 그 시각 이후(같은 시각 포함)에 바뀐 행만 골라 다시 임베딩/업서트한다.
+updated_at은 초 단위라 마크와 같은 시각에 나중에 커밋된 행이 있을 수 있으므로,
+마크와 같은 시각의 행은 매번 다시 반영한다 (업서트라 중복 반영해도 결과는 같음).
+상태는 입력 소스(덤프 파일 또는 DB)별로 JSON 파일에 저장한다.
+전체 구축도 읽은 행의 최대 updated_at을 기록하므로 구축 직후의 동기화는 바뀐 행만 반영한다.
+
+삭제된 행은 updated_at으로 감지할 수 없으므로 전체 재구축으로 정리해야 한다.
+"""
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from loguru import logger
+
+from .config import SYNC_STATE_PATH
+from .sql_schema import convert_value
+
+# 변경 감지에 사용하는 컬럼
+UPDATED_AT_COLUMN = "updated_at"
+
+
+def _as_datetime(value: Any) -> Optional[datetime]:
+    """updated_at 값을 datetime으로 변환 (변환할 수 없으면 None)"""
+    if isinstance(value, datetime):
+        return value
+    value = convert_value("datetime", value)
+    return value if isinstance(value, datetime) else None
+
+
+class SyncState:
+    """소스별 테이블 하이 워터 마크 저장소"""
+
+    def __init__(self, state_path: Path = SYNC_STATE_PATH):
+        """
+        Args:
+            state_path: 상태 JSON 파일 경로
+        """
+        self.state_path = Path(state_path)
+
+    def _read(self) -> Dict[str, Any]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"동기화 상태 파일을 읽지 못했습니다: {str(e)}")
+            return {}
+
+    def load(self, source_key: str) -> Dict[str, datetime]:
+        """
+        소스의 테이블별 하이 워터 마크 조회
+
+        Args:
+            source_key: 입력 소스 식별자
+
+        Returns:
+            테이블명 -> 마지막으로 반영한 updated_at
+        """
+        marks = self._read().get(source_key, {})
+        return {table: datetime.fromisoformat(mark) for table, mark in marks.items()}
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        """임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 상태 파일이 깨지지 않도록 저장"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def save(self, source_key: str, marks: Dict[str, datetime]) -> None:
+        """소스의 하이 워터 마크 저장 (기존 테이블 값과 병합)"""
+        state = self._read()
+        merged = state.get(source_key, {})
+        merged.update({table: mark.isoformat() for table, mark in marks.items()})
+        state[source_key] = merged
+        self._write(state)
+
+    def reset(self, source_key: str) -> None:
+        """소스의 하이 워터 마크 삭제 (다음 동기화는 전체 반영)"""
+        state = self._read()
+        if state.pop(source_key, None) is not None:
+            self._write(state)
+
+
+class ChangeTracker:
+    """레코드 스트림에서 하이 워터 마크 이후 변경된 행만 골라내기"""
+
+    def __init__(self, marks: Dict[str, datetime]):
+        """
+        Args:
+            marks: 테이블명 -> 이전 동기화의 하이 워터 마크
+        """
+        self.marks = marks
+        self.new_marks: Dict[str, datetime] = dict(marks)
+        self.changed: Dict[str, int] = {}
+        self.skipped_tables = set()
+
+    def iter_observed(
+        self, records: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        모든 레코드를 그대로 반환하면서 테이블별 새 하이 워터 마크만 갱신 (전체 구축용)
+
+        Args:
+            records: (테이블명, 레코드) 이터러블
+
+        Returns:
+            입력과 같은 (테이블명, 레코드) 이터레이터
+        """
+        for table_name, record in records:
+            updated_at = _as_datetime(record.get(UPDATED_AT_COLUMN))
+            if updated_at is not None and (
+                table_name not in self.new_marks or updated_at > self.new_marks[table_name]
+            ):
+                self.new_marks[table_name] = updated_at
+            yield table_name, record
+
+    def iter_changed(
+        self, records: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        변경된 레코드만 반환하면서 테이블별 새 하이 워터 마크 갱신
+
+        Args:
+            records: (테이블명, 레코드) 이터러블
+
+        Returns:
+            updated_at이 하이 워터 마크 이후(같은 시각 포함)인 (테이블명, 레코드) 이터레이터
+        """
+        for table_name, record in records:
+            updated_at = _as_datetime(record.get(UPDATED_AT_COLUMN))
+            if updated_at is None:
+                # updated_at이 없는 테이블은 변경 여부를 알 수 없어 동기화 대상에서 제외
+                if table_name not in self.skipped_tables:
+                    self.skipped_tables.add(table_name)
+                    logger.warning(f"테이블 '{table_name}'에 updated_at 값이 없어 동기화에서 제외합니다.")
+                continue
+
+            mark = self.marks.get(table_name)
+            if mark is not None and updated_at < mark:
+                continue
+
+            self.changed[table_name] = self.changed.get(table_name, 0) + 1
+            if table_name not in self.new_marks or updated_at > self.new_marks[table_name]:
+                self.new_marks[table_name] = updated_at
+            yield table_name, record
@@ -1,14 +1,77 @@
 """
 ChromaDB를 사용한 벡터 데이터베이스 관리
 """
+import asyncio
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from collections.abc import Sized
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from pathlib import Path
+import numpy as np
 from loguru import logger
 
 from .config import CHROMA_PERSIST_DIRECTORY, CHROMA_COLLECTION_NAME
-from .embedder import GeminiEmbedder
+from .embedders import Embedder, create_embedder, embedder_signature
+from .checkpoint import CONTENT_HASH_KEY, BuildCheckpoint, content_hash
+from .ingest import DROP, StagedPipeline
+
+
+_METADATA_TYPES = (bool, int, float, str)
+
+
+def clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    메타데이터를 ChromaDB가 받는 형태로 정제
+
+    None/빈 값은 제거하고 bool, int, float, str 외의 타입은 문자열로 변환한다.
+    이미 정제된 딕셔너리는 복사하지 않고 그대로 반환한다.
+
+    Args:
+        metadata: 원본 메타데이터
+
+    Returns:
+        정제된 메타데이터
+    """
+    for v in metadata.values():
+        if v is None or v == "" or not isinstance(v, _METADATA_TYPES):
+            break
+    else:
+        return metadata
+
+    cleaned = {}
+    for k, v in metadata.items():
+        # None 값 또는 빈 값 건너뛰기
+        if v is None or v == "":
+            continue
+        # 지원되는 타입만 추가 (bool, int, float, str)
+        if isinstance(v, (bool, int, float)):
+            cleaned[k] = v
+        else:
+            # 기타 타입은 문자열로 변환
+            cleaned[k] = str(v)
+    return cleaned
+
+
+def document_id(document: Dict[str, Any], index: int) -> str:
+    """
+    문서 ID (문서에 지정된 ID, 없으면 카테고리 + 메타데이터 ID 또는 입력 위치)
+
+    Args:
+        document: 'text'와 'metadata' 키를 가진 문서
+        index: 입력 스트림에서의 위치
+
+    Returns:
+        컬렉션 문서 ID
+    """
+    metadata = document["metadata"]
+    return document.get("id") or f"{metadata.get('category', 'unknown')}_{metadata.get('id', index)}"
+
+
+def hashed_metadata(text: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """정제한 메타데이터에 원본 내용 해시를 더한 복사본"""
+    cleaned = clean_metadata(metadata)
+    return {**cleaned, CONTENT_HASH_KEY: content_hash(text, cleaned)}
 
 
 class PCComponentVectorStore:
@@ -18,17 +81,23 @@ class PCComponentVectorStore:
         self,
         persist_directory: str = CHROMA_PERSIST_DIRECTORY,
         collection_name: str = CHROMA_COLLECTION_NAME,
-        embedder: Optional[GeminiEmbedder] = None,
+        embedder: Optional[Embedder] = None,
     ):
         """
         Args:
             persist_directory: ChromaDB 저장 디렉토리
             collection_name: 컬렉션 이름
-            embedder: 임베딩 생성기 (None이면 자동 생성)
+            embedder: 임베딩 생성기 (None이면 EMBEDDING_BACKEND 설정으로 생성)
         """
         self.persist_directory = Path(persist_directory)
         self.collection_name = collection_name
-        self.embedder = embedder or GeminiEmbedder()
+        self.embedder = embedder or create_embedder()
+        # 마지막 add_documents()에서 임베딩에 실패해 건너뛴 문서 목록
+        self.failed_documents: List[Dict[str, Any]] = []
+        # 마지막 add_documents()에서 체크포인트 기록으로 건너뛴(이미 저장된) 문서 수
+        self.skipped_documents = 0
+        # 마지막 add_documents()의 단계별 처리량 (준비 / 임베딩 / 저장)
+        self.ingest_stats: Dict[str, Any] = {}
 
         # ChromaDB 클라이언트 초기화
         self.persist_directory.mkdir(parents=True, exist_ok=True)
@@ -47,79 +116,286 @@ class PCComponentVectorStore:
         )
 
     def _get_or_create_collection(self):
-        """컬렉션 가져오기 또는 생성"""
+        """컬렉션 가져오기 또는 생성 (임베딩 백엔드/모델/차원을 메타데이터에 기록)"""
+        signature = embedder_signature(self.embedder)
         try:
             collection = self.client.get_collection(name=self.collection_name)
             logger.info(f"기존 컬렉션 로드: {self.collection_name}")
         except Exception:
             collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"hnsw:space": "cosine"},  # 코사인 유사도 사용
+                metadata={"hnsw:space": "cosine", **signature},  # 코사인 유사도 사용
             )
-            logger.info(f"새 컬렉션 생성: {self.collection_name}")
+            logger.info(f"새 컬렉션 생성: {self.collection_name} ({signature})")
+            self._mismatch = None
+            return collection
 
+        self._mismatch = self._check_signature(collection.metadata or {}, signature)
+        if self._mismatch:
+            logger.error(self._mismatch)
         return collection
 
+    def _check_signature(
+        self, metadata: Dict[str, Any], signature: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        컬렉션을 만든 임베딩과 현재 임베딩 생성기가 같은지 확인
+
+        Returns:
+            일치하지 않으면 오류 메시지, 일치하면 None
+        """
+        if "embedding_backend" not in metadata:
+            # 백엔드 기록 이전에 만든 컬렉션은 Gemini 임베딩으로 구축됨
+            if signature["embedding_backend"] != "gemini":
+                return (
+                    f"컬렉션 '{self.collection_name}'은 Gemini 임베딩으로 구축되었습니다. "
+                    f"'{signature['embedding_backend']}' 백엔드로 사용하려면 --force로 재구축하세요."
+                )
+            logger.warning(f"컬렉션 '{self.collection_name}'에 임베딩 백엔드 정보가 없습니다.")
+            return None
+
+        stored = {key: metadata.get(key) for key in signature}
+        if stored != signature:
+            return (
+                f"컬렉션 '{self.collection_name}'의 임베딩 설정이 현재 설정과 다릅니다: "
+                f"컬렉션={stored}, 현재={signature}. "
+                "같은 설정을 사용하거나 --force로 재구축하세요."
+            )
+        return None
+
+    def _ensure_compatible(self) -> None:
+        """
+        다른 백엔드/모델/차원으로 만든 컬렉션이면 ValueError
+
+        서로 다른 임베딩의 벡터는 같은 공간에 있지 않아 검색 결과가 무의미하다.
+        컬렉션 삭제(재구축)는 허용해야 하므로 로드 시점이 아닌 읽기/쓰기 시점에 확인한다.
+        """
+        if self._mismatch:
+            raise ValueError(self._mismatch)
+
     def add_documents(
         self,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         batch_size: int = 500,
-    ) -> None:
+        upsert: bool = False,
+        checkpoint: Optional[BuildCheckpoint] = None,
+        seen_ids: Optional[set] = None,
+    ) -> int:
         """
         문서들을 벡터 데이터베이스에 추가
 
+        리스트뿐 아니라 제너레이터도 받을 수 있으며, 이 경우 batch_size만큼씩
+        꺼내 처리하므로 전체 문서를 메모리에 올리지 않는다.
+        문서 준비(정제/ID/해시), 임베딩, ChromaDB 저장은 단계별 스레드로 겹쳐 실행하고
+        (큐 깊이 INGEST_QUEUE_DEPTH), 단계별 처리량은 self.ingest_stats에 기록한다.
+        임베딩에 실패한 문서는 건너뛰고 self.failed_documents에 기록한다.
+        메타데이터에는 원본 내용 해시(content_hash)를 함께 저장한다.
+
+        checkpoint를 지정하면 배치를 저장할 때마다 문서 ID와 내용 해시를 기록하고,
+        중단된 구축을 이어서 진행하는 경우 체크포인트와 컬렉션 모두에 같은 해시로
+        저장된 문서는 임베딩하지 않고 건너뛴다.
+
         Args:
-            documents: 문서 리스트 (각 문서는 'text'와 'metadata' 키 포함)
+            documents: 문서 리스트 또는 이터러블 (각 문서는 'text'와 'metadata' 키 포함)
             batch_size: 배치 크기
+            upsert: True면 같은 ID의 기존 문서를 덮어씀 (증분 동기화용)
+            checkpoint: 구축 체크포인트 (None이면 기록하지 않음)
+            seen_ids: 지정하면 입력 스트림의 모든 문서 ID를 추가 (건너뛰거나 실패한 문서 포함,
+                선택 카테고리 교체 후 delete_stale()에 사용)
+
+        Returns:
+            추가된 문서 수 (임베딩에 실패했거나 이미 저장되어 건너뛴 문서 제외)
         """
-        logger.info(f"{len(documents)}개의 문서를 추가 중...")
-
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            
-            # 텍스트 추출
-            texts = [doc["text"] for doc in batch]
-            
-            # 메타데이터 정제: None 값 제거
-            cleaned_metadatas = []
-            for doc in batch:
-                metadata = {}
-                for k, v in doc["metadata"].items():
-                    # None 값 또는 빈 값 건너뛰기
-                    if v is None or v == "":
-                        continue
-                    # 지원되는 타입만 추가 (bool, int, float, str)
-                    if isinstance(v, (bool, int, float)):
-                        metadata[k] = v
-                    else:
-                        # 기타 타입은 문자열로 변환
-                        metadata[k] = str(v)
-                cleaned_metadatas.append(metadata)
-            
-            # ID 생성 (카테고리 + 인덱스)
-            ids = [
-                f"{doc['metadata'].get('category', 'unknown')}_{doc['metadata'].get('id', i + j)}"
-                for j, doc in enumerate(batch)
-            ]
-
-            # 임베딩 생성
-            logger.debug(f"배치 {i // batch_size + 1}: 임베딩 생성 중...")
-            embeddings = self.embedder.embed_batch(texts, task_type="RETRIEVAL_DOCUMENT")
-
-            # ChromaDB에 추가
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=cleaned_metadatas,
+        self._ensure_compatible()
+        self.failed_documents = []
+        self.skipped_documents = 0
+        # 이어서 구축할 때는 중단 직전 배치가 일부 저장되었을 수 있으므로 덮어씀
+        resuming = checkpoint is not None and checkpoint.resumed
+        write = self.collection.upsert if upsert or resuming else self.collection.add
+        total = len(documents) if isinstance(documents, Sized) else None
+        if total is not None:
+            logger.info(f"{total}개의 문서를 추가 중...")
+        else:
+            logger.info("문서 스트림을 추가 중...")
+
+        added = 0
+
+        def read_batches() -> Iterator[Dict[str, Any]]:
+            doc_iter = iter(documents)
+            start = 0
+            batch_index = 0
+            while True:
+                docs = list(islice(doc_iter, batch_size))
+                if not docs:
+                    return
+                batch_index += 1
+                yield {"index": batch_index, "start": start, "docs": docs}
+                start += len(docs)
+
+        def prepare(batch: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            docs = batch["docs"]
+            # 메타데이터 정제: None 값 제거 + 원본 내용 해시 기록
+            metadatas = [hashed_metadata(doc["text"], doc["metadata"]) for doc in docs]
+            # ID 생성 (문서에 지정된 ID, 없으면 카테고리 + 인덱스)
+            ids = [document_id(doc, batch["start"] + j) for j, doc in enumerate(docs)]
+            if seen_ids is not None:
+                seen_ids.update(ids)
+
+            if resuming:
+                done = self._committed_indices(checkpoint, ids, metadatas)
+                if done:
+                    self.skipped_documents += len(done)
+                    keep = [j for j in range(len(docs)) if j not in done]
+                    docs = [docs[j] for j in keep]
+                    metadatas = [metadatas[j] for j in keep]
+                    ids = [ids[j] for j in keep]
+                    if not docs:
+                        logger.debug(f"배치 {batch['index']}: 모두 저장되어 있어 건너뜀")
+                        return DROP
+
+            return {
+                "index": batch["index"],
+                "end": batch["start"] + len(batch["docs"]),
+                "docs": docs,
+                "ids": ids,
+                "texts": [doc["text"] for doc in docs],
+                "metadatas": metadatas,
+            }
+
+        def embed(batch: Dict[str, Any]) -> Dict[str, Any]:
+            logger.debug(f"배치 {batch['index']}: 임베딩 생성 중...")
+            embeddings, failures = self.embedder.embed_batch_with_failures(
+                batch["texts"], task_type="RETRIEVAL_DOCUMENT"
             )
 
-            logger.info(
-                f"진행: {min(i + batch_size, len(documents))}/{len(documents)} "
-                f"({(min(i + batch_size, len(documents)) / len(documents) * 100):.1f}%)"
-            )
+            # 임베딩에 실패한 문서는 건너뛰고 기록
+            if failures:
+                docs, ids = batch["docs"], batch["ids"]
+                failed_indices = {failure["index"] for failure in failures}
+                for failure in failures:
+                    self.failed_documents.append({
+                        "id": ids[failure["index"]],
+                        "category": docs[failure["index"]]["metadata"].get("category"),
+                        "error": failure["error"],
+                        "text": failure["text"],
+                    })
+                logger.warning(f"배치 {batch['index']}: {len(failures)}개 문서 임베딩 실패, 건너뜀")
+                keep = [j for j in range(len(docs)) if j not in failed_indices]
+                embeddings = embeddings[keep]
+                for key in ("docs", "ids", "texts", "metadatas"):
+                    batch[key] = [batch[key][j] for j in keep]
+
+            batch["embeddings"] = embeddings
+            return batch
+
+        def store(batch: Dict[str, Any]) -> None:
+            nonlocal added
+            ids = batch["ids"]
+            # ChromaDB에 추가 (float32 배열을 그대로 전달)
+            if ids:
+                write(
+                    ids=ids,
+                    embeddings=batch["embeddings"],
+                    documents=batch["texts"],
+                    metadatas=batch["metadatas"],
+                )
+                # 컬렉션에 저장된 뒤에만 기록 (기록 전에 중단되면 다음 실행에서 다시 저장)
+                if checkpoint is not None:
+                    checkpoint.commit({
+                        doc_id: metadata[CONTENT_HASH_KEY]
+                        for doc_id, metadata in zip(ids, batch["metadatas"])
+                    })
+            added += len(ids)
+
+            processed = batch["end"]
+            if total:
+                logger.info(f"진행: {processed}/{total} ({(processed / total * 100):.1f}%)")
+            else:
+                logger.info(f"진행: {added}개 추가됨")
+
+        # 준비 -> 임베딩 -> 저장을 겹쳐 실행 (단계 사이 큐가 가득 차면 앞 단계가 대기)
+        stages = StagedPipeline(
+            [("prepare", prepare), ("embed", embed), ("write", store)],
+            size=lambda batch: len(batch["docs"]),
+        )
+        try:
+            stages.run(read_batches())
+        finally:
+            self.ingest_stats = stages.stats()
 
+        stage_stats = self.ingest_stats["stages"]
+        logger.info(
+            "적재 단계 처리량 (문서/초): "
+            + ", ".join(f"{name}={s['items_per_second']}" for name, s in stage_stats.items())
+            + f" / 경과 {self.ingest_stats['wall_seconds']}초"
+        )
+        if self.skipped_documents:
+            logger.info(f"이전 실행에서 저장되어 건너뛴 문서: {self.skipped_documents}개")
+        if self.failed_documents:
+            logger.warning(f"임베딩 실패로 건너뛴 문서: {len(self.failed_documents)}개")
         logger.info(f"문서 추가 완료. 총 아이템 수: {self.collection.count()}")
+        return added
+
+    def _committed_indices(
+        self,
+        checkpoint: BuildCheckpoint,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> set:
+        """
+        배치에서 이전 실행이 같은 내용 해시로 저장한 문서 위치
+
+        체크포인트에 기록된 문서만 컬렉션에서 조회해 실제로 같은 해시로 저장되어 있는지 확인한다.
+
+        Returns:
+            건너뛸 배치 내 인덱스 집합
+        """
+        candidates = {
+            doc_id: j for j, doc_id in enumerate(ids)
+            if checkpoint.is_committed(doc_id, metadatas[j][CONTENT_HASH_KEY])
+        }
+        if not candidates:
+            return set()
+        stored = self.collection.get(ids=list(candidates), include=["metadatas"])
+        return {
+            candidates[doc_id]
+            for doc_id, metadata in zip(stored["ids"], stored["metadatas"])
+            if (metadata or {}).get(CONTENT_HASH_KEY)
+            == metadatas[candidates[doc_id]][CONTENT_HASH_KEY]
+        }
+
+    def add_embedded_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        embeddings: np.ndarray,
+        upsert: bool = False,
+    ) -> int:
+        """
+        이미 임베딩한 문서 배치를 저장 (오프라인 배치 작업 결과 적재용)
+
+        Args:
+            documents: 'id', 'text', 'metadata' 키를 가진 문서 리스트
+            embeddings: 문서 순서대로의 (문서 수, 차원) float32 배열
+            upsert: True면 같은 ID의 기존 문서를 덮어씀
+
+        Returns:
+            저장한 문서 수
+        """
+        self._ensure_compatible()
+        if not documents:
+            return 0
+        if len(embeddings) != len(documents):
+            raise ValueError(
+                f"임베딩 수가 문서 수와 다릅니다: {len(embeddings)} != {len(documents)}"
+            )
+        write = self.collection.upsert if upsert else self.collection.add
+        write(
+            ids=[doc["id"] for doc in documents],
+            embeddings=embeddings,
+            documents=[doc["text"] for doc in documents],
+            metadatas=[hashed_metadata(doc["text"], doc["metadata"]) for doc in documents],
+        )
+        return len(documents)
 
     def search(
         self,
@@ -138,9 +414,38 @@ class PCComponentVectorStore:
         Returns:
             검색 결과 리스트
         """
+        self._ensure_compatible()
+
         # 쿼리 임베딩 생성
         query_embedding = self.embedder.embed_query(query)
+        return self._search_by_embedding(query, query_embedding, top_k, filter_metadata)
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        search()의 asyncio 버전
+
+        쿼리 임베딩은 비동기 API로 생성하고, 동기 API인 ChromaDB 조회는
+        스레드에서 실행하여 이벤트 루프를 막지 않는다.
+        """
+        self._ensure_compatible()
+        query_embedding = await self.embedder.aembed_query(query)
+        return await asyncio.to_thread(
+            self._search_by_embedding, query, query_embedding, top_k, filter_metadata
+        )
 
+    def _search_by_embedding(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """임베딩 벡터로 ChromaDB 검색 후 결과 포맷팅"""
         # 검색 수행
         results = self.collection.query(
             query_embeddings=[query_embedding],
@@ -194,6 +499,94 @@ class PCComponentVectorStore:
 
         return formatted_results
 
+    def iter_metadatas(
+        self, where: Dict[str, Any], batch_size: int = 5000
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        조건에 맞는 문서의 (ID, 메타데이터)를 batch_size씩 나눠 조회
+
+        Args:
+            where: 메타데이터 필터 (예: {"category": "cpu"})
+            batch_size: 한 번에 조회할 문서 수
+
+        Returns:
+            (문서 ID, 메타데이터) 이터레이터
+        """
+        offset = 0
+        while True:
+            result = self.collection.get(
+                where=where, limit=batch_size, offset=offset, include=["metadatas"]
+            )
+            if not result["ids"]:
+                return
+            yield from zip(result["ids"], result["metadatas"])
+            offset += len(result["ids"])
+
+    def get_documents(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        ID로 저장된 문서 조회 (다시 저장할 수 있도록 메타데이터에서 내용 해시는 뺌)
+
+        Args:
+            ids: 문서 ID 리스트
+
+        Returns:
+            'id', 'text', 'metadata' 키를 가진 문서 리스트 (없는 ID는 제외)
+        """
+        if not ids:
+            return []
+        result = self.collection.get(ids=list(ids), include=["documents", "metadatas"])
+        documents = []
+        for doc_id, text, metadata in zip(result["ids"], result["documents"], result["metadatas"]):
+            metadata = {k: v for k, v in (metadata or {}).items() if k != CONTENT_HASH_KEY}
+            documents.append({"id": doc_id, "text": text, "metadata": metadata})
+        return documents
+
+    def has_merged_variants(self) -> bool:
+        """유사 중복 병합으로 만든 대표 문서(variant_count 2 이상)가 있는지 확인"""
+        result = self.collection.get(where={"variant_count": {"$gt": 1}}, limit=1, include=[])
+        return bool(result["ids"])
+
+    def delete_by_category(self, categories: List[str]) -> None:
+        """
+        특정 카테고리의 문서만 삭제
+
+        Args:
+            categories: 삭제할 부품 카테고리 리스트 (예: ["cpu", "gpu"])
+        """
+        self.collection.delete(where={"category": {"$in": list(categories)}})
+        logger.warning(f"카테고리 문서 삭제됨: {categories}")
+
+    def delete_stale(self, categories: List[str], keep_ids: set, batch_size: int = 5000) -> int:
+        """
+        카테고리 문서 중 keep_ids에 없는 문서만 삭제 (선택 카테고리 교체 마무리)
+
+        새 문서를 먼저 업서트한 뒤 호출하므로, 구축이 중간에 실패해도
+        해당 카테고리가 비지 않고 이전 문서가 남는다.
+
+        Args:
+            categories: 교체한 부품 카테고리 리스트
+            keep_ids: 이번 구축에서 다시 쓴 문서 ID
+            batch_size: 한 번에 조회/삭제할 ID 수
+
+        Returns:
+            삭제한 문서 수
+        """
+        where = {"category": {"$in": list(categories)}}
+        stale: List[str] = []
+        offset = 0
+        while True:
+            ids = self.collection.get(where=where, limit=batch_size, offset=offset, include=[])["ids"]
+            if not ids:
+                break
+            stale.extend(doc_id for doc_id in ids if doc_id not in keep_ids)
+            offset += len(ids)
+
+        for start in range(0, len(stale), batch_size):
+            self.collection.delete(ids=stale[start:start + batch_size])
+        if stale:
+            logger.warning(f"카테고리 {categories}에서 입력에 없는 문서 {len(stale)}개 삭제됨")
+        return len(stale)
+
     def delete_collection(self) -> None:
         """컬렉션 삭제 (데이터 초기화)"""
         self.client.delete_collection(name=self.collection_name)
@@ -0,0 +1,126 @@
+"""
+INSERT VALUES 토크나이저 마이크로 벤치마크
+
+기존 정규식 + 문자 단위 분리 방식과 단일 패스 토크나이저(rag/sql_tokenizer.py)의
+초당 처리 행 수를 같은 SQL 덤프에서 비교합니다.
+"""
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+
+from loguru import logger
+
+from backend.rag.config import SQL_DUMP_PATH
+from backend.rag.sql_stream import iter_sql_statements
+from backend.rag.sql_tokenizer import iter_value_tuples, parse_insert_header
+
+# 기존 구현 (비교 기준)
+_LEGACY_GROUP_RE = re.compile(r'\(([^()]*(?:\([^()]*\)[^()]*)*)\)')
+_LEGACY_VALUES_RE = re.compile(r"VALUES\s*(.+);?\s*$", re.IGNORECASE | re.DOTALL)
+
+
+def _legacy_split_values(value_string: str) -> List[str]:
+    values = []
+    current_value = ""
+    in_quotes = False
+    quote_char = None
+
+    for char in value_string:
+        if char in ("'", '"') and (not in_quotes or char == quote_char):
+            in_quotes = not in_quotes
+            quote_char = char if in_quotes else None
+            current_value += char
+        elif char == "," and not in_quotes:
+            values.append(current_value.strip())
+            current_value = ""
+        else:
+            current_value += char
+
+    if current_value:
+        values.append(current_value.strip())
+
+    return values
+
+
+def legacy_parse_rows(statement: str) -> int:
+    """기존 방식으로 INSERT 문 하나를 파싱하고 행 수 반환"""
+    values_match = _LEGACY_VALUES_RE.search(statement)
+    if not values_match:
+        return 0
+    rows = 0
+    for value_group in _LEGACY_GROUP_RE.findall(values_match.group(1)):
+        values = _legacy_split_values(value_group)
+        [v.strip().strip("'\"") for v in values]
+        rows += 1
+    return rows
+
+
+def tokenizer_parse_rows(statement: str) -> int:
+    """단일 패스 토크나이저로 INSERT 문 하나를 파싱하고 행 수 반환"""
+    table_name, _, pos = parse_insert_header(statement)
+    if not table_name:
+        return 0
+    return sum(1 for _ in iter_value_tuples(statement, pos))
+
+
+def run_benchmark(name: str, parse_fn, statements: List[str], repeat: int) -> float:
+    """parse_fn을 repeat회 실행하고 최고 기록의 초당 행 수 반환"""
+    best = None
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = sum(parse_fn(stmt) for stmt in statements)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    rate = rows / best if best else 0.0
+    logger.info(f"{name:<12} {rows:>10,}행  {best:8.3f}초  {rate:>12,.0f} rows/s")
+    return rate
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="INSERT VALUES 토크나이저 벤치마크")
+    parser.add_argument(
+        "--sql-file",
+        type=str,
+        default=str(SQL_DUMP_PATH),
+        help="SQL 덤프 파일 경로",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="반복 횟수 (최고 기록 사용)",
+    )
+    args = parser.parse_args()
+
+    sql_file = Path(args.sql_file)
+    if not sql_file.exists():
+        logger.error(f"SQL 파일을 찾을 수 없습니다: {sql_file}")
+        sys.exit(1)
+
+    statements = [
+        stmt for stmt in iter_sql_statements(sql_file)
+        if stmt[:100].upper().startswith("INSERT")
+    ]
+    logger.info(f"SQL 파일: {sql_file}")
+    logger.info(f"INSERT 문: {len(statements)}개, {sum(len(s) for s in statements) / 1024 / 1024:.2f} MB")
+
+    legacy_rate = run_benchmark("legacy", legacy_parse_rows, statements, args.repeat)
+    tokenizer_rate = run_benchmark("tokenizer", tokenizer_parse_rows, statements, args.repeat)
+
+    if legacy_rate:
+        logger.info(f"속도 향상: {tokenizer_rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.rag.config import SQL_DUMP_PATH
+from backend.rag.data_parser import PARSER_VERSION
+from backend.rag.parse_cache import ParsedDumpCache
 from loguru import logger
 
 
@@ -56,6 +58,26 @@ def check_sql_file():
                 logger.info(f"  - {table}")
 
 
+def check_parse_cache():
+    """파싱 캐시 상태 확인"""
+    cache = ParsedDumpCache(parser_version=PARSER_VERSION)
+    key = cache.key_for(SQL_DUMP_PATH)
+    manifest = cache.read_manifest(key)
+
+    logger.info(f"\n💾 파싱 캐시: {cache.entry_dir(key)}")
+    if manifest is None:
+        logger.info("  - 캐시 없음 (init_database.py 실행 시 생성됩니다)")
+        return
+
+    logger.info(f"  - 파트 파일: {len(manifest['parts'])}개")
+    for table, count in manifest["tables"].items():
+        schema = manifest["schemas"].get(table)
+        columns = f", 컬럼 {len(schema['columns'])}개 (PK: {schema['primary_key']})" if schema else ""
+        logger.info(f"  - {table}: {count}개 레코드{columns}")
+
+
 if __name__ == "__main__":
     check_sql_file()
+    if SQL_DUMP_PATH.exists():
+        check_parse_cache()
 
@@ -10,6 +10,8 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.rag.config import SQL_DUMP_PATH
+from backend.rag.data_parser import PARSER_VERSION
+from backend.rag.parse_cache import ParsedDumpCache
 from loguru import logger
 import sqlparse
 
@@ -111,6 +113,25 @@ def debug_sql_parsing():
                         break
 
 
+def debug_parse_cache():
+    """파싱 캐시에 저장된 테이블별 첫 레코드 확인"""
+    cache = ParsedDumpCache(parser_version=PARSER_VERSION)
+    key = cache.key_for(SQL_DUMP_PATH)
+    if not cache.has(key):
+        logger.info("\n파싱 캐시 없음")
+        return
+
+    logger.info(f"\n파싱 캐시 로드: {cache.entry_dir(key)}")
+    seen = set()
+    for table_name, record in cache.iter_records(key):
+        if table_name in seen:
+            continue
+        seen.add(table_name)
+        logger.info(f"[{table_name}] {record}")
+
+
 if __name__ == "__main__":
     debug_sql_parsing()
+    if SQL_DUMP_PATH.exists():
+        debug_parse_cache()
 
@@ -0,0 +1,180 @@
+"""
+임베딩 차원 축소 리포트
+
+카탈로그 문서 표본을 전체 차원으로 한 번 임베딩한 뒤, 차원별(기본 768/512/256/128)로
+앞쪽 차원만 남기고 재정규화한 벡터를 ChromaDB(메모리)에 색인하여 다음을 비교합니다.
+
+    recall@k: 전체 차원 정확(brute-force) 최근접 이웃 대비 HNSW 검색 결과 일치율
+    검색 지연: 쿼리당 평균 / p95 (ms)
+    벡터 크기: float32 기준 색인 벡터 바이트
+
+text-embedding-004 등 Matryoshka 방식으로 학습된 모델은 API의 output_dimensionality로
+받은 벡터가 전체 벡터의 앞부분과 같으므로, API 재호출 없이 잘라서 비교할 수 있습니다.
+쿼리는 기본적으로 표본 문서의 제품명을 사용합니다.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+
+import chromadb
+import numpy as np
+from chromadb.config import Settings
+from loguru import logger
+
+from backend.rag.config import EMBEDDING_BACKEND, SQL_DUMP_PATH
+from backend.rag.data_parser import PCDataParser
+from backend.rag.embedders import create_embedder, truncate_embeddings
+
+
+def sample_documents(sql_file: Path, size: int, seed: int):
+    """덤프 전체에서 문서를 균등 표본 추출 (저수지 표본 추출, 메모리는 표본 크기만큼만 사용)"""
+    data_parser = PCDataParser(sql_file_path=sql_file, workers=1)
+    rng = random.Random(seed)
+    sample = []
+    for n, doc in enumerate(data_parser.iter_component_documents(data_parser.iter_records())):
+        if n < size:
+            sample.append(doc)
+        else:
+            j = rng.randrange(n + 1)
+            if j < size:
+                sample[j] = doc
+    return sample
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def exact_neighbors(doc_vectors: np.ndarray, query_vectors: np.ndarray, k: int) -> np.ndarray:
+    """코사인 유사도 기준 정확한 top-k 이웃 인덱스"""
+    scores = _normalize(query_vectors) @ _normalize(doc_vectors).T
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def evaluate_dimension(
+    doc_vectors: np.ndarray,
+    query_vectors: np.ndarray,
+    truth: np.ndarray,
+    dimension: int,
+    k: int,
+) -> dict:
+    """한 차원에서 색인 후 recall@k와 검색 지연 측정"""
+    docs = truncate_embeddings(doc_vectors, dimension)
+    queries = truncate_embeddings(query_vectors, dimension)
+
+    client = chromadb.EphemeralClient(settings=Settings(anonymized_telemetry=False))
+    collection = client.create_collection(
+        name=f"dimension_report_{dimension}", metadata={"hnsw:space": "cosine"}
+    )
+    ids = [str(i) for i in range(len(docs))]
+    build_start = time.perf_counter()
+    for start in range(0, len(docs), 1000):
+        collection.add(ids=ids[start:start + 1000], embeddings=docs[start:start + 1000])
+    build_seconds = time.perf_counter() - build_start
+
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        result = collection.query(query_embeddings=[query], n_results=k, include=[])
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = {int(doc_id) for doc_id in result["ids"][0]}
+        hits += len(found & set(expected.tolist()))
+
+    client.delete_collection(collection.name)
+    latencies = np.array(latencies)
+    return {
+        "dimension": dimension,
+        "recall": hits / (len(truth) * k),
+        "latency_mean": float(latencies.mean()),
+        "latency_p95": float(np.percentile(latencies, 95)),
+        "build_seconds": build_seconds,
+        "vector_bytes": docs.nbytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임베딩 차원별 recall/검색 지연 비교")
+    parser.add_argument(
+        "--sql-file",
+        type=str,
+        default=str(SQL_DUMP_PATH),
+        help="SQL 덤프 파일 경로",
+    )
+    parser.add_argument(
+        "--embedding-backend",
+        choices=["gemini", "local", "hashing"],
+        default=EMBEDDING_BACKEND,
+        help="임베딩 백엔드 (hashing은 API 없이 실행 가능)",
+    )
+    parser.add_argument(
+        "--dimensions",
+        type=str,
+        default="768,512,256,128",
+        help="비교할 차원 목록 (쉼표 구분, 임베딩 차원보다 큰 값은 임베딩 차원으로 제한)",
+    )
+    parser.add_argument("--sample", type=int, default=5000, help="색인할 문서 표본 수")
+    parser.add_argument("--queries", type=int, default=200, help="평가 쿼리 수")
+    parser.add_argument("--top-k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--seed", type=int, default=42, help="표본 추출 시드")
+    args = parser.parse_args()
+
+    sql_file = Path(args.sql_file)
+    if not sql_file.exists():
+        logger.error(f"SQL 파일을 찾을 수 없습니다: {sql_file}")
+        sys.exit(1)
+
+    documents = sample_documents(sql_file, args.sample, args.seed)
+    if len(documents) <= args.top_k:
+        logger.error(f"문서가 너무 적습니다: {len(documents)}개")
+        sys.exit(1)
+    rng = random.Random(args.seed)
+    queries = [
+        str(doc["metadata"].get("name") or doc["text"][:50])
+        for doc in rng.sample(documents, min(args.queries, len(documents)))
+    ]
+    logger.info(f"문서 {len(documents):,}개, 쿼리 {len(queries)}개")
+
+    # 임베딩 캐시가 있으면 같은 표본으로 다시 실행할 때 API를 호출하지 않음
+    embedder = create_embedder(args.embedding_backend)
+    doc_vectors = embedder.embed_batch(
+        [doc["text"] for doc in documents], task_type="RETRIEVAL_DOCUMENT"
+    )
+    query_vectors = embedder.embed_batch(queries, task_type="RETRIEVAL_QUERY")
+    full_dimension = doc_vectors.shape[1]
+
+    dimensions = sorted(
+        {min(int(d), full_dimension) for d in args.dimensions.split(",") if d.strip()},
+        reverse=True,
+    )
+    truth = exact_neighbors(doc_vectors, query_vectors, args.top_k)
+
+    reports = [
+        evaluate_dimension(doc_vectors, query_vectors, truth, dimension, args.top_k)
+        for dimension in dimensions
+    ]
+
+    logger.info(f"백엔드: {embedder.backend} ({embedder.model}), 전체 차원: {full_dimension}")
+    logger.info(
+        f"{'차원':>6} {'recall@' + str(args.top_k):>10} {'평균(ms)':>9} {'p95(ms)':>9} "
+        f"{'색인(s)':>8} {'벡터(MB)':>9}"
+    )
+    for report in reports:
+        logger.info(
+            f"{report['dimension']:>6} {report['recall']:>10.3f} "
+            f"{report['latency_mean']:>9.2f} {report['latency_p95']:>9.2f} "
+            f"{report['build_seconds']:>8.2f} {report['vector_bytes'] / 1024 / 1024:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
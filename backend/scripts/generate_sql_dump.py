@@ -0,0 +1,491 @@
+"""
+합성 SQL 덤프 생성 스크립트
+
+pc_data_dump.sql과 같은 테이블/컬럼 구성을 가진 MySQL 덤프를 원하는 크기로 생성합니다.
+같은 시드와 옵션이면 항상 바이트 단위로 같은 파일이 만들어지므로,
+파서/임베딩 적재/검색 성능을 카탈로그 규모별로 재현 가능하게 측정할 수 있습니다.
+
+사용 예:
+    python backend/scripts/generate_sql_dump.py --scale 10 --output /tmp/dump_x10.sql
+    python backend/scripts/generate_sql_dump.py --rows 1000 --style per-row --seed 7
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+
+from loguru import logger
+
+# 스키마 가이드 기준 테이블별 항목 수 (--scale 1.0)
+BASE_ROW_COUNTS = {
+    "cpu": 3060,
+    "motherboard": 14248,
+    "memory": 17796,
+    "gpu": 11145,
+    "storage": 10485,
+    "psu": 9774,
+    "case": 10902,
+    "cpu_cooler": 4678,
+}
+
+SOCKETS = ["AM4", "AM5", "LGA1700", "LGA1200", "LGA1851", "sTR5", "LGA1151"]
+FORM_FACTORS = ["ATX", "Micro ATX", "Mini ITX", "E-ATX"]
+RAM_TYPES = ["DDR4", "DDR5"]
+COLORS = ["Black", "White", "Silver", "블랙", "화이트"]
+PACKAGING = ["정품", "병행수입", "벌크", "Retail", "OEM"]
+
+BRANDS = {
+    "cpu": ["Intel", "AMD"],
+    "motherboard": ["ASUS", "MSI", "Gigabyte", "ASRock", "Biostar"],
+    "memory": ["Corsair", "G.Skill", "TEAMGROUP", "Kingston", "Samsung", "SK hynix"],
+    "gpu": ["ASUS", "MSI", "Gigabyte", "XFX", "Sapphire", "ZOTAC", "PowerColor"],
+    "storage": ["Samsung", "WD", "Seagate", "Crucial", "SK hynix", "MSI"],
+    "psu": ["Corsair", "SeaSonic", "Super Flower", "Cooler Master", "be quiet!"],
+    "case": ["Fractal Design", "Lian Li", "NZXT", "Phanteks", "3RSYS", "앱코"],
+    "cpu_cooler": ["Noctua", "Lian Li", "DeepCool", "Thermalright", "Arctic", "Corsair"],
+}
+
+# (컬럼명, MySQL 타입) - 기본 키는 첫 번째 컬럼
+TABLE_COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    "cpu": [
+        ("cpu_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("socket", "varchar(50) DEFAULT NULL"),
+        ("core_count", "int DEFAULT NULL"),
+        ("thread_count", "int DEFAULT NULL"),
+        ("tdp_w", "int DEFAULT NULL"),
+        ("integrated_graphics", "tinyint(1) DEFAULT NULL"),
+        ("supported_memory_types", "varchar(100) DEFAULT NULL"),
+    ],
+    "motherboard": [
+        ("motherboard_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("socket", "varchar(50) DEFAULT NULL"),
+        ("form_factor", "varchar(50) DEFAULT NULL"),
+        ("ram_type", "varchar(20) DEFAULT NULL"),
+        ("ram_slots", "int DEFAULT NULL"),
+        ("max_ram_gb", "int DEFAULT NULL"),
+        ("chipset", "varchar(50) DEFAULT NULL"),
+        ("m2_slots_count", "int DEFAULT NULL"),
+        ("sata_ports_count", "int DEFAULT NULL"),
+    ],
+    "memory": [
+        ("memory_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("type", "varchar(20) DEFAULT NULL"),
+        ("capacity_gb", "int DEFAULT NULL"),
+        ("speed_mhz", "int DEFAULT NULL"),
+        ("module_count", "int DEFAULT NULL"),
+    ],
+    "gpu": [
+        ("gpu_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("chipset", "varchar(100) DEFAULT NULL"),
+        ("memory_gb", "int DEFAULT NULL"),
+        ("length_mm", "int DEFAULT NULL"),
+        ("required_psu_w", "int DEFAULT NULL"),
+        ("power_connectors", "varchar(255) DEFAULT NULL"),
+    ],
+    "storage": [
+        ("storage_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("capacity_gb", "int DEFAULT NULL"),
+        ("type", "varchar(10) DEFAULT NULL"),
+        ("form_factor", "varchar(50) DEFAULT NULL"),
+        ("interface", "varchar(50) DEFAULT NULL"),
+    ],
+    "psu": [
+        ("psu_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("wattage", "int DEFAULT NULL"),
+        ("rating", "varchar(50) DEFAULT NULL"),
+        ("form_factor", "varchar(20) DEFAULT NULL"),
+        ("is_modular", "tinyint(1) DEFAULT NULL"),
+        ("available_connectors", "text"),
+    ],
+    "case": [
+        ("case_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("supported_mobo_form_factors", "text"),
+        ("max_gpu_length_mm", "int DEFAULT NULL"),
+        ("max_cpu_cooler_height_mm", "int DEFAULT NULL"),
+        ("drive_bays_2_5_count", "int DEFAULT NULL"),
+        ("drive_bays_3_5_count", "int DEFAULT NULL"),
+    ],
+    "cpu_cooler": [
+        ("cooler_id", "int NOT NULL AUTO_INCREMENT"),
+        ("name", "varchar(255) NOT NULL"),
+        ("brand", "varchar(100) DEFAULT NULL"),
+        ("type", "varchar(20) DEFAULT NULL"),
+        ("height_mm", "int DEFAULT NULL"),
+        ("radiator_size_mm", "int DEFAULT NULL"),
+        ("supported_sockets", "text"),
+    ],
+}
+
+# 모든 부품 테이블에 공통으로 붙는 컬럼
+TIMESTAMP_COLUMNS = [
+    ("created_at", "datetime DEFAULT CURRENT_TIMESTAMP"),
+    ("updated_at", "datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+]
+
+# 타임스탬프 기준 시각 (현재 시각을 쓰지 않아야 출력이 결정적)
+BASE_TIME = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def _json_list(items: List[str]) -> str:
+    return "[" + ", ".join(f'"{item}"' for item in items) + "]"
+
+
+def _cpu_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["cpu"])
+    cores = rng.choice([4, 6, 8, 12, 16, 24])
+    if brand == "Intel":
+        socket = rng.choice(["LGA1700", "LGA1851", "LGA1200"])
+        name = f"Intel Core i{rng.choice([3, 5, 7, 9])}-{rng.randint(10, 15)}{rng.randint(100, 999)}{rng.choice(['K', 'KF', 'F', ''])}"
+    else:
+        socket = rng.choice(["AM4", "AM5"])
+        name = f"AMD Ryzen {rng.choice([3, 5, 7, 9])} {rng.randint(5, 9)}{rng.randint(500, 999)}{rng.choice(['X', 'X3D', ''])}"
+    return [
+        name, brand, socket, cores, cores * rng.choice([1, 2]),
+        rng.choice([35, 65, 105, 125, 170]), rng.random() < 0.6,
+        "DDR5" if socket in ("AM5", "LGA1851") else rng.choice(["DDR4", "DDR5, DDR4"]),
+    ]
+
+
+def _motherboard_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["motherboard"])
+    socket = rng.choice(SOCKETS[:5])
+    chipset = rng.choice(["B650", "X670E", "B760", "Z790", "A620", "H610", "Z890", "B550"])
+    form_factor = rng.choice(FORM_FACTORS)
+    ram_type = rng.choice(RAM_TYPES)
+    name = f"{brand} {rng.choice(['PRIME', 'TUF GAMING', 'MAG', 'AORUS', 'PRO'])} {chipset}{rng.choice(['-A', '-P', 'M', ' WIFI'])}"
+    if ram_type == "DDR4":
+        name += " D4"
+    return [
+        name, brand, socket, form_factor, ram_type,
+        2 if form_factor == "Mini ITX" else 4, rng.choice([64, 128, 192, 256]),
+        chipset, rng.randint(1, 5), rng.choice([2, 4, 6]),
+    ]
+
+
+def _memory_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["memory"])
+    ram_type = rng.choice(RAM_TYPES)
+    modules = rng.choice([1, 2, 4])
+    per_module = rng.choice([8, 16, 32, 48])
+    speed = rng.choice([3200, 3600]) if ram_type == "DDR4" else rng.choice([4800, 5600, 6000, 6400, 7200])
+    return [
+        f"{brand} {ram_type}-{speed} {modules * per_module}GB ({modules}x{per_module}GB)",
+        brand, ram_type, modules * per_module, speed, modules,
+    ]
+
+
+def _gpu_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["gpu"])
+    chipset = rng.choice([
+        "GeForce RTX 4060", "GeForce RTX 4070 SUPER", "GeForce RTX 4080 SUPER",
+        "GeForce RTX 5090", "Radeon RX 7800 XT", "Radeon RX 9070 XT", "Arc B580",
+    ])
+    memory = rng.choice([8, 12, 16, 24, 32])
+    power = rng.choice([550, 650, 750, 850, 1000])
+    connectors = rng.choice(["8-pin x 1", "8-pin x 2", "12VHPWR x 1", "8-pin x 3"])
+    return [
+        f"{brand} {chipset} {rng.choice(['OC', 'GAMING', 'TRIPLE FAN', 'DUAL'])} {memory}GB",
+        brand, chipset, memory, rng.randint(180, 360), power, connectors,
+    ]
+
+
+def _storage_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["storage"])
+    kind = "SSD" if rng.random() < 0.75 else "HDD"
+    capacity = rng.choice([500, 1000, 2000, 4000]) if kind == "SSD" else rng.choice([1000, 2000, 4000, 8000, 16000])
+    if kind == "SSD" and rng.random() < 0.8:
+        form_factor, interface = "M.2-2280", rng.choice(["PCIe 3.0 X4", "PCIe 4.0 X4", "PCIe 5.0 X4"])
+    else:
+        form_factor, interface = ('2.5"' if kind == "SSD" else '3.5"'), "SATA 6.0 Gb/s"
+    return [
+        f"{brand} {rng.choice(['990 PRO', 'Blue', 'Black SN850X', 'BarraCuda', 'P3 Plus', 'Platinum P41'])} {capacity // 1000 or capacity}{'TB' if capacity >= 1000 else 'GB'} {kind}",
+        brand, capacity, kind, form_factor, interface,
+    ]
+
+
+def _psu_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["psu"])
+    wattage = rng.choice([550, 650, 750, 850, 1000, 1200])
+    rating = rng.choice(["80+ Bronze", "80+ Gold", "80+ Platinum", "80+ Titanium"])
+    modular = rng.random() < 0.6
+    connectors = (
+        f'{{"atx_24_pin": 1, "eps_8_pin": {rng.choice([1, 2])}, '
+        f'"pcie_8_pin": {rng.choice([2, 3, 4])}, "12vhpwr": {rng.choice([0, 1])}}}'
+    )
+    return [
+        f"{brand} {rng.choice(['RM', 'FOCUS', 'LEADEX', 'MWE', 'Pure Power'])} {wattage}W {rating}",
+        brand, wattage, rating, rng.choice(["ATX", "SFX", "SFX-L"]), modular, connectors,
+    ]
+
+
+def _case_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["case"])
+    tower = rng.choice(["ATX Mid Tower", "MicroATX Mini Tower", "Mini ITX Tower", "ATX Full Tower"])
+    return [
+        f"{brand} {rng.choice(['North', 'O11 Dynamic', 'H5 Flow', 'Eclipse', 'Meshify 2'])} {tower}",
+        brand, _json_list([tower]), rng.randint(280, 450), rng.randint(140, 190),
+        rng.randint(0, 4), rng.randint(0, 6),
+    ]
+
+
+def _cpu_cooler_row(rng: random.Random, n: int) -> List[Any]:
+    brand = rng.choice(BRANDS["cpu_cooler"])
+    liquid = rng.random() < 0.4
+    sockets = sorted(rng.sample(SOCKETS, rng.randint(2, 5)))
+    radiator = rng.choice([240, 280, 360]) if liquid else None
+    model = f"{radiator}mm AIO" if liquid else rng.choice(["NH-D15", "Peerless Assassin 120", "AK620", "Freezer 36"])
+    return [
+        f"{brand} {model}", brand, "Liquid" if liquid else "Air",
+        None if liquid else rng.randint(120, 170), radiator, _json_list(sockets),
+    ]
+
+
+ROW_GENERATORS: Dict[str, Callable[[random.Random, int], List[Any]]] = {
+    "cpu": _cpu_row,
+    "motherboard": _motherboard_row,
+    "memory": _memory_row,
+    "gpu": _gpu_row,
+    "storage": _storage_row,
+    "psu": _psu_row,
+    "case": _case_row,
+    "cpu_cooler": _cpu_cooler_row,
+}
+
+
+def sql_literal(value: Any) -> str:
+    """파이썬 값을 MySQL 덤프 리터럴로 변환"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"'{value:%Y-%m-%d %H:%M:%S}'"
+    text = (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("'", "\\'")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+    return f"'{text}'"
+
+
+def iter_table_rows(
+    table: str, row_count: int, rng: random.Random, duplicate_ratio: float
+) -> Iterator[List[Any]]:
+    """
+    테이블 행 생성 (기본 키, 스펙 컬럼, created_at, updated_at 순서)
+
+    duplicate_ratio 비율만큼은 직전에 만든 제품의 색상/포장 변형을 만들어
+    실제 덤프처럼 유사 중복 행이 섞이게 한다.
+    """
+    generate = ROW_GENERATORS[table]
+    previous: Optional[List[Any]] = None
+    for n in range(1, row_count + 1):
+        if previous is not None and rng.random() < duplicate_ratio:
+            values = list(previous)
+            values[0] = f"{previous[0]} ({rng.choice(COLORS)}) {rng.choice(PACKAGING)}"
+        else:
+            values = generate(rng, n)
+            previous = values
+
+        created_at = BASE_TIME + timedelta(minutes=n * 7 + rng.randint(0, 6))
+        updated_at = created_at + timedelta(days=rng.randint(0, 180), seconds=rng.randint(0, 86399))
+        yield [n, *values, created_at, updated_at]
+
+
+def write_create_table(out: TextIO, table: str) -> None:
+    columns = TABLE_COLUMNS[table] + TIMESTAMP_COLUMNS
+    primary_key = columns[0][0]
+    out.write(f"--\n-- Table structure for table `{table}`\n--\n\n")
+    out.write(f"DROP TABLE IF EXISTS `{table}`;\n")
+    out.write("/*!40101 SET @saved_cs_client     = @@character_set_client */;\n")
+    out.write("/*!50503 SET character_set_client = utf8mb4 */;\n")
+    out.write(f"CREATE TABLE `{table}` (\n")
+    for name, spec in columns:
+        out.write(f"  `{name}` {spec},\n")
+    out.write(f"  PRIMARY KEY (`{primary_key}`)\n")
+    out.write(") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;\n")
+    out.write("/*!40101 SET character_set_client = @saved_cs_client */;\n\n")
+
+
+def write_table_data(
+    out: TextIO,
+    table: str,
+    rows: Iterator[List[Any]],
+    style: str,
+    rows_per_insert: int,
+) -> int:
+    """테이블 데이터를 INSERT 문으로 기록하고 행 수 반환"""
+    out.write(f"--\n-- Dumping data for table `{table}`\n--\n\n")
+    out.write(f"LOCK TABLES `{table}` WRITE;\n")
+    out.write(f"/*!40000 ALTER TABLE `{table}` DISABLE KEYS */;\n")
+
+    count = 0
+    batch: List[str] = []
+    for values in rows:
+        count += 1
+        tuple_sql = "(" + ",".join(sql_literal(value) for value in values) + ")"
+        if style == "per-row":
+            out.write(f"INSERT INTO `{table}` VALUES {tuple_sql};\n")
+            continue
+        batch.append(tuple_sql)
+        if len(batch) >= rows_per_insert:
+            out.write(f"INSERT INTO `{table}` VALUES {','.join(batch)};\n")
+            batch = []
+    if batch:
+        out.write(f"INSERT INTO `{table}` VALUES {','.join(batch)};\n")
+
+    out.write(f"/*!40000 ALTER TABLE `{table}` ENABLE KEYS */;\n")
+    out.write("UNLOCK TABLES;\n\n")
+    return count
+
+
+def generate_dump(
+    output: Path,
+    row_counts: Dict[str, int],
+    seed: int = 42,
+    style: str = "extended",
+    rows_per_insert: int = 1000,
+    duplicate_ratio: float = 0.05,
+) -> Dict[str, int]:
+    """
+    합성 SQL 덤프 파일 생성
+
+    Args:
+        output: 출력 파일 경로
+        row_counts: 테이블별 행 수
+        seed: 난수 시드 (같은 시드 + 옵션이면 같은 파일)
+        style: "extended" (INSERT 하나에 여러 행) 또는 "per-row" (행마다 INSERT)
+        rows_per_insert: extended 스타일에서 INSERT 문 하나에 넣을 행 수
+        duplicate_ratio: 색상/포장만 다른 유사 중복 행 비율
+
+    Returns:
+        테이블별 생성된 행 수
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    written = {}
+    with open(output, "w", encoding="utf-8", newline="\n") as out:
+        out.write("-- MySQL dump 10.13  Distrib 8.0.36, for Linux (x86_64)\n--\n")
+        out.write("-- Host: localhost    Database: pc_compatibility_db\n")
+        out.write(f"-- Synthetic dump (seed={seed}, style={style})\n")
+        out.write("-- ------------------------------------------------------\n\n")
+        out.write("/*!40101 SET NAMES utf8mb4 */;\n")
+        out.write("/*!40014 SET @OLD_FOREIGN_KEY_CHECKS=@@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS=0 */;\n\n")
+
+        for table, row_count in row_counts.items():
+            # 테이블마다 독립된 난수열을 써서 일부 테이블만 생성해도 내용이 같게 유지
+            rng = random.Random(f"{seed}:{table}")
+            write_create_table(out, table)
+            rows = iter_table_rows(table, row_count, rng, duplicate_ratio)
+            written[table] = write_table_data(out, table, rows, style, rows_per_insert)
+            logger.info(f"{table}: {written[table]:,}개 행")
+
+        out.write("/*!40014 SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS */;\n")
+        out.write("-- Dump completed\n")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 PC 부품 SQL 덤프 생성")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=str(project_root / "backend" / "data" / "synthetic_dump.sql"),
+        help="출력 SQL 파일 경로",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="스키마 가이드 항목 수 대비 배율 (예: 10이면 약 72만 행)",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=None,
+        help="테이블마다 같은 행 수로 생성 (지정하면 --scale 무시)",
+    )
+    parser.add_argument(
+        "--tables",
+        type=str,
+        default=None,
+        help=f"생성할 테이블 목록 (쉼표 구분, 기본값: {','.join(BASE_ROW_COUNTS)})",
+    )
+    parser.add_argument(
+        "--style",
+        choices=["extended", "per-row"],
+        default="extended",
+        help="INSERT 스타일 (extended: 여러 행 묶음, per-row: 행마다 INSERT)",
+    )
+    parser.add_argument(
+        "--rows-per-insert",
+        type=int,
+        default=1000,
+        help="extended 스타일에서 INSERT 문 하나에 넣을 행 수",
+    )
+    parser.add_argument(
+        "--duplicate-ratio",
+        type=float,
+        default=0.05,
+        help="색상/포장만 다른 유사 중복 행 비율 (0~1)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="난수 시드",
+    )
+    args = parser.parse_args()
+
+    tables = [t.strip() for t in args.tables.split(",") if t.strip()] if args.tables else list(BASE_ROW_COUNTS)
+    unknown = [t for t in tables if t not in BASE_ROW_COUNTS]
+    if unknown:
+        logger.error(f"알 수 없는 테이블: {', '.join(unknown)}")
+        sys.exit(1)
+
+    if args.rows is not None:
+        row_counts = {table: args.rows for table in tables}
+    else:
+        row_counts = {table: max(1, round(BASE_ROW_COUNTS[table] * args.scale)) for table in tables}
+
+    output = Path(args.output)
+    logger.info(f"합성 덤프 생성: {output} (seed={args.seed}, style={args.style})")
+    written = generate_dump(
+        output,
+        row_counts,
+        seed=args.seed,
+        style=args.style,
+        rows_per_insert=args.rows_per_insert,
+        duplicate_ratio=args.duplicate_ratio,
+    )
+    logger.success(
+        f"완료: {sum(written.values()):,}개 행, {output.stat().st_size / 1024 / 1024:.2f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
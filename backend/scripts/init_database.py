@@ -4,6 +4,7 @@
 SQL 덤프 파일을 파싱하고 ChromaDB에 임베딩하여 저장합니다.
 """
 import sys
+import sqlite3
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -11,7 +12,17 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from backend.rag.pipeline import RAGPipeline
-from backend.rag.config import SQL_DUMP_PATH
+from backend.rag.db_source import DatabaseSource
+from backend.rag.embedders import create_embedder
+from backend.rag.gemini_client import GeminiClientPool
+from backend.rag.batch_embedding import BatchEmbeddingJob, GeminiBatchJobClient, LocalBatchJobClient
+from backend.rag.config import (
+    SQL_DUMP_PATH,
+    DEDUP_ENABLED,
+    EMBEDDING_BACKEND,
+    BATCH_JOB_DIRECTORY,
+    BATCH_JOB_POLL_SECONDS,
+)
 from loguru import logger
 import argparse
 
@@ -24,7 +35,7 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="기존 데이터를 삭제하고 재구축",
+        help="기존 데이터를 삭제하고 재구축 (중단된 구축 체크포인트도 무시)",
     )
     parser.add_argument(
         "--sql-file",
@@ -32,6 +43,72 @@ def main():
         default=str(SQL_DUMP_PATH),
         help="SQL 덤프 파일 경로",
     )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="SQL 파싱에 사용할 프로세스 수 (기본값: PARSE_WORKERS 환경 변수 또는 1)",
+    )
+    parser.add_argument(
+        "--tables",
+        type=str,
+        default=None,
+        help="재구축할 테이블 목록 (쉼표 구분, 예: cpu,gpu). 해당 카테고리만 교체",
+    )
+    parser.add_argument(
+        "--from-db",
+        action="store_true",
+        help="SQL 덤프 대신 MySQL(MYSQL_* 환경 변수)에서 직접 읽어 적재",
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=str,
+        default=None,
+        help="SQL 덤프 대신 SQLite 파일에서 직접 읽어 적재 (로컬 테스트용)",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="전체 재구축 대신 마지막 동기화 이후 updated_at이 바뀐 행만 업서트 "
+        "(유사 중복 병합 시 바뀐 행을 저장된 대표 문서에 다시 병합)",
+    )
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help="유사 중복 제품 병합을 끄고 모든 레코드를 임베딩",
+    )
+    parser.add_argument(
+        "--embedding-backend",
+        type=str,
+        choices=["gemini", "local", "hashing"],
+        default=EMBEDDING_BACKEND,
+        help="임베딩 백엔드 (기본값: EMBEDDING_BACKEND 설정)",
+    )
+    parser.add_argument(
+        "--batch-job",
+        type=str,
+        choices=["gemini", "local"],
+        default=None,
+        help="온라인 임베딩 호출 대신 오프라인 배치 작업으로 임베딩 "
+        "(gemini: Gemini Batch API, local: 같은 수명 주기를 흉내 내는 로컬 대역)",
+    )
+    parser.add_argument(
+        "--job-dir",
+        type=str,
+        default=str(BATCH_JOB_DIRECTORY),
+        help="배치 작업 파일 디렉토리 (진행 중인 작업이 있으면 이어서 기다림)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=BATCH_JOB_POLL_SECONDS,
+        help="배치 작업 상태 확인 간격 (초)",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="중단된 구축 체크포인트가 있어도 이어서 진행하지 않고 처음부터 구축",
+    )
     parser.add_argument(
         "--log-level",
         type=str,
@@ -41,6 +118,13 @@ def main():
     )
 
     args = parser.parse_args()
+    if args.batch_job and args.sync:
+        parser.error("--batch-job은 --sync와 함께 사용할 수 없습니다.")
+    if args.sqlite and not Path(args.sqlite).is_file():
+        parser.error(f"SQLite 파일을 찾을 수 없습니다: {args.sqlite}")
+    dedup = not args.no_dedup and DEDUP_ENABLED
+    if args.batch_job == "gemini" and args.embedding_backend != "gemini":
+        parser.error("--batch-job gemini는 --embedding-backend gemini에서만 사용할 수 있습니다.")
 
     # 로깅 설정
     logger.remove()
@@ -54,18 +138,89 @@ def main():
         logger.info("=" * 80)
         logger.info("PC 부품 벡터 데이터베이스 초기화 시작")
         logger.info("=" * 80)
-        logger.info(f"SQL 파일: {args.sql_file}")
+        if args.sqlite:
+            logger.info(f"입력: SQLite {args.sqlite}")
+        elif args.from_db:
+            logger.info("입력: MySQL 직접 조회")
+        else:
+            logger.info(f"SQL 파일: {args.sql_file}")
         logger.info(f"강제 재구축: {args.force}")
+        if args.sync:
+            logger.info("모드: 증분 동기화 (updated_at)")
+        if args.parse_workers:
+            logger.info(f"파싱 프로세스 수: {args.parse_workers}")
+        tables = [t.strip() for t in args.tables.split(",") if t.strip()] if args.tables else None
+        if tables:
+            logger.info(f"선택 테이블: {', '.join(tables)}")
         logger.info("")
 
-        # RAG 파이프라인 초기화
-        pipeline = RAGPipeline()
+        # RAG 파이프라인 초기화 (임베딩/배치 작업이 같은 클라이언트 풀 사용)
+        client_pool = GeminiClientPool()
+        pipeline = RAGPipeline(
+            embedder=create_embedder(args.embedding_backend, client_pool=client_pool),
+            client_pool=client_pool,
+        )
+
+        batch_job = None
+        if args.batch_job:
+            logger.info(f"임베딩: 오프라인 배치 작업 ({args.batch_job}, 작업 디렉토리 {args.job_dir})")
+            if args.batch_job == "gemini":
+                job_client = GeminiBatchJobClient(
+                    model=pipeline.embedder.model, client_pool=client_pool
+                )
+            else:
+                job_client = LocalBatchJobClient(pipeline.embedder)
+            batch_job = BatchEmbeddingJob(
+                job_client,
+                job_dir=Path(args.job_dir),
+                poll_interval=args.poll_interval,
+                output_dimensionality=getattr(pipeline.embedder, "output_dimensionality", None),
+            )
 
         # 데이터베이스 초기화
-        result = pipeline.initialize_database(
-            sql_file_path=Path(args.sql_file),
-            force_rebuild=args.force,
+        # 읽기 전용으로 열어 잘못된 경로에 빈 DB 파일이 생기지 않도록 함
+        # (단계별 파이프라인이 작업 스레드에서 읽으므로 스레드 검사는 끔)
+        connection = (
+            sqlite3.connect(
+                f"{Path(args.sqlite).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            if args.sqlite
+            else None
         )
+        source = DatabaseSource(connection, tables=tables) if args.sqlite or args.from_db else None
+        try:
+            if args.sync:
+                result = pipeline.sync_database(
+                    sql_file_path=Path(args.sql_file),
+                    source=source,
+                    tables=tables,
+                    dedup=dedup,
+                )
+            elif source is not None:
+                result = pipeline.initialize_from_database(
+                    source,
+                    force_rebuild=args.force,
+                    dedup=dedup,
+                    batch_job=batch_job,
+                    resume=not args.no_resume,
+                )
+            else:
+                result = pipeline.initialize_database(
+                    sql_file_path=Path(args.sql_file),
+                    force_rebuild=args.force,
+                    parse_workers=args.parse_workers,
+                    tables=tables,
+                    dedup=dedup,
+                    batch_job=batch_job,
+                    resume=not args.no_resume,
+                )
+        finally:
+            if source is not None:
+                source.close()
+            if connection is not None:
+                connection.close()
 
         # 결과 출력
         logger.info("")
@@ -74,8 +229,58 @@ def main():
         logger.info("=" * 80)
         logger.info(f"상태: {result['status']}")
         logger.info(f"메시지: {result['message']}")
+        if "upserted_documents" in result:
+            logger.info(f"업서트 문서 수: {result['upserted_documents']}")
+            for table, count in result["changed_by_table"].items():
+                logger.info(f"  - {table}: {count}개 변경")
         if "total_documents" in result:
             logger.info(f"총 문서 수: {result['total_documents']}")
+        if "token_stats" in result:
+            token_stats = result["token_stats"]
+            logger.info("\n문서 텍스트 추정 토큰 (템플릿 적용 전 -> 후):")
+            logger.info(
+                f"  - 합계: {token_stats['tokens_before']:,} -> {token_stats['tokens_after']:,} "
+                f"({token_stats['reduction_pct']}% 감소)"
+            )
+            logger.info(
+                f"  - 문서당 평균: {token_stats['avg_before']} -> {token_stats['avg_after']} "
+                f"(최대 {token_stats['max_after']})"
+            )
+        if result.get("dedup_stats"):
+            dedup_stats = result["dedup_stats"]
+            logger.info(
+                f"유사 중복 병합: {dedup_stats['input_documents']:,} -> "
+                f"{dedup_stats['output_documents']:,}개 문서 "
+                f"({dedup_stats['collapsed_documents']:,}개 병합)"
+            )
+        if result.get("resumed_documents"):
+            logger.info(f"이전 실행에서 저장되어 건너뛴 문서: {result['resumed_documents']:,}개")
+        if result.get("failed_documents"):
+            failed_documents = result["failed_documents"]
+            logger.warning(f"임베딩 실패로 건너뛴 문서: {len(failed_documents)}개")
+            for failure in failed_documents[:10]:
+                logger.warning(f"  - {failure['id']}: {failure['error']}")
+        if result.get("embedding_cache_stats"):
+            cache_stats = result["embedding_cache_stats"]
+            logger.info(
+                f"임베딩 캐시: {cache_stats['hits']:,}개 적중 / {cache_stats['misses']:,}개 미적중 "
+                f"(적중률 {cache_stats['hit_rate']:.1%}, 저장 {cache_stats['entries']:,}개)"
+            )
+        if result.get("embedding_batch_stats"):
+            batch_stats = result["embedding_batch_stats"]
+            logger.info(
+                f"임베딩 요청: {batch_stats['requests']:,}건 (요청당 평균 {batch_stats['avg_items']}개, "
+                f"{batch_stats['avg_tokens']} 토큰, 토큰 예산 채움 {batch_stats['fill_ratio']:.1%})"
+            )
+        if result.get("ingest_stats"):
+            ingest_stats = result["ingest_stats"]
+            logger.info(f"\n적재 단계별 처리량 (경과 {ingest_stats['wall_seconds']}초):")
+            for stage, stage_stats in ingest_stats["stages"].items():
+                logger.info(
+                    f"  - {stage}: {stage_stats['items']:,}개, {stage_stats['items_per_second']}개/초 "
+                    f"(작업 {stage_stats['busy_seconds']}초, 입력 대기 {stage_stats['starved_seconds']}초, "
+                    f"출력 대기 {stage_stats['blocked_seconds']}초)"
+                )
         if "categories_sample" in result:
             logger.info("\n카테고리별 문서 수 (샘플):")
             for category, count in result["categories_sample"].items():
@@ -0,0 +1,130 @@
+"""
+벡터 DB 구축 경로 메모리 프로파일
+
+initialize_database와 같은 순서로 SQL 파싱 -> 문서 생성 -> 배치별 메타데이터 정제를
+수행하고(임베딩/ChromaDB 저장 제외), 최대 RSS와 할당 블록 수를 측정합니다.
+
+    tables 모드: parse_sql_dump()로 전체 테이블을 메모리에 올린 뒤 문서 생성
+    stream 모드: iter_records() -> iter_component_documents() 스트리밍 (initialize_database 경로)
+"""
+import resource
+import sys
+import time
+import tracemalloc
+from itertools import islice
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import argparse
+
+from loguru import logger
+
+from backend.rag.config import SQL_DUMP_PATH
+from backend.rag.data_parser import PCDataParser
+from backend.rag.vector_store import clean_metadata
+
+
+class _BlockSampler:
+    """할당 블록 수 최대값 기록"""
+
+    def __init__(self):
+        self.base = sys.getallocatedblocks()
+        self.peak = 0
+
+    def sample(self) -> None:
+        self.peak = max(self.peak, sys.getallocatedblocks() - self.base)
+
+
+def _iter_batches(documents, batch_size: int):
+    doc_iter = iter(documents)
+    while True:
+        batch = list(islice(doc_iter, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def run_tables(parser: PCDataParser, sampler: _BlockSampler, batch_size: int) -> int:
+    tables_data = parser.parse_sql_dump()
+    sampler.sample()
+    logger.info(f"테이블 보관 중 할당 블록: {sampler.peak:,}")
+
+    count = 0
+    for table_name, records in tables_data.items():
+        documents = parser.iter_component_documents((table_name, record) for record in records)
+        for batch in _iter_batches(documents, batch_size):
+            [clean_metadata(doc["metadata"]) for doc in batch]
+            sampler.sample()
+            count += len(batch)
+    return count
+
+
+def run_stream(parser: PCDataParser, sampler: _BlockSampler, batch_size: int) -> int:
+    documents = parser.iter_component_documents(parser.iter_records())
+    count = 0
+    for batch in _iter_batches(documents, batch_size):
+        [clean_metadata(doc["metadata"]) for doc in batch]
+        sampler.sample()
+        count += len(batch)
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벡터 DB 구축 경로 메모리 프로파일")
+    parser.add_argument(
+        "--sql-file",
+        type=str,
+        default=str(SQL_DUMP_PATH),
+        help="SQL 덤프 파일 경로",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["tables", "stream"],
+        default="tables",
+        help="측정할 구축 경로",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="add_documents 배치 크기",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="tracemalloc으로 파이썬 힙 최대 사용량도 측정 (느려짐)",
+    )
+    args = parser.parse_args()
+
+    sql_file = Path(args.sql_file)
+    if not sql_file.exists():
+        logger.error(f"SQL 파일을 찾을 수 없습니다: {sql_file}")
+        sys.exit(1)
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    data_parser = PCDataParser(sql_file_path=sql_file, workers=1)
+    sampler = _BlockSampler()
+    start = time.perf_counter()
+    if args.mode == "tables":
+        count = run_tables(data_parser, sampler, args.batch_size)
+    else:
+        count = run_stream(data_parser, sampler, args.batch_size)
+    elapsed = time.perf_counter() - start
+
+    # Linux에서 ru_maxrss 단위는 KB
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    logger.info(f"모드: {args.mode}, 문서: {count:,}개, 소요: {elapsed:.2f}s")
+    logger.info(f"최대 RSS: {max_rss_mb:.1f} MB")
+    logger.info(f"최대 할당 블록 증가: {sampler.peak:,}")
+    if args.tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        logger.info(f"tracemalloc 최대: {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+pytest 공통 설정
+"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가 (scripts/와 같은 방식으로 backend.rag를 import)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
@@ -0,0 +1,116 @@
+"""
+BuildCheckpoint(색인 구축 체크포인트) 테스트
+"""
+import json
+
+import pytest
+
+from backend.rag.checkpoint import CONTENT_HASH_KEY, BuildCheckpoint, content_hash
+
+SOURCE = "dump:///data/pc_data_dump.sql"
+EMBEDDER = {"embedding_backend": "hashing", "embedding_model": "v1", "embedding_dimension": 16}
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    checkpoint = BuildCheckpoint("components", directory=tmp_path)
+    checkpoint.start(SOURCE, None, "100:1", EMBEDDER)
+    return checkpoint
+
+
+def _reopen(checkpoint: BuildCheckpoint) -> BuildCheckpoint:
+    return BuildCheckpoint("components", directory=checkpoint.path.parent)
+
+
+def test_resume_loads_committed_batches(checkpoint):
+    checkpoint.commit({"cpu_1": "h1", "cpu_2": "h2"})
+    checkpoint.commit({"gpu_1": "h3"})
+
+    resumed = _reopen(checkpoint)
+    assert resumed.pending(SOURCE, None, "100:1", EMBEDDER)
+    assert resumed.resumed
+    assert resumed.committed == {"cpu_1": "h1", "cpu_2": "h2", "gpu_1": "h3"}
+    assert resumed.is_committed("cpu_1", "h1")
+    assert not resumed.is_committed("cpu_1", "changed")
+    assert not resumed.is_committed("ram_1", "h1")
+
+
+def test_partial_trailing_line_is_skipped(checkpoint):
+    checkpoint.commit({"cpu_1": "h1"})
+    # 배치 기록 도중 중단되어 줄바꿈 없이 잘린 마지막 줄
+    with open(checkpoint.path, "a", encoding="utf-8") as f:
+        f.write('{"ids": {"cpu_2": "h2", "cpu_3"')
+
+    resumed = _reopen(checkpoint)
+    assert resumed.pending(SOURCE, None, "100:1", EMBEDDER)
+    assert resumed.committed == {"cpu_1": "h1"}
+
+
+def test_commit_after_partial_line_is_kept(checkpoint):
+    checkpoint.commit({"cpu_1": "h1"})
+    with open(checkpoint.path, "a", encoding="utf-8") as f:
+        f.write('{"ids": {"cpu_2"')
+
+    resumed = _reopen(checkpoint)
+    assert resumed.pending(SOURCE, None, "100:1", EMBEDDER)
+    resumed.commit({"cpu_2": "h2"})
+
+    # 이어서 기록한 배치가 잘린 줄에 붙어 함께 버려지지 않아야 함
+    again = _reopen(checkpoint)
+    assert again.pending(SOURCE, None, "100:1", EMBEDDER)
+    assert again.committed == {"cpu_1": "h1", "cpu_2": "h2"}
+
+
+@pytest.mark.parametrize(
+    "source, tables, fingerprint, embedder",
+    [
+        ("dump:///other.sql", None, "100:1", EMBEDDER),
+        (SOURCE, ["cpu"], "100:1", EMBEDDER),
+        (SOURCE, None, "200:2", EMBEDDER),
+        (SOURCE, None, "100:1", {**EMBEDDER, "embedding_dimension": 32}),
+    ],
+)
+def test_different_input_or_embedder_does_not_resume(
+    checkpoint, source, tables, fingerprint, embedder
+):
+    checkpoint.commit({"cpu_1": "h1"})
+
+    other = _reopen(checkpoint)
+    assert not other.pending(source, tables, fingerprint, embedder)
+    assert not other.resumed
+    assert other.committed == {}
+
+
+def test_table_order_does_not_matter(tmp_path):
+    checkpoint = BuildCheckpoint("components", directory=tmp_path)
+    checkpoint.start(SOURCE, ["gpu", "cpu"], None, EMBEDDER)
+    assert _reopen(checkpoint).pending(SOURCE, ["cpu", "gpu"], None, EMBEDDER)
+
+
+def test_missing_or_corrupt_header_does_not_resume(tmp_path):
+    checkpoint = BuildCheckpoint("components", directory=tmp_path)
+    assert not checkpoint.pending(SOURCE)
+
+    checkpoint.path.write_text("{not json\n", encoding="utf-8")
+    assert not checkpoint.pending(SOURCE)
+
+
+def test_start_overwrites_and_clear_removes(checkpoint):
+    checkpoint.commit({"cpu_1": "h1"})
+    checkpoint.start(SOURCE, None, "100:1", EMBEDDER)
+    lines = checkpoint.path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["fingerprint"] == "100:1"
+
+    checkpoint.clear()
+    assert not checkpoint.path.exists()
+    checkpoint.clear()
+
+
+def test_content_hash_ignores_stored_hash_and_key_order():
+    metadata = {"name": "Ryzen 5 7600", "price": 250000}
+    digest = content_hash("text", metadata)
+    assert content_hash("text", {"price": 250000, "name": "Ryzen 5 7600"}) == digest
+    assert content_hash("text", {**metadata, CONTENT_HASH_KEY: "old"}) == digest
+    assert content_hash("other", metadata) != digest
+    assert content_hash("text", {**metadata, "price": 240000}) != digest
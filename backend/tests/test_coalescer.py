@@ -0,0 +1,141 @@
+"""
+EmbeddingCoalescer(쿼리 임베딩 마이크로 배칭) 테스트
+"""
+import asyncio
+import threading
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from backend.rag.coalescer import EmbeddingCoalescer
+
+
+class FakeEmbedder:
+    """텍스트마다 고유한 벡터를 돌려주고 받은 배치를 기록하는 embed_batch 대역"""
+
+    def __init__(self, fail: Optional[set] = None, error: Optional[Exception] = None):
+        self.fail = fail or set()
+        self.error = error
+        self.batches: List[List[str]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def vector(text: str) -> np.ndarray:
+        return np.array([float(sum(text.encode("utf-8"))), float(len(text))], dtype=np.float32)
+
+    def __call__(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        with self._lock:
+            self.batches.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return [None if text in self.fail else self.vector(text) for text in texts]
+
+
+def test_each_caller_gets_its_own_vector():
+    embedder = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(embedder, window_ms=200, max_batch=4)
+    texts = ["게이밍 CPU", "저전력 GPU", "미니 ITX 보드", "DDR5 램"]
+    try:
+        futures = [coalescer.submit(text) for text in texts]
+        for text, future in zip(texts, futures):
+            np.testing.assert_array_equal(future.result(timeout=2), FakeEmbedder.vector(text))
+    finally:
+        coalescer.close()
+
+    # max_batch개가 모이면 창이 끝나기 전에 한 번에 전송
+    assert embedder.batches == [texts]
+    assert coalescer.stats() == {"requests": 4, "batches": 1, "avg_batch_size": 4.0}
+
+
+def test_batches_are_split_at_max_batch():
+    embedder = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(embedder, window_ms=200, max_batch=2)
+    texts = [f"query {i}" for i in range(5)]
+    try:
+        futures = [coalescer.submit(text) for text in texts]
+        results = [future.result(timeout=2) for future in futures]
+    finally:
+        coalescer.close()
+
+    for text, result in zip(texts, results):
+        np.testing.assert_array_equal(result, FakeEmbedder.vector(text))
+    assert all(len(batch) <= 2 for batch in embedder.batches)
+    assert sorted(text for batch in embedder.batches for text in batch) == sorted(texts)
+
+
+def test_duplicate_queries_are_embedded_once():
+    embedder = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(embedder, window_ms=200, max_batch=3)
+    try:
+        futures = [coalescer.submit(text) for text in ["a", "b", "a"]]
+        results = [future.result(timeout=2) for future in futures]
+    finally:
+        coalescer.close()
+
+    assert embedder.batches == [["a", "b"]]
+    np.testing.assert_array_equal(results[0], results[2])
+
+
+def test_failed_text_fails_only_its_callers():
+    embedder = FakeEmbedder(fail={"bad"})
+    coalescer = EmbeddingCoalescer(embedder, window_ms=200, max_batch=3)
+    try:
+        good, bad, other = [coalescer.submit(text) for text in ["good", "bad", "other"]]
+        np.testing.assert_array_equal(good.result(timeout=2), FakeEmbedder.vector("good"))
+        np.testing.assert_array_equal(other.result(timeout=2), FakeEmbedder.vector("other"))
+        with pytest.raises(RuntimeError, match="쿼리 임베딩 실패"):
+            bad.result(timeout=2)
+    finally:
+        coalescer.close()
+
+
+def test_batch_error_is_delivered_to_every_caller():
+    error = ConnectionError("boom")
+    coalescer = EmbeddingCoalescer(FakeEmbedder(error=error), window_ms=200, max_batch=2)
+    try:
+        futures = [coalescer.submit(text) for text in ["a", "b"]]
+        for future in futures:
+            assert future.exception(timeout=2) is error
+    finally:
+        coalescer.close()
+
+
+def test_wrong_result_count_fails_every_caller():
+    coalescer = EmbeddingCoalescer(lambda texts: [], window_ms=200, max_batch=2)
+    try:
+        futures = [coalescer.submit(text) for text in ["a", "b"]]
+        for future in futures:
+            with pytest.raises(ValueError, match="임베딩 수가 요청 수와 다릅니다"):
+                future.result(timeout=2)
+    finally:
+        coalescer.close()
+
+
+def test_close_flushes_pending_requests():
+    embedder = FakeEmbedder()
+    # 창이 끝나기 전에 닫아도 남은 요청을 보내고 종료
+    coalescer = EmbeddingCoalescer(embedder, window_ms=10_000, max_batch=10)
+    future = coalescer.submit("late")
+    coalescer.close()
+    np.testing.assert_array_equal(future.result(timeout=2), FakeEmbedder.vector("late"))
+    with pytest.raises(RuntimeError):
+        coalescer.submit("after close")
+
+
+def test_asyncio_callers_get_results_in_order():
+    embedder = FakeEmbedder()
+    coalescer = EmbeddingCoalescer(embedder, window_ms=200, max_batch=3)
+    texts = ["x", "yy", "zzz"]
+
+    async def main():
+        return await asyncio.gather(
+            *(asyncio.wrap_future(coalescer.submit(text)) for text in texts)
+        )
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        coalescer.close()
+    for text, result in zip(texts, results):
+        np.testing.assert_array_equal(result, FakeEmbedder.vector(text))
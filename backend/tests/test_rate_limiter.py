@@ -0,0 +1,182 @@
+"""
+RateLimiter(토큰 버킷) / AdaptiveConcurrency(AIMD) 테스트
+"""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from backend.rag import rate_limiter
+from backend.rag.rate_limiter import AdaptiveConcurrency, RateLimiter
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대역 (sleep은 시각만 앞으로 이동)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(
+        rate_limiter, "time", SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep)
+    )
+    return fake
+
+
+def test_request_bucket_starts_full_and_refills(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=0)
+    for _ in range(60):
+        assert limiter._reserve(0) == 0.0
+
+    # 분당 60건이면 1초에 1건씩 다시 참
+    assert limiter._reserve(0) == pytest.approx(1.0)
+    clock.now += 0.5
+    assert limiter._reserve(0) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter._reserve(0) == 0.0
+
+
+def test_refill_is_capped_at_bucket_size(clock):
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=0)
+    clock.now += 3600
+    assert limiter._reserve(0) == 0.0
+    assert limiter._reserve(0) == 0.0
+    assert limiter._reserve(0) == pytest.approx(30.0)
+
+
+def test_token_wait_is_proportional_to_shortfall(clock):
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+    assert limiter._reserve(400) == 0.0
+
+    # 남은 200개로 500개 요청: 부족한 300개가 차는 데 300 * 60 / 600 = 30초
+    assert limiter._reserve(500) == pytest.approx(30.0)
+    assert limiter.waited_seconds == pytest.approx(30.0)
+
+
+def test_request_larger_than_bucket_waits_for_full_bucket(clock):
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=600)
+    assert limiter._reserve(10_000) == 0.0
+    assert limiter._reserve(10_000) == pytest.approx(60.0)
+
+
+def test_wait_is_the_larger_of_request_and_token_waits(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    limiter._request_allowance = 0.5
+    limiter._token_allowance = 0.0
+    # 요청 0.5초, 토큰 100개 10초 중 긴 쪽
+    assert limiter._reserve(100) == pytest.approx(10.0)
+
+
+def test_acquire_sleeps_then_deducts(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=0)
+    limiter._request_allowance = 0.0
+    limiter.acquire()
+    assert clock.slept == [pytest.approx(1.0)]
+    assert limiter._request_allowance == pytest.approx(0.0)
+
+
+def test_drain_empties_bucket(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=600)
+    limiter.drain()
+    assert limiter._reserve(0) == pytest.approx(1.0)
+
+
+def test_unlimited_limiter_never_waits(clock):
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=0)
+    for _ in range(1000):
+        assert limiter._reserve(10_000) == 0.0
+
+
+def _complete(concurrency: AdaptiveConcurrency, throttled: bool = False) -> None:
+    concurrency.acquire()
+    concurrency.release(throttled=throttled)
+
+
+def test_concurrency_starts_at_half_of_max():
+    assert AdaptiveConcurrency(8).limit == 4
+    assert AdaptiveConcurrency(5).limit == 3
+    assert AdaptiveConcurrency(8, initial=20).limit == 8
+
+
+def test_concurrency_halves_on_rate_limit_down_to_min():
+    concurrency = AdaptiveConcurrency(16, initial=16, min_limit=2)
+    _complete(concurrency, throttled=True)
+    assert concurrency.limit == 8
+    _complete(concurrency, throttled=True)
+    _complete(concurrency, throttled=True)
+    _complete(concurrency, throttled=True)
+    assert concurrency.limit == 2
+    assert concurrency.throttled == 4
+
+
+def test_concurrency_grows_by_one_after_limit_successes():
+    concurrency = AdaptiveConcurrency(4, initial=2)
+    _complete(concurrency)
+    assert concurrency.limit == 2
+    _complete(concurrency)
+    assert concurrency.limit == 3
+    for _ in range(3):
+        _complete(concurrency)
+    assert concurrency.limit == 4
+    for _ in range(10):
+        _complete(concurrency)
+    assert concurrency.limit == 4
+
+
+def test_rate_limit_resets_success_streak():
+    concurrency = AdaptiveConcurrency(8, initial=4)
+    for _ in range(3):
+        _complete(concurrency)
+    _complete(concurrency, throttled=True)
+    assert concurrency.limit == 2
+    _complete(concurrency)
+    assert concurrency.limit == 2
+
+
+def test_acquire_blocks_until_slot_released():
+    concurrency = AdaptiveConcurrency(1)
+    concurrency.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        concurrency.acquire()
+        acquired.set()
+        concurrency.release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+    concurrency.release()
+    assert acquired.wait(1.0)
+    thread.join()
+    assert concurrency.in_flight == 0
+
+
+def test_async_acquire_shares_slots_with_threads():
+    concurrency = AdaptiveConcurrency(1)
+    concurrency.acquire()
+
+    async def main():
+        waiter = asyncio.ensure_future(concurrency.acquire_async())
+        await asyncio.sleep(0.02)
+        assert not waiter.done()
+        # 다른 스레드에서 반환해도 이벤트 루프의 대기자가 깨어남
+        threading.Thread(target=concurrency.release).start()
+        await asyncio.wait_for(waiter, 1.0)
+        assert concurrency.in_flight == 1
+        concurrency.release()
+
+    asyncio.run(main())
+    assert concurrency.in_flight == 0